@@ -0,0 +1,47 @@
+"""Add item list filter, sort and search indexes
+
+Revision ID: 20250104120000
+Revises: 20250103120000
+Create Date: 2025-01-04 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20250104120000'
+down_revision: Union[str, None] = '20250103120000'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Trigram indexes serve ILIKE '%q%' and 'q%' on part_number/name
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # Composite indexes: filter or sort within a project
+    op.create_index('idx_items_project_status', 'items', ['project_id', 'status'])
+    op.create_index('idx_items_project_progress', 'items', ['project_id', 'current_progress'])
+    op.create_index('idx_items_project_updated_at', 'items', ['project_id', 'updated_at'])
+    op.create_index('idx_items_project_name', 'items', ['project_id', 'name'])
+    op.create_index('idx_items_project_part_number', 'items', ['project_id', 'part_number'])
+
+    op.execute('CREATE INDEX idx_items_part_number_trgm ON items USING gin (part_number gin_trgm_ops)')
+    op.execute('CREATE INDEX idx_items_name_trgm ON items USING gin (name gin_trgm_ops)')
+
+    # has_documents: EXISTS over live documents of an item
+    op.execute('CREATE INDEX idx_documents_item_live ON documents(item_id) WHERE (is_deleted = false)')
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS idx_documents_item_live')
+    op.execute('DROP INDEX IF EXISTS idx_items_name_trgm')
+    op.execute('DROP INDEX IF EXISTS idx_items_part_number_trgm')
+    op.drop_index('idx_items_project_part_number', table_name='items')
+    op.drop_index('idx_items_project_name', table_name='items')
+    op.drop_index('idx_items_project_updated_at', table_name='items')
+    op.drop_index('idx_items_project_progress', table_name='items')
+    op.drop_index('idx_items_project_status', table_name='items')
+    # pg_trgm is left installed: other objects may depend on it
@@ -0,0 +1,64 @@
+"""Add search vectors and trigram indexes for global search
+
+Revision ID: 20250105120000
+Revises: 20250104120000
+Create Date: 2025-01-05 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20250105120000'
+down_revision: Union[str, None] = '20250104120000'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _vector(column: str, config: str, weight: str) -> str:
+    return f"setweight(to_tsvector('{config}', translate(lower(coalesce({column}, '')), 'ё', 'е')), '{weight}')"
+
+
+# Generated stored columns: Postgres recomputes them on every INSERT/UPDATE
+SEARCH_VECTORS = {
+    'items': _vector('part_number', 'simple', 'A') + ' || ' + _vector('name', 'russian', 'B'),
+    'documents': _vector('title', 'russian', 'A'),
+    'document_revisions': _vector('original_filename', 'simple', 'A'),
+    'tech_documents': _vector('filename', 'simple', 'A'),
+}
+
+SEARCH_VECTOR_INDEXES = {
+    'items': 'idx_items_search_vector',
+    'documents': 'idx_documents_search_vector',
+    'document_revisions': 'idx_revisions_search_vector',
+    'tech_documents': 'idx_tech_documents_search_vector',
+}
+
+# items.part_number and items.name already have trigram indexes (20250104120000)
+TRIGRAM_INDEXES = {
+    'idx_documents_title_trgm': ('documents', 'title'),
+    'idx_revisions_original_filename_trgm': ('document_revisions', 'original_filename'),
+    'idx_tech_documents_filename_trgm': ('tech_documents', 'filename'),
+}
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    for table, expression in SEARCH_VECTORS.items():
+        op.execute(f'ALTER TABLE {table} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({expression}) STORED')
+        op.execute(f'CREATE INDEX {SEARCH_VECTOR_INDEXES[table]} ON {table} USING gin (search_vector)')
+
+    for index, (table, column) in TRIGRAM_INDEXES.items():
+        op.execute(f'CREATE INDEX {index} ON {table} USING gin ({column} gin_trgm_ops)')
+
+
+def downgrade() -> None:
+    for index in TRIGRAM_INDEXES:
+        op.execute(f'DROP INDEX IF EXISTS {index}')
+
+    for table, index in SEARCH_VECTOR_INDEXES.items():
+        op.execute(f'DROP INDEX IF EXISTS {index}')
+        op.drop_column(table, 'search_vector')
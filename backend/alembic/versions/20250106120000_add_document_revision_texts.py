@@ -0,0 +1,43 @@
+"""Add document revision texts for PDF content search
+
+Revision ID: 20250106120000
+Revises: 20250105120000
+Create Date: 2025-01-06 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '20250106120000'
+down_revision: Union[str, None] = '20250105120000'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Text layer of revision PDFs, filled by the background extractor;
+    # existing revisions are picked up by its startup backfill
+    op.create_table(
+        'document_revision_texts',
+        sa.Column('revision_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('document_revisions.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('page_count', sa.Integer(), nullable=True),
+        sa.Column('content', sa.Text(), nullable=False, server_default=''),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('extracted_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('NOW()')),
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed("setweight(to_tsvector('russian', translate(lower(coalesce(content, '')), 'ё', 'е')), 'A')", persisted=True),
+        ),
+    )
+    op.execute('CREATE INDEX idx_revision_texts_search_vector ON document_revision_texts USING gin (search_vector)')
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS idx_revision_texts_search_vector')
+    op.drop_table('document_revision_texts')
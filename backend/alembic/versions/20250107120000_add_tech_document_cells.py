@@ -0,0 +1,61 @@
+"""Add tech document cell index for workbook content search
+
+Revision ID: 20250107120000
+Revises: 20250106120000
+Create Date: 2025-01-07 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '20250107120000'
+down_revision: Union[str, None] = '20250106120000'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Indexing state per document version; sha256 lets unchanged workbooks reuse cells
+    op.create_table(
+        'tech_document_indexes',
+        sa.Column('document_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('tech_documents.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('version', sa.Integer(), primary_key=True),
+        sa.Column('sha256', sa.String(64), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('cell_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('indexed_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('NOW()')),
+    )
+    op.create_index('idx_tech_indexes_sha256', 'tech_document_indexes', ['sha256'])
+
+    op.create_table(
+        'tech_document_cells',
+        sa.Column('id', sa.BigInteger(), sa.Identity(), primary_key=True),
+        sa.Column('document_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('tech_documents.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('sheet', sa.String(255), nullable=False),
+        sa.Column('row_number', sa.Integer(), nullable=False),
+        sa.Column('column_number', sa.Integer(), nullable=False),
+        sa.Column('value', sa.Text(), nullable=False),
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed("setweight(to_tsvector('russian', translate(lower(coalesce(value, '')), 'ё', 'е')), 'A')", persisted=True),
+        ),
+    )
+    op.create_index('idx_tech_cells_document_version', 'tech_document_cells', ['document_id', 'version'])
+    op.execute('CREATE INDEX idx_tech_cells_search_vector ON tech_document_cells USING gin (search_vector)')
+    op.execute('CREATE INDEX idx_tech_cells_value_trgm ON tech_document_cells USING gin (value gin_trgm_ops)')
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS idx_tech_cells_value_trgm')
+    op.execute('DROP INDEX IF EXISTS idx_tech_cells_search_vector')
+    op.drop_index('idx_tech_cells_document_version', table_name='tech_document_cells')
+    op.drop_table('tech_document_cells')
+    op.drop_index('idx_tech_indexes_sha256', table_name='tech_document_indexes')
+    op.drop_table('tech_document_indexes')
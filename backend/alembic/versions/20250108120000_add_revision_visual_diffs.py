@@ -0,0 +1,39 @@
+"""Add revision visual diffs
+
+Revision ID: 20250108120000
+Revises: 20250107120000
+Create Date: 2025-01-08 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '20250108120000'
+down_revision: Union[str, None] = '20250107120000'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Page overlays of revision pairs, rendered by the background renderer;
+    # tiles are stored under FILE_STORAGE_PATH/visual_diffs
+    op.create_table(
+        'revision_visual_diffs',
+        sa.Column('from_revision_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('document_revisions.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('to_revision_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('document_revisions.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('page_count', sa.Integer(), nullable=True),
+        sa.Column('pages', postgresql.JSONB(), nullable=False, server_default='[]'),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('rendered_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('NOW()')),
+    )
+    op.create_index('idx_revision_visual_diffs_to', 'revision_visual_diffs', ['to_revision_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_revision_visual_diffs_to', table_name='revision_visual_diffs')
+    op.drop_table('revision_visual_diffs')
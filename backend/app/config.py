@@ -13,6 +13,47 @@ class Settings(BaseSettings):
     DB_POOL_TIMEOUT: int = 30
     DB_CONNECT_TIMEOUT: int = 5
     DB_ECHO_POOL: bool = False
+    DB_ASYNC_URL: Optional[str] = None  # default: DATABASE_URL with the asyncpg driver
+    
+    # SQL budgets per request (exceeding requests are logged with SQL fingerprints)
+    SQL_STATEMENT_BUDGET: int = 50
+    SQL_TIME_BUDGET_MS: int = 500
+    
+    # Tracing: "none", "memory" (GET /metrics/traces) or "file" (JSON lines at TRACING_FILE_PATH)
+    TRACING_EXPORTER: str = "none"
+    TRACING_FILE_PATH: Optional[str] = None
+    TRACING_MAX_SPANS: int = 10000
+    
+    # Response cache for projects/sections/users: "memory" (per worker), "redis" (shared) or "none"
+    CACHE_BACKEND: str = "memory"
+    CACHE_REDIS_URL: Optional[str] = None
+    CACHE_TTL_SECONDS: int = 60
+    PROJECT_SUMMARY_CACHE_TTL_SECONDS: int = 30  # 0 disables caching of /api/projects/summary
+    
+    # Response compression (JSON/text only, never PDF/xlsx downloads); "br" and "zstd"
+    # are used when the brotli / zstandard packages are installed
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_ALGORITHMS: list[str] = ["br", "zstd", "gzip"]
+    
+    # Background text extraction from uploaded files for content search
+    TEXT_EXTRACTION_ENABLED: bool = True
+    TEXT_EXTRACTION_WORKERS: int = 2  # worker processes per app process
+    TEXT_EXTRACTION_TIMEOUT_SECONDS: int = 60
+    PDF_TEXT_MAX_PAGES: int = 200
+    PDF_TEXT_MAX_CHARS: int = 500000
+    EXCEL_INDEX_MAX_CELLS: int = 200000  # per workbook version
+    
+    # Background visual diff between consecutive PDF revisions
+    VISUAL_DIFF_ENABLED: bool = True
+    VISUAL_DIFF_WORKERS: int = 1  # renderer processes per app process
+    VISUAL_DIFF_TIMEOUT_SECONDS: int = 300
+    VISUAL_DIFF_MEMORY_LIMIT_MB: int = 1536  # address space cap of a renderer process
+    VISUAL_DIFF_DPI: int = 100
+    VISUAL_DIFF_MAX_PAGES: int = 50
+    
+    # Debug mode: exposes X-DB-Statements / X-DB-Time-Ms response headers
+    DEBUG: bool = False
     
     # Security
     SECRET_KEY: str = "your-secret-key-change-in-production"
@@ -1,17 +1,28 @@
 import logging
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.exc import OperationalError, DBAPIError
 from sqlalchemy.orm import sessionmaker
 
 from app.config import settings
+from app.utils.db_pool_metrics import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    async_pool_metrics,
+    instrument_engine,
+    sync_pool_metrics,
+)
+from app.utils.sql_metrics import instrument_statements
 
 logger = logging.getLogger(__name__)
 
 engine = create_engine(
     settings.DATABASE_URL,
     connect_args={"connect_timeout": settings.DB_CONNECT_TIMEOUT},
+    poolclass=InstrumentedQueuePool,
     pool_size=settings.DB_POOL_SIZE,
     max_overflow=settings.DB_MAX_OVERFLOW,
     pool_pre_ping=settings.DB_POOL_PRE_PING,
@@ -19,11 +30,36 @@ engine = create_engine(
     pool_timeout=settings.DB_POOL_TIMEOUT,
     echo_pool=settings.DB_ECHO_POOL,
 )
+instrument_engine(engine, sync_pool_metrics)
+instrument_statements(engine)
 logger.info(
     f"Database engine created with pool_size={settings.DB_POOL_SIZE}, max_overflow={settings.DB_MAX_OVERFLOW}"
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def async_database_url(url: str) -> str:
+    """Convert a sync PostgreSQL URL (psycopg2) into its asyncpg equivalent."""
+    return make_url(url).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+
+# Async engine for I/O-bound read endpoints: they run on the event loop instead of
+# the 40-thread default threadpool used for sync `def` routes.
+async_engine = create_async_engine(
+    settings.DB_ASYNC_URL or async_database_url(settings.DATABASE_URL),
+    connect_args={"timeout": settings.DB_CONNECT_TIMEOUT},
+    poolclass=InstrumentedAsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    echo_pool=settings.DB_ECHO_POOL,
+)
+instrument_engine(async_engine.sync_engine, async_pool_metrics)
+instrument_statements(async_engine.sync_engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 
@@ -41,3 +77,16 @@ def get_db():
         db.close()
         logger.debug("Database session closed")
 
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except OperationalError:
+            logger.error("Database connection error", exc_info=True)
+            raise
+        except DBAPIError:
+            logger.error("Database API error", exc_info=True)
+            raise
+        finally:
+            logger.debug("Async database session closed")
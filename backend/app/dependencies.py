@@ -1,13 +1,16 @@
 import json
 import logging
-from typing import List
+from typing import List, Optional
+from uuid import UUID
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from jose import JWTError
 
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.models.user import User
 from app.utils.security import decode_token
 
@@ -19,18 +22,16 @@ def _log(event: str, level: int = logging.INFO, **data) -> None:
     logger.log(level, "event=%s data=%s", event, json.dumps(data, ensure_ascii=False, default=str))
 
 
-def get_current_user(
-    request: Request,
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
-) -> User:
-    """Get current authenticated user from JWT token."""
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
+
+
+def _user_id_from_token(request: Request, token: str) -> str:
+    """Decode JWT and return the `sub` claim, raising 401 on any token problem."""
     try:
         payload = decode_token(token)
         user_id: str = payload.get("sub")
@@ -42,7 +43,7 @@ def get_current_user(
                 path=request.url.path,
                 client_host=getattr(request.client, "host", None),
             )
-            raise credentials_exception
+            raise _credentials_exception()
     except JWTError as exc:
         _log(
             "auth.token.invalid",
@@ -52,9 +53,12 @@ def get_current_user(
             path=request.url.path,
             client_host=getattr(request.client, "host", None),
         )
-        raise credentials_exception
-    
-    user = db.query(User).filter(User.id == user_id).first()
+        raise _credentials_exception()
+    return user_id
+
+
+def _ensure_active_user(request: Request, user_id: str, user: Optional[User]) -> User:
+    """Reject tokens of unknown or deactivated users."""
     if user is None:
         _log(
             "auth.token.invalid",
@@ -64,7 +68,7 @@ def get_current_user(
             path=request.url.path,
             client_host=getattr(request.client, "host", None),
         )
-        raise credentials_exception
+        raise _credentials_exception()
     
     if not user.is_active:
         _log(
@@ -83,6 +87,40 @@ def get_current_user(
     return user
 
 
+def get_current_user(
+    request: Request,
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> User:
+    """Get current authenticated user from JWT token."""
+    user_id = _user_id_from_token(request, token)
+    user = db.query(User).filter(User.id == user_id).first()
+    return _ensure_active_user(request, user_id, user)
+
+
+async def get_current_user_async(
+    request: Request,
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    """Async variant of get_current_user for routes served by the async engine."""
+    user_id = _user_id_from_token(request, token)
+    try:
+        user_uuid = UUID(str(user_id))
+    except ValueError:
+        _log(
+            "auth.token.invalid",
+            level=logging.WARNING,
+            reason="invalid_sub",
+            user_id=user_id,
+            path=request.url.path,
+            client_host=getattr(request.client, "host", None),
+        )
+        raise _credentials_exception()
+    user = (await db.execute(select(User).where(User.id == user_uuid))).scalar_one_or_none()
+    return _ensure_active_user(request, user_id, user)
+
+
 def require_role(allowed_roles: List[str]):
     """Dependency factory for role-based access control."""
     def dependency(current_user: User = Depends(get_current_user)):
@@ -1,13 +1,24 @@
 import logging
+import os
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
 
 from app.config import settings
-from app.database import engine
-from app.routers import auth, users, projects, items, documents, notifications, audit, tech_documents
+from app.database import engine, async_engine
+from app.routers import auth, users, projects, items, documents, notifications, audit, tech_documents, metrics, search
 from app.middleware.audit_middleware import AuditMiddleware
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.metrics import PrometheusMiddleware
+from app.middleware.query_budget import QueryBudgetMiddleware
+from app.middleware.request_context import RequestContextMiddleware
+from app.middleware.tracing import TracingMiddleware
+from app.services.pdf_text_service import pdf_text_extractor
+from app.services.tech_document_index_service import excel_cell_indexer
+from app.services.visual_diff_service import visual_diff_renderer
+from app.utils.metrics import mark_worker_dead
+from app.utils.tracing import build_exporter, configure_tracing
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +28,14 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Response compression (innermost: metrics and logs see the bytes on the wire)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        algorithms=settings.COMPRESSION_ALGORITHMS,
+    )
+
 # Audit middleware (must be added before CORS)
 app.add_middleware(AuditMiddleware)
 
@@ -29,6 +48,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Prometheus metrics per route template
+app.add_middleware(PrometheusMiddleware, routes=app.routes)
+
+# SQL statement count / DB time budgets per request
+app.add_middleware(
+    QueryBudgetMiddleware,
+    statement_budget=settings.SQL_STATEMENT_BUDGET,
+    time_budget_ms=settings.SQL_TIME_BUDGET_MS,
+    expose_headers=settings.DEBUG,
+)
+
+# Request id and root tracing span
+configure_tracing(build_exporter(settings.TRACING_EXPORTER, settings.TRACING_FILE_PATH, settings.TRACING_MAX_SPANS))
+app.add_middleware(TracingMiddleware)
+
+# Request context (outermost): lets DB instrumentation attribute work to the route
+app.add_middleware(RequestContextMiddleware)
+
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
 app.include_router(users.router, prefix="/api/users", tags=["users"])
@@ -36,8 +73,10 @@ app.include_router(projects.router, prefix="/api/projects", tags=["projects"])
 app.include_router(items.router, prefix="/api/items", tags=["items"])
 app.include_router(documents.router, prefix="/api/documents", tags=["documents"])
 app.include_router(tech_documents.router, prefix="/api/tech", tags=["tech"])
+app.include_router(search.router, prefix="/api/search", tags=["search"])
 app.include_router(notifications.router, prefix="/api/v1/notifications", tags=["notifications"])
 app.include_router(audit.router, prefix="/api/audit", tags=["audit"])
+app.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
 
 
 @app.on_event("startup")
@@ -51,6 +90,35 @@ async def startup_db_healthcheck():
         raise
 
 
+@app.on_event("startup")
+async def start_text_extraction():
+    pdf_text_extractor.start()
+    excel_cell_indexer.start()
+    visual_diff_renderer.start()
+
+
+@app.on_event("shutdown")
+async def stop_text_extraction():
+    pdf_text_extractor.stop()
+    excel_cell_indexer.stop()
+    visual_diff_renderer.stop()
+
+
+@app.on_event("shutdown")
+async def dispose_async_engine():
+    await async_engine.dispose()
+
+
+@app.on_event("shutdown")
+async def shutdown_tracing():
+    configure_tracing(None)
+
+
+@app.on_event("shutdown")
+async def release_worker_metrics():
+    mark_worker_dead(os.getpid())
+
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
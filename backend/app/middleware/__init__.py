@@ -1,5 +1,18 @@
 from app.middleware.audit_middleware import AuditMiddleware
+from app.middleware.compression import CompressionMiddleware
 from app.middleware.error_handler import error_handler
+from app.middleware.metrics import PrometheusMiddleware
+from app.middleware.query_budget import QueryBudgetMiddleware
+from app.middleware.request_context import RequestContextMiddleware
+from app.middleware.tracing import TracingMiddleware
 
-__all__ = ["AuditMiddleware", "error_handler"]
+__all__ = [
+    "AuditMiddleware",
+    "CompressionMiddleware",
+    "error_handler",
+    "PrometheusMiddleware",
+    "QueryBudgetMiddleware",
+    "RequestContextMiddleware",
+    "TracingMiddleware",
+]
 
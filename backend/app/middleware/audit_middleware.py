@@ -1,33 +1,39 @@
 from typing import Optional
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-
-
-class AuditMiddleware(BaseHTTPMiddleware):
-    """Middleware to capture IP address for audit logging."""
-    
-    async def dispatch(self, request: Request, call_next):
-        # Extract IP address
-        ip_address = self._get_client_ip(request)
-        
-        # Store in request state for access in route handlers
-        request.state.ip = ip_address
-        
-        response = await call_next(request)
-        return response
-    
-    def _get_client_ip(self, request: Request) -> Optional[str]:
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class AuditMiddleware:
+    """Pure ASGI middleware to capture IP address for audit logging.
+
+    The IP is stored in scope["state"], which backs `request.state`, so route
+    handlers keep reading `request.state.ip`. Request and response bodies pass
+    through untouched (no buffering, no extra task per request).
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            # Store in request state for access in route handlers
+            scope.setdefault("state", {})["ip"] = self._get_client_ip(scope)
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def _get_client_ip(scope: Scope) -> Optional[str]:
         """Get client IP from X-Forwarded-For header or request client."""
         # Check X-Forwarded-For header first (for proxied requests)
-        forwarded_for = request.headers.get("X-Forwarded-For")
+        forwarded_for = Headers(scope=scope).get("X-Forwarded-For")
         if forwarded_for:
             # Get the first IP in the list (original client)
             return forwarded_for.split(",")[0].strip()
-        
+
         # Fall back to direct client IP
-        if request.client:
-            return request.client.host
-        
-        return None
+        client = scope.get("client")
+        if client:
+            return client[0]
 
+        return None
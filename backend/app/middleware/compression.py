@@ -0,0 +1,212 @@
+import zlib
+from typing import Callable, Dict, Iterable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:  # optional: pip install brotli
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+try:  # optional: pip install zstandard
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+
+# Compressed only when the response Content-Type starts with one of these;
+# PDFs, xlsx, ZIP archives and images are already compressed and pass through.
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "text/",
+    "image/svg+xml",
+)
+
+
+class _GzipEncoder:
+    def __init__(self):
+        self._compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliEncoder:
+    def __init__(self):
+        # Quality 4: close to gzip -6 speed with a noticeably better ratio on JSON
+        self._compressor = brotli.Compressor(quality=4)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdEncoder:
+    def __init__(self):
+        self._compressor = zstandard.ZstdCompressor(level=3).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+
+def available_encoders() -> Dict[str, Callable]:
+    """Content-coding -> encoder factory for the codecs installed in this environment."""
+    encoders: Dict[str, Callable] = {"gzip": _GzipEncoder}
+    if brotli is not None:
+        encoders["br"] = _BrotliEncoder
+    if zstandard is not None:
+        encoders["zstd"] = _ZstdEncoder
+    return encoders
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Accept-Encoding -> {coding: q}; malformed q-values count as 0."""
+    accepted: Dict[str, float] = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+class CompressionMiddleware:
+    """Pure ASGI response compression negotiated from Accept-Encoding.
+
+    The first coding of `algorithms` (server preference) that the client
+    accepts and that is installed wins. Only compressible content types are
+    touched; responses smaller than `minimum_size`, already encoded
+    responses and bodiless statuses pass through unchanged. Streaming
+    responses are compressed chunk by chunk without buffering the body.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        algorithms: Iterable[str] = ("br", "zstd", "gzip"),
+        encoders: Optional[Dict[str, Callable]] = None,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        encoders = encoders if encoders is not None else available_encoders()
+        self.encoders = {name: encoders[name] for name in algorithms if name in encoders}
+
+    def choose_encoding(self, accept_encoding: str) -> Optional[str]:
+        accepted = parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get("*", 0.0)
+        for name in self.encoders:
+            if accepted.get(name, wildcard) > 0:
+                return name
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.encoders:
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self.choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressingResponder(self.app, encoding, self.encoders[encoding], self.minimum_size)
+        await responder(scope, receive, send)
+
+
+class _CompressingResponder:
+    def __init__(self, app: ASGIApp, encoding: str, encoder_factory: Callable, minimum_size: int):
+        self.app = app
+        self.encoding = encoding
+        self.encoder_factory = encoder_factory
+        self.minimum_size = minimum_size
+        self.send: Send = None
+        self.start_message: Optional[Message] = None
+        self.encoder = None
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # Hold the start message until the first body chunk decides the encoding
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                message["status"] < 200
+                or message["status"] in (204, 304)
+                or "content-encoding" in headers
+                or not headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+            )
+            if not self.passthrough:
+                MutableHeaders(scope=message).add_vary_header("Accept-Encoding")
+            return
+
+        if message_type != "http.response.body":
+            await self.send(message)
+            return
+
+        if self.start_message is not None:
+            start_message, self.start_message = self.start_message, None
+            await self._start(start_message, message)
+            return
+
+        if self.encoder is None:
+            await self.send(message)
+            return
+
+        body = self.encoder.compress(message.get("body", b""))
+        more_body = message.get("more_body", False)
+        if not more_body:
+            body += self.encoder.flush()
+        if body or not more_body:
+            await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    async def _start(self, start_message: Message, message: Message) -> None:
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.passthrough or (not more_body and len(body) < self.minimum_size):
+            await self.send(start_message)
+            await self.send(message)
+            return
+
+        self.encoder = self.encoder_factory()
+        headers = MutableHeaders(scope=start_message)
+        headers["Content-Encoding"] = self.encoding
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            # The encoded body is a different representation: a strong validator must change
+            headers["ETag"] = f"W/{etag}"
+
+        compressed = self.encoder.compress(body)
+        if more_body:
+            del headers["Content-Length"]
+        else:
+            compressed += self.encoder.flush()
+            headers["Content-Length"] = str(len(compressed))
+
+        await self.send(start_message)
+        await self.send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+
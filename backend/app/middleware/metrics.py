@@ -0,0 +1,82 @@
+import time
+from typing import Sequence
+
+from starlette.routing import BaseRoute, Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.metrics import (
+    HTTP_REQUESTS,
+    HTTP_REQUEST_BYTES,
+    HTTP_REQUEST_DB_STATEMENTS,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_PROGRESS,
+    HTTP_RESPONSE_BYTES,
+)
+from app.utils.request_context import get_request_context
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class PrometheusMiddleware:
+    """Pure ASGI middleware recording per-route request count, latency, in-flight and body bytes.
+
+    Labels use the route template ("/api/items/{item_id}"), never the raw path,
+    so label cardinality stays bounded by the number of routes.
+    """
+
+    def __init__(self, app: ASGIApp, routes: Sequence[BaseRoute]):
+        self.app = app
+        self.routes = routes
+
+    def _route_template(self, scope: Scope) -> str:
+        partial = None
+        for route in self.routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return route.path
+            if match == Match.PARTIAL and partial is None:
+                partial = route.path
+        return partial or UNMATCHED_ROUTE
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route = self._route_template(scope)
+        status_code = 500
+        request_bytes = 0
+        response_bytes = 0
+
+        async def receive_wrapper() -> Message:
+            nonlocal request_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                request_bytes += len(message.get("body", b""))
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_bytes
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method, route)
+        in_progress.inc()
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            HTTP_REQUEST_DURATION.labels(method, route).observe(time.perf_counter() - started_at)
+            HTTP_REQUESTS.labels(method, route, str(status_code)).inc()
+            in_progress.dec()
+            if request_bytes:
+                HTTP_REQUEST_BYTES.labels(method, route).inc(request_bytes)
+            if response_bytes:
+                HTTP_RESPONSE_BYTES.labels(method, route).inc(response_bytes)
+            request_context = get_request_context()
+            if request_context is not None:
+                HTTP_REQUEST_DB_STATEMENTS.labels(method, route).observe(request_context.db_statements)
@@ -0,0 +1,62 @@
+import json
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.request_context import get_request_context
+from app.utils.sql_metrics import top_fingerprints
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetMiddleware:
+    """Report per-request SQL statement count and DB time.
+
+    Adds X-DB-Statements / X-DB-Time-Ms response headers when `expose_headers`
+    is set (debug mode) and logs requests exceeding the statement-count or
+    DB-time budget together with their SQL fingerprints, so N+1 patterns show
+    up in logs before users notice them.
+    """
+
+    def __init__(self, app: ASGIApp, statement_budget: int, time_budget_ms: float, expose_headers: bool = False):
+        self.app = app
+        self.statement_budget = statement_budget
+        self.time_budget_ms = time_budget_ms
+        self.expose_headers = expose_headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        context = get_request_context() if scope["type"] == "http" else None
+        if context is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-DB-Statements"] = str(context.db_statements)
+                headers["X-DB-Time-Ms"] = f"{context.db_time_ms:.1f}"
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers if self.expose_headers else send)
+        finally:
+            if context.db_statements > self.statement_budget or context.db_time_ms > self.time_budget_ms:
+                logger.warning(
+                    "event=%s data=%s",
+                    "db.request_budget_exceeded",
+                    json.dumps(
+                        {
+                            "route": context.route,
+                            "path": scope.get("path"),
+                            "statements": context.db_statements,
+                            "db_ms": round(context.db_time_ms, 2),
+                            "total_ms": round((time.perf_counter() - context.started_at) * 1000, 2),
+                            "statement_budget": self.statement_budget,
+                            "time_budget_ms": self.time_budget_ms,
+                            "fingerprints": top_fingerprints(context),
+                        },
+                        ensure_ascii=False,
+                    ),
+                )
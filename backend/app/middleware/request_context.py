@@ -0,0 +1,21 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.utils.request_context import RequestContext, bind_request_context, reset_request_context
+
+
+class RequestContextMiddleware:
+    """Pure ASGI middleware binding a RequestContext for the duration of each HTTP request."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = bind_request_context(RequestContext(scope))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            reset_request_context(token)
@@ -0,0 +1,73 @@
+import re
+import uuid
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.request_context import get_request_context
+from app.utils.tracing import SPAN_KIND_SERVER, get_exporter, parse_traceparent, start_span
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# Client-supplied request ids are echoed back and logged: keep them short and printable
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._:-]{1,128}$")
+
+
+class TracingMiddleware:
+    """Pure ASGI middleware assigning a request id and opening the root span of each request.
+
+    The request id comes from X-Request-ID (or is generated), is stored on the
+    RequestContext and returned in the X-Request-ID response header; every span
+    of the request carries it as `request.id`.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        request_id = headers.get(REQUEST_ID_HEADER)
+        if not request_id or not _VALID_REQUEST_ID.match(request_id):
+            request_id = uuid.uuid4().hex
+
+        context = get_request_context()
+        if context is not None:
+            context.request_id = request_id
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+                if span is not None:
+                    span.set_attribute("http.response.status_code", message["status"])
+            await send(message)
+
+        if get_exporter() is None:
+            span = None
+            await self.app(scope, receive, send_with_request_id)
+            return
+
+        trace_id, parent_span_id = parse_traceparent(headers.get("traceparent")) or (None, None)
+        with start_span(
+            f"{scope['method']} {scope['path']}",
+            attributes={
+                "request.id": request_id,
+                "http.request.method": scope["method"],
+                "url.path": scope["path"],
+            },
+            kind=SPAN_KIND_SERVER,
+            trace_id=trace_id,
+            parent_span_id=parent_span_id,
+        ) as span:
+            try:
+                await self.app(scope, receive, send_with_request_id)
+            finally:
+                if context is not None:
+                    # Low-cardinality name once routing has resolved the template
+                    span.name = context.route
+                    span.set_attribute("http.route", context.route)
+                    span.set_attribute("db.statements", context.db_statements)
+                    span.set_attribute("db.time_ms", round(context.db_time_ms, 3))
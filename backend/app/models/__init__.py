@@ -4,8 +4,12 @@ from app.models.project_section import ProjectSection
 from app.models.item import Item
 from app.models.document import Document
 from app.models.document_revision import DocumentRevision
+from app.models.document_revision_text import DocumentRevisionText
+from app.models.revision_visual_diff import RevisionVisualDiff
 from app.models.tech_document import TechDocument
 from app.models.tech_document_version import TechDocumentVersion
+from app.models.tech_document_index import TechDocumentIndex
+from app.models.tech_document_cell import TechDocumentCell
 from app.models.audit_log import AuditLog
 from app.models.notification import Notification
 from app.models.progress_history import ProgressHistory
@@ -17,8 +21,12 @@ __all__ = [
     "Item",
     "Document",
     "DocumentRevision",
+    "DocumentRevisionText",
+    "RevisionVisualDiff",
     "TechDocument",
     "TechDocumentVersion",
+    "TechDocumentIndex",
+    "TechDocumentCell",
     "AuditLog",
     "Notification",
     "ProgressHistory",
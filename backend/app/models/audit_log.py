@@ -2,6 +2,7 @@ from datetime import datetime
 
 from sqlalchemy import Column, BigInteger, String, ForeignKey, DateTime
 from sqlalchemy.dialects.postgresql import UUID, INET, JSONB
+from sqlalchemy.orm import relationship
 
 from app.database import Base
 
@@ -16,3 +17,6 @@ class AuditLog(Base):
     ip_address = Column(INET, nullable=True)
     payload = Column(JSONB, nullable=False)
 
+    # Relationships
+    user = relationship("User")
+
@@ -1,11 +1,12 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, String, BigInteger, Boolean, Text, ForeignKey, DateTime
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, BigInteger, Boolean, Text, ForeignKey, DateTime, Computed, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 
 from app.database import Base
+from app.utils.search import CODE_CONFIG, search_vector_sql
 
 
 class DocumentRevision(Base):
@@ -23,6 +24,13 @@ class DocumentRevision(Base):
     change_note = Column(Text, nullable=True)
     author_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="RESTRICT"), nullable=False)
     uploaded_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    search_vector = deferred(Column(
+        TSVECTOR, Computed(search_vector_sql(("original_filename", CODE_CONFIG, "A")), persisted=True)
+    ))
+
+    __table_args__ = (
+        Index("idx_revisions_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     # Relationships
     document = relationship("Document", back_populates="revisions")
@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from sqlalchemy import Column, String, Integer, Text, ForeignKey, DateTime, Computed, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
+
+from app.database import Base
+from app.utils.search import TEXT_CONFIG, search_vector_sql
+
+
+class DocumentRevisionText(Base):
+    """Text layer of a revision PDF, filled in the background after upload."""
+    __tablename__ = "document_revision_texts"
+
+    revision_id = Column(UUID(as_uuid=True), ForeignKey("document_revisions.id", ondelete="CASCADE"), primary_key=True)
+    status = Column(String(20), nullable=False)  # done, failed, timeout
+    page_count = Column(Integer, nullable=True)
+    content = deferred(Column(Text, nullable=False, default=""))
+    error = Column(Text, nullable=True)
+    extracted_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    search_vector = deferred(Column(TSVECTOR, Computed(search_vector_sql(("content", TEXT_CONFIG, "A")), persisted=True)))
+
+    __table_args__ = (
+        Index("idx_revision_texts_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
+    # Relationships
+    revision = relationship("DocumentRevision")
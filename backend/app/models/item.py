@@ -2,11 +2,12 @@ import uuid
 from datetime import datetime
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, String, Integer, ForeignKey, Enum, DateTime, CheckConstraint, Index
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Integer, ForeignKey, Enum, DateTime, CheckConstraint, Index, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 
 from app.database import Base
+from app.utils.search import CODE_CONFIG, TEXT_CONFIG, search_vector_sql
 
 
 class ItemStatus(str, PyEnum):
@@ -30,11 +31,23 @@ class Item(Base):
     responsible_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(search_vector_sql(("part_number", CODE_CONFIG, "A"), ("name", TEXT_CONFIG, "B")), persisted=True),
+    ))
 
     __table_args__ = (
         CheckConstraint("current_progress >= 0 AND current_progress <= 100", name="check_current_progress"),
         CheckConstraint("docs_completion_percent >= 0 AND docs_completion_percent <= 100", name="check_docs_completion_percent"),
         Index("idx_items_section", "section_id"),
+        # Filtered/sorted listings within a project (GET /api/items); trigram search
+        # indexes need pg_trgm and live in the migration only
+        Index("idx_items_project_status", "project_id", "status"),
+        Index("idx_items_project_progress", "project_id", "current_progress"),
+        Index("idx_items_project_updated_at", "project_id", "updated_at"),
+        Index("idx_items_project_name", "project_id", "name"),
+        Index("idx_items_project_part_number", "project_id", "part_number"),
+        Index("idx_items_search_vector", "search_vector", postgresql_using="gin"),
     )
 
     # Relationships
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import Column, String, Integer, Text, ForeignKey, DateTime, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+from app.database import Base
+
+
+class RevisionVisualDiff(Base):
+    """Rendered page overlay of a revision pair, filled in the background; tiles live on disk."""
+    __tablename__ = "revision_visual_diffs"
+
+    from_revision_id = Column(UUID(as_uuid=True), ForeignKey("document_revisions.id", ondelete="CASCADE"), primary_key=True)
+    to_revision_id = Column(UUID(as_uuid=True), ForeignKey("document_revisions.id", ondelete="CASCADE"), primary_key=True)
+    status = Column(String(20), nullable=False)  # done, failed, timeout
+    page_count = Column(Integer, nullable=True)
+    pages = Column(JSONB, nullable=False, default=list)
+    error = Column(Text, nullable=True)
+    rendered_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("idx_revision_visual_diffs_to", "to_revision_id"),
+    )
@@ -1,11 +1,12 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, String, ForeignKey, DateTime, Boolean, Integer
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, ForeignKey, DateTime, Boolean, Integer, Computed, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 
 from app.database import Base
+from app.utils.search import CODE_CONFIG, search_vector_sql
 
 
 class TechDocument(Base):
@@ -25,6 +26,11 @@ class TechDocument(Base):
     is_deleted = Column(Boolean, nullable=False, default=False)
     deleted_at = Column(DateTime(timezone=True), nullable=True)
     deleted_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    search_vector = deferred(Column(TSVECTOR, Computed(search_vector_sql(("filename", CODE_CONFIG, "A")), persisted=True)))
+
+    __table_args__ = (
+        Index("idx_tech_documents_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     # Relationships
     section = relationship("ProjectSection")
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, String, Integer, BigInteger, Text, ForeignKey, Identity, Computed, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import deferred
+
+from app.database import Base
+from app.utils.search import TEXT_CONFIG, search_vector_sql
+
+
+class TechDocumentCell(Base):
+    """Non-empty cell of a tech document version, for content search."""
+    __tablename__ = "tech_document_cells"
+
+    id = Column(BigInteger, Identity(), primary_key=True)
+    document_id = Column(UUID(as_uuid=True), ForeignKey("tech_documents.id", ondelete="CASCADE"), nullable=False)
+    version = Column(Integer, nullable=False)
+    sheet = Column(String(255), nullable=False)
+    row_number = Column(Integer, nullable=False)
+    column_number = Column(Integer, nullable=False)
+    value = Column(Text, nullable=False)
+    search_vector = deferred(Column(TSVECTOR, Computed(search_vector_sql(("value", TEXT_CONFIG, "A")), persisted=True)))
+
+    __table_args__ = (
+        Index("idx_tech_cells_document_version", "document_id", "version"),
+        Index("idx_tech_cells_search_vector", "search_vector", postgresql_using="gin"),
+    )
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import Column, String, Integer, Text, ForeignKey, DateTime, Index
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+
+
+class TechDocumentIndex(Base):
+    """Cell indexing state of one tech document version (cells in tech_document_cells)."""
+    __tablename__ = "tech_document_indexes"
+
+    document_id = Column(UUID(as_uuid=True), ForeignKey("tech_documents.id", ondelete="CASCADE"), primary_key=True)
+    version = Column(Integer, primary_key=True)
+    sha256 = Column(String(64), nullable=False)
+    status = Column(String(20), nullable=False)  # done, failed, timeout
+    cell_count = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    indexed_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("idx_tech_indexes_sha256", "sha256"),
+    )
@@ -1,4 +1,4 @@
-from app.routers import auth, users, projects, items, documents, notifications, audit, tech_documents
+from app.routers import auth, users, projects, items, documents, notifications, audit, tech_documents, metrics
 
-__all__ = ["auth", "users", "projects", "items", "documents", "notifications", "audit", "tech_documents"]
+__all__ = ["auth", "users", "projects", "items", "documents", "notifications", "audit", "tech_documents", "metrics"]
 
@@ -8,9 +8,12 @@ from app.database import get_db
 from app.schemas.audit import AuditLogResponse
 from app.services.audit_service import list_audit_logs
 from app.dependencies import require_role
+from app.utils.serialization import ListSerializer
 
 router = APIRouter()
 
+_audit_serializer = ListSerializer(AuditLogResponse)
+
 
 @router.get("", response_model=List[AuditLogResponse], dependencies=[Depends(require_role(["admin"]))])
 def get_audit_logs(
@@ -31,5 +34,5 @@ def get_audit_logs(
         start_date=start_date,
         end_date=end_date
     )
-    return [AuditLogResponse.model_validate(log) for log in logs]
+    return _audit_serializer.response(logs)
 
@@ -10,7 +10,7 @@ from sqlalchemy import text
 from app.database import engine, get_db
 from app.schemas.user import UserLogin, UserResponse, TokenResponse
 from app.services.auth_service import authenticate_user, create_user_token
-from app.dependencies import get_current_user
+from app.dependencies import get_current_user_async
 from app.models.user import User
 from app.utils.security import create_access_token, decode_token
 
@@ -69,7 +69,7 @@ def logout():
 
 
 @router.get("/me", response_model=UserResponse)
-def get_current_user_info(request: Request, current_user: User = Depends(get_current_user)):
+async def get_current_user_info(request: Request, current_user: User = Depends(get_current_user_async)):
     _log(
         "auth.me.request",
         user_id=str(current_user.id),
@@ -4,40 +4,60 @@ from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form, Request
 from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
-from app.schemas.document import DocumentCreate, RevisionCreate, DocumentResponse, RevisionResponse
+from app.database import get_db, get_async_db
+from app.schemas.document import (
+    DocumentCreate,
+    RevisionCreate,
+    DocumentResponse,
+    RevisionResponse,
+    RevisionVisualDiffResponse,
+)
 from app.services.document_service import (
     create_document,
     get_document,
-    list_documents,
+    list_documents_async,
+    documents_version_query,
     upload_revision,
     soft_delete_document,
     hard_delete_document,
     get_revision_file_path,
 )
 from app.services.notification_service import notify_document_deleted
+from app.services.visual_diff_service import get_tile_path, get_visual_diff
 from app.services.item_service import get_item
 from app.services.audit_service import log_action
-from app.dependencies import get_current_user, require_role
+from app.dependencies import get_current_user, get_current_user_async, require_role
 from app.models.user import User, UserRole
+from app.utils.pdf_visual_diff import TILE_SIZE
+from app.utils.http_cache import etag_matches, json_response, not_modified, version_etag
+from app.utils.serialization import ListSerializer
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+_documents_serializer = ListSerializer(DocumentResponse)
+
 
 @router.get("", response_model=List[DocumentResponse])
-def get_documents(
+async def get_documents(
+    request: Request,
     item_id: Optional[UUID] = Query(None),
     show_deleted: Optional[bool] = Query(False),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
 ):
     if show_deleted and current_user.role != UserRole.admin:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only admins can view deleted documents")
-    documents = list_documents(db, item_id=item_id, show_deleted=show_deleted)
-    return [DocumentResponse.model_validate(d) for d in documents]
+    version = (await db.execute(documents_version_query(item_id, show_deleted))).one()
+    etag = version_etag("documents", item_id, show_deleted, *version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    documents = await list_documents_async(db, item_id=item_id, show_deleted=show_deleted)
+    return json_response(_documents_serializer.dumps(documents), etag)
 
 
 @router.post("", response_model=DocumentResponse)
@@ -195,6 +215,59 @@ def preview_revision(
     return StreamingResponse(iterfile(), media_type="application/pdf")
 
 
+@router.get("/{document_id}/revisions/{revision_id}/visual-diff", response_model=RevisionVisualDiffResponse)
+def get_revision_visual_diff(
+    document_id: UUID,
+    revision_id: UUID,
+    against: Optional[UUID] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    document = get_document(db, document_id)
+    if not document or document.is_deleted:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Document not found")
+
+    old, new, diff = get_visual_diff(db, document_id, revision_id, against)
+    return RevisionVisualDiffResponse(
+        from_revision_id=old.id,
+        to_revision_id=new.id,
+        from_revision_label=old.revision_label,
+        to_revision_label=new.revision_label,
+        status=diff.status if diff else "pending",
+        page_count=diff.page_count if diff else None,
+        tile_size=TILE_SIZE,
+        pages=diff.pages if diff else [],
+        error=diff.error if diff else None,
+        rendered_at=diff.rendered_at if diff else None,
+    )
+
+
+@router.get("/{document_id}/revisions/{revision_id}/visual-diff/pages/{page}/tiles/{row}/{column}.png")
+def get_revision_visual_diff_tile(
+    document_id: UUID,
+    revision_id: UUID,
+    page: int,
+    row: int,
+    column: int,
+    against: Optional[UUID] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    document = get_document(db, document_id)
+    if not document or document.is_deleted:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Document not found")
+
+    _, _, diff = get_visual_diff(db, document_id, revision_id, against)
+    if diff is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Visual diff not available")
+    # Tiles of a revision pair never change
+    return FileResponse(
+        get_tile_path(diff, page, row, column),
+        media_type="image/png",
+        headers={"Cache-Control": "private, max-age=31536000, immutable"},
+    )
+
+
 @router.delete("/{document_id}")
 def delete_document_by_id(
     request: Request,
@@ -1,32 +1,50 @@
 from uuid import UUID
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, File, UploadFile, Form
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response, File, UploadFile, Form
 from fastapi.encoders import jsonable_encoder
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
-from app.schemas.item import ItemCreate, ItemUpdate, ItemResponse, ProgressUpdate, ProgressHistoryResponse
+from app.database import get_db, get_async_db
+from app.schemas.item import (
+    ITEM_DETAIL_INCLUDES,
+    ITEM_SORT_FIELDS,
+    ItemCreate,
+    ItemUpdate,
+    ItemResponse,
+    ItemDetailResponse,
+    ProgressUpdate,
+    ProgressHistoryResponse,
+)
 from app.schemas.project import ProjectSectionResponse
 from app.services.item_service import (
+    ItemFilters,
     create_item,
     get_item,
-    list_items,
+    list_items_async,
+    items_version_query,
     update_item,
     delete_item,
     update_progress,
     get_progress_history,
+    get_item_detail,
 )
 from app.services.import_service import import_items_from_files
 from app.services.audit_service import log_action
 from app.services.notification_service import notify_item_updated
-from app.dependencies import get_current_user, require_role
+from app.dependencies import get_current_user, get_current_user_async, require_role
 from app.models.user import User, UserRole
-from app.models.item import Item
+from app.models.item import Item, ItemStatus
 from app.models.project_section import ProjectSection
+from app.utils.http_cache import etag_matches, json_response, not_modified, version_etag
+from app.utils.serialization import ListSerializer
 
 router = APIRouter()
 
+_items_serializer = ListSerializer(ItemResponse)
+
 
 def item_to_response(item: Item) -> ItemResponse:
     """Convert Item model to ItemResponse with original_filename from current revision."""
@@ -37,8 +55,8 @@ def item_to_response(item: Item) -> ItemResponse:
             if hasattr(doc, 'current_revision') and doc.current_revision:
                 original_filename = doc.current_revision.original_filename
                 break
-            elif hasattr(doc, 'revisions') and doc.revisions:
-                # Find current revision
+            elif "revisions" not in inspect(doc).unloaded and doc.revisions:
+                # Find current revision (only if already loaded: async sessions can't lazy load)
                 for rev in doc.revisions:
                     if rev.is_current:
                         original_filename = rev.original_filename
@@ -58,14 +76,44 @@ def item_to_response(item: Item) -> ItemResponse:
 
 
 @router.get("", response_model=List[ItemResponse])
-def get_items(
+async def get_items(
+    request: Request,
     project_id: Optional[UUID] = Query(None),
     section_id: Optional[UUID] = Query(None),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    item_status: Optional[List[ItemStatus]] = Query(None, alias="status"),
+    responsible_id: Optional[UUID] = Query(None),
+    progress_min: Optional[int] = Query(None, ge=0, le=100),
+    progress_max: Optional[int] = Query(None, ge=0, le=100),
+    has_documents: Optional[bool] = Query(None),
+    q: Optional[str] = Query(None, max_length=100, description="Search in part_number and name"),
+    match: str = Query("substring", pattern="^(substring|prefix)$"),
+    sort: Optional[str] = Query(None, description="part_number, name, progress or updated_at; prefix with - for descending"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
 ):
-    items = list_items(db, project_id=project_id, section_id=section_id)
-    return [item_to_response(i) for i in items]
+    if sort and sort.lstrip("-") not in ITEM_SORT_FIELDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown sort: {sort}"
+        )
+    filters = ItemFilters(
+        statuses=tuple(item_status or ()),
+        responsible_id=responsible_id,
+        progress_min=progress_min,
+        progress_max=progress_max,
+        has_documents=has_documents,
+        search=q.strip() if q else None,
+        prefix=match == "prefix",
+        sort=sort,
+    )
+    
+    version = (await db.execute(items_version_query(project_id, section_id))).one()
+    etag = version_etag("items", project_id, section_id, filters, *version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    items = await list_items_async(db, project_id=project_id, section_id=section_id, filters=filters)
+    return json_response(_items_serializer.dumps(item_to_response(i) for i in items), etag)
 
 
 @router.post("", response_model=ItemResponse)
@@ -101,6 +149,40 @@ def get_item_by_id(
     return item_to_response(item)
 
 
+@router.get("/{item_id}/detail", response_model=ItemDetailResponse)
+def get_item_detail_by_id(
+    item_id: UUID,
+    include: Optional[str] = Query(
+        None, description="Comma-separated parts: documents, revisions, progress_history (default: all)"
+    ),
+    history_limit: int = Query(20, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Item, section, responsible user, documents with revisions and recent progress history in one call."""
+    parts = set(ITEM_DETAIL_INCLUDES) if include is None else {p.strip() for p in include.split(",") if p.strip()}
+    unknown = parts - set(ITEM_DETAIL_INCLUDES)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown include: {', '.join(sorted(unknown))}"
+        )
+    
+    detail = get_item_detail(db, item_id, parts, history_limit=history_limit)
+    if not detail:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
+    
+    response = ItemDetailResponse.model_validate(
+        {
+            "item": item_to_response(detail.item),
+            "documents": detail.documents,
+            "progress_history": detail.progress_history,
+        },
+        from_attributes=True,
+    )
+    return Response(content=response.model_dump_json(), media_type="application/json")
+
+
 @router.patch("/{item_id}", response_model=ItemResponse)
 def update_item_by_id(
     request: Request,
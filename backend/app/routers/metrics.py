@@ -0,0 +1,47 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+
+from app.database import engine, async_engine
+from app.dependencies import require_role
+from app.utils.db_pool_metrics import sync_pool_metrics, async_pool_metrics
+from app.utils.metrics import render_latest
+from app.utils.tracing import InMemorySpanExporter, get_exporter
+
+router = APIRouter()
+
+
+@router.get("")
+def get_metrics():
+    """Prometheus exposition: per-route request count, latency, in-flight, body bytes, file I/O, DB statements."""
+    content, content_type = render_latest()
+    return Response(content=content, media_type=content_type)
+
+
+@router.get("/db-pool", dependencies=[Depends(require_role(["admin"]))])
+def get_db_pool_metrics():
+    """Connection pool saturation: checkout wait histogram, overflow, timeouts and hold time per route."""
+    return {
+        "pools": [
+            sync_pool_metrics.snapshot(engine.pool),
+            async_pool_metrics.snapshot(async_engine.sync_engine.pool),
+        ]
+    }
+
+
+@router.get("/traces", dependencies=[Depends(require_role(["admin"]))])
+def get_traces(
+    request_id: Optional[str] = None,
+    trace_id: Optional[str] = None,
+    limit: int = Query(200, ge=1, le=5000),
+):
+    """Recent spans from the in-memory exporter, filterable by request id (X-Request-ID) or trace id."""
+    exporter = get_exporter()
+    if not isinstance(exporter, InMemorySpanExporter):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="In-memory trace exporter is not enabled (TRACING_EXPORTER=memory)"
+        )
+    spans = exporter.get_finished_spans(trace_id=trace_id, request_id=request_id)[-limit:]
+    spans.sort(key=lambda span: span.start_ns)
+    return {"spans": [span.to_dict() for span in spans]}
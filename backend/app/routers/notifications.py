@@ -2,28 +2,32 @@ from uuid import UUID
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.schemas.notification import NotificationResponse
 from app.services.notification_service import (
-    get_user_notifications,
+    get_user_notifications_async,
     mark_notification_as_read,
     mark_all_notifications_as_read,
 )
-from app.dependencies import get_current_user
+from app.dependencies import get_current_user, get_current_user_async
 from app.models.user import User
+from app.utils.serialization import ListSerializer
 
 router = APIRouter()
 
+_notifications_serializer = ListSerializer(NotificationResponse)
+
 
 @router.get("/my", response_model=List[NotificationResponse])
-def get_my_notifications(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+async def get_my_notifications(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
 ):
-    notifications = get_user_notifications(db, current_user.id)
-    return [NotificationResponse.model_validate(n) for n in notifications]
+    notifications = await get_user_notifications_async(db, current_user.id)
+    return _notifications_serializer.response(notifications)
 
 
 @router.patch("/{notification_id}/read", response_model=NotificationResponse)
@@ -1,13 +1,22 @@
 from uuid import UUID
-from typing import List
+from typing import List, Optional
+from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
 from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
-from app.database import get_db
-from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse, ProjectSectionResponse
+from app.config import settings
+from app.database import SessionLocal, get_db
+from app.schemas.project import (
+    ProjectCreate,
+    ProjectUpdate,
+    ProjectResponse,
+    ProjectSectionResponse,
+    ProjectSummaryResponse,
+)
 from app.services.project_service import (
     create_project,
     get_project,
@@ -16,16 +25,29 @@ from app.services.project_service import (
     delete_project,
     create_section,
     list_sections,
+    sections_version_query,
+    project_summaries,
     delete_section,
 )
+from app.services.bundle_service import BundleEntry, bundle_members, list_bundle_entries
+from app.services.register_service import REGISTER_COLUMNS, REGISTER_FORMATS, iter_register_rows
 from app.services.notification_service import notify_tech_section_created, notify_tech_section_deleted
 from app.services.audit_service import log_action
 from app.dependencies import get_current_user, require_role
 from app.models.user import User
 from app.models.project_section import ProjectSection
+from app.utils.cache import CACHE_PROJECTS, CACHE_SECTIONS, CACHE_SUMMARY, CachedResponse, compute_etag, response_cache
+from app.utils.http_cache import conditional_json_response, etag_matches, json_response, not_modified, version_etag
+from app.utils.serialization import ListSerializer
+from app.utils.table_export import stream_csv, stream_xlsx
+from app.utils.zip_stream import stream_zip
 
 router = APIRouter()
 
+_projects_serializer = ListSerializer(ProjectResponse)
+_sections_serializer = ListSerializer(ProjectSectionResponse)
+_summaries_serializer = ListSerializer(ProjectSummaryResponse)
+
 
 class SectionCreateRequest(BaseModel):
     code: str = Field(..., max_length=50)
@@ -33,11 +55,16 @@ class SectionCreateRequest(BaseModel):
 
 @router.get("", response_model=List[ProjectResponse])
 def get_projects(
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    projects = list_projects(db)
-    return [ProjectResponse.model_validate(p) for p in projects]
+    def produce() -> bytes:
+        projects = list_projects(db)
+        return _projects_serializer.dumps(projects)
+
+    cached = response_cache.get_or_set(CACHE_PROJECTS, "list", produce)
+    return conditional_json_response(request, cached)
 
 
 @router.post("", response_model=ProjectResponse)
@@ -61,6 +88,47 @@ def create_new_project(
     return ProjectResponse.model_validate(project)
 
 
+def _cached_summary(key: str, produce) -> CachedResponse:
+    """Summary cache with its own short TTL (bounds staleness across workers with the memory backend)."""
+    ttl = settings.PROJECT_SUMMARY_CACHE_TTL_SECONDS
+    if ttl <= 0:
+        body = produce()
+        return CachedResponse(body, compute_etag(body))
+    return response_cache.get_or_set(CACHE_SUMMARY, key, produce, ttl=ttl)
+
+
+# Declared before /{project_id}: "summary" is not a UUID
+@router.get("/summary", response_model=List[ProjectSummaryResponse])
+def get_projects_summary(
+    request: Request,
+    project_id: Optional[List[UUID]] = Query(None, description="Repeat to select several projects; all if omitted"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Dashboard aggregates for several projects, computed in one grouped SQL query."""
+    project_ids = sorted(set(project_id), key=str) if project_id else None
+    key = ",".join(map(str, project_ids)) if project_ids else "all"
+    cached = _cached_summary(key, lambda: _summaries_serializer.dumps(project_summaries(db, project_ids)))
+    return conditional_json_response(request, cached)
+
+
+@router.get("/{project_id}/summary", response_model=ProjectSummaryResponse)
+def get_project_summary(
+    request: Request,
+    project_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Progress, status counts and document/revision counts per project and per section."""
+    def produce() -> bytes:
+        summaries = project_summaries(db, [project_id])
+        if not summaries:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
+        return ProjectSummaryResponse.model_validate(summaries[0]).model_dump_json().encode()
+
+    return conditional_json_response(request, _cached_summary(str(project_id), produce))
+
+
 @router.get("/{project_id}", response_model=ProjectResponse)
 def get_project_by_id(
     project_id: UUID,
@@ -167,30 +235,43 @@ def create_project_section(
 
 @router.get("/{project_id}/sections", response_model=List[ProjectSectionResponse])
 def get_project_sections(
+    request: Request,
     project_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """List all sections for a project."""
-    project = get_project(db, project_id)
-    if not project:
+    project_exists, *version = db.execute(sections_version_query(project_id)).one()
+    if not project_exists:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
-    
-    sections = list_sections(db, project_id)
-    return [ProjectSectionResponse.model_validate(s) for s in sections]
+    etag = version_etag("sections", project_id, *version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    def produce() -> bytes:
+        sections = list_sections(db, project_id)
+        return _sections_serializer.dumps(sections)
+
+    # Keyed by version: a body cached by another worker can never be served under a newer ETag
+    cached = response_cache.get_or_set(CACHE_SECTIONS, f"project:{project_id}:{etag}", produce)
+    return json_response(cached.body, etag)
 
 
 @router.get("/sections/{section_id}", response_model=ProjectSectionResponse)
 def get_section_by_id(
+    request: Request,
     section_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    section = db.query(ProjectSection).filter(ProjectSection.id == section_id).first()
-    if not section:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Section not found")
+    def produce() -> bytes:
+        section = db.query(ProjectSection).filter(ProjectSection.id == section_id).first()
+        if not section:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Section not found")
+        return ProjectSectionResponse.model_validate(section).model_dump_json().encode()
 
-    return ProjectSectionResponse.model_validate(section)
+    cached = response_cache.get_or_set(CACHE_SECTIONS, f"id:{section_id}", produce)
+    return conditional_json_response(request, cached)
 
 
 @router.delete("/{project_id}/sections/{section_id}")
@@ -228,3 +309,73 @@ def delete_project_section(
 
     return {"message": "Section deleted"}
 
+
+def _attachment(filename: str) -> dict:
+    return {"Content-Disposition": f"attachment; filename*=utf-8''{quote(filename)}"}
+
+
+def _bundle_response(entries: List[BundleEntry], archive_name: str) -> StreamingResponse:
+    # Metadata is resolved before streaming starts: the generator only reads files,
+    # so it does not need the request's DB session (closed once the response begins)
+    return StreamingResponse(
+        stream_zip(bundle_members(entries)),
+        media_type="application/zip",
+        headers=_attachment(archive_name),
+    )
+
+
+@router.get("/{project_id}/bundle")
+def download_project_bundle(
+    project_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    project = get_project(db, project_id)
+    if not project:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
+    return _bundle_response(list_bundle_entries(db, project_id=project_id), f"{project.name}.zip")
+
+
+@router.get("/sections/{section_id}/bundle")
+def download_section_bundle(
+    section_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    section = db.query(ProjectSection).filter(ProjectSection.id == section_id).first()
+    if not section:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Section not found")
+    return _bundle_response(list_bundle_entries(db, section_id=section_id), f"{section.code}.zip")
+
+
+@router.get("/{project_id}/register")
+def export_project_register(
+    project_id: UUID,
+    format: str = Query("xlsx"),
+    section_id: Optional[UUID] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    if format not in REGISTER_FORMATS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid export format")
+    project = get_project(db, project_id)
+    if not project:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
+    if section_id is not None:
+        section = db.query(ProjectSection).filter(ProjectSection.id == section_id).first()
+        if not section or section.project_id != project_id:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Section not found")
+
+    filename = f"{project.name}.{format}"
+    rows = iter_register_rows(SessionLocal, project_id, section_id, text_dates=format == "csv")
+    if format == "csv":
+        return StreamingResponse(
+            stream_csv(REGISTER_COLUMNS, rows),
+            media_type="text/csv; charset=utf-8",
+            headers=_attachment(filename),
+        )
+    return StreamingResponse(
+        stream_xlsx("Реестр", REGISTER_COLUMNS, rows),
+        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        headers=_attachment(filename),
+    )
@@ -0,0 +1,68 @@
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.schemas.search import SEARCH_KINDS, ContentSearchResponse, SearchResponse, TechCellSearchResponse
+from app.services.pdf_text_service import search_revision_texts
+from app.services.search_service import search
+from app.services.tech_document_index_service import search_tech_cells
+from app.dependencies import get_current_user
+from app.models.user import User
+
+router = APIRouter()
+
+
+@router.get("", response_model=SearchResponse)
+def search_all(
+    q: str = Query(..., min_length=1, max_length=200),
+    kind: Optional[List[str]] = Query(None, description="item, document, revision, tech_document (default: all)"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Full-text and fuzzy search over part numbers, item names, document titles and file names."""
+    kinds = set(kind) if kind else set(SEARCH_KINDS)
+    unknown = kinds - set(SEARCH_KINDS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown kind: {', '.join(sorted(unknown))}"
+        )
+    
+    results, next_cursor = search(db, q, kinds, limit=limit, cursor=cursor)
+    return SearchResponse(results=results, next_cursor=next_cursor)
+
+
+@router.get("/content", response_model=ContentSearchResponse)
+def search_document_content(
+    q: str = Query(..., min_length=1, max_length=200),
+    current_only: bool = Query(False, description="Only current revisions"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Search the text inside revision PDFs (title blocks, notes) with highlighted snippets."""
+    results, next_cursor = search_revision_texts(db, q, limit=limit, cursor=cursor, current_only=current_only)
+    return ContentSearchResponse(results=results, next_cursor=next_cursor)
+
+
+@router.get("/tech-documents", response_model=TechCellSearchResponse)
+def search_tech_document_cells(
+    q: str = Query(..., min_length=1, max_length=200),
+    section_id: Optional[UUID] = Query(None),
+    all_versions: bool = Query(False, description="Also search archived versions"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Search cell text of tech document workbooks: document, sheet and cell of each hit."""
+    results, next_cursor = search_tech_cells(
+        db, q, limit=limit, cursor=cursor, section_id=section_id, all_versions=all_versions
+    )
+    return TechCellSearchResponse(results=results, next_cursor=next_cursor)
@@ -1,6 +1,7 @@
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Request, Query
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
@@ -11,9 +12,12 @@ from app.schemas.tech_document import (
     TechDocumentUploadResponse,
     TechDocumentVersionResponse,
     TechDocumentPreviewResponse,
+    TechSheetRowsResponse,
+    TechDocumentDiffResponse,
 )
 from app.services.tech_document_service import (
     list_documents,
+    documents_version_query,
     upload_document,
     get_document,
     update_document,
@@ -22,6 +26,9 @@ from app.services.tech_document_service import (
 )
 from app.services.file_storage_service import get_excel_file_path
 from app.services.excel_preview_service import generate_preview
+from app.services.tech_document_index_service import get_version_source
+from app.services.tech_diff_service import load_diff
+from app.services.tech_sheet_service import load_snapshot, parse_filters, query_sheet
 from app.services.notification_service import (
     notify_tech_document_uploaded,
     notify_tech_document_updated,
@@ -31,10 +38,15 @@ from app.services.audit_service import log_action
 from app.dependencies import get_current_user, require_role
 from app.models.user import User
 from app.models.project_section import ProjectSection
+from app.utils.http_cache import etag_matches, json_response, not_modified, version_etag
+from app.utils.serialization import ListSerializer
 from app.utils.validators import validate_excel_file
 
 router = APIRouter()
 
+_documents_serializer = ListSerializer(TechDocumentResponse)
+_versions_serializer = ListSerializer(TechDocumentVersionResponse)
+
 
 def get_section(db: Session, section_id: UUID) -> ProjectSection:
     section = db.query(ProjectSection).filter(ProjectSection.id == section_id).first()
@@ -45,13 +57,19 @@ def get_section(db: Session, section_id: UUID) -> ProjectSection:
 
 @router.get("/sections/{section_id}/documents", response_model=List[TechDocumentResponse])
 def get_section_documents(
+    request: Request,
     section_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     get_section(db, section_id)
+    version = db.execute(documents_version_query(section_id)).one()
+    etag = version_etag("tech_documents", section_id, *version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     documents = list_documents(db, section_id)
-    return [TechDocumentResponse.model_validate(doc) for doc in documents]
+    return json_response(_documents_serializer.dumps(documents), etag)
 
 
 @router.post("/sections/{section_id}/documents", response_model=TechDocumentUploadResponse)
@@ -134,6 +152,94 @@ def preview_document(
     )
 
 
+@router.get("/documents/{document_id}/rows", response_model=TechSheetRowsResponse)
+def get_document_rows(
+    document_id: UUID,
+    sheet: Optional[str] = None,
+    version: Optional[int] = Query(None, ge=1),
+    header: bool = True,
+    q: Optional[str] = Query(None, max_length=200),
+    filters: List[str] = Query([], alias="filter"),
+    sort: Optional[str] = None,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    document = get_document(db, document_id)
+    if not document or document.is_deleted:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Document not found")
+
+    source = get_version_source(db, document_id, version or document.version)
+    if source is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Version not found")
+    storage_uuid, extension, sha256 = source
+    path = get_excel_file_path(storage_uuid, extension)
+    if not path.exists():
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+
+    conditions = parse_filters(filters)
+    snapshot = load_snapshot(path, sha256)
+    sheet_snapshot = snapshot.sheet(sheet)
+    if sheet_snapshot is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Sheet not found")
+
+    result = query_sheet(sheet_snapshot, header, q, conditions, sort, offset, limit)
+    return TechSheetRowsResponse(
+        filename=document.filename,
+        version=version or document.version,
+        sheets=[item.name for item in snapshot.sheets],
+        **result,
+    )
+
+
+@router.get("/documents/{document_id}/diff", response_model=TechDocumentDiffResponse)
+def get_document_diff(
+    request: Request,
+    document_id: UUID,
+    from_version: Optional[int] = Query(None, alias="from", ge=1),
+    to_version: Optional[int] = Query(None, alias="to", ge=1),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    document = get_document(db, document_id)
+    if not document or document.is_deleted:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Document not found")
+
+    to_version = to_version or document.version
+    from_version = from_version or to_version - 1
+    if from_version < 1:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No previous version to compare with")
+
+    sources = []
+    for version in (from_version, to_version):
+        source = get_version_source(db, document_id, version)
+        if source is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Version not found")
+        storage_uuid, extension, sha256 = source
+        path = get_excel_file_path(storage_uuid, extension)
+        if not path.exists():
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+        sources.append((path, sha256))
+    (from_path, from_sha256), (to_path, to_sha256) = sources
+
+    etag = version_etag("tech_diff", document_id, document.filename, from_version, to_version, from_sha256, to_sha256)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    meta = {
+        "document_id": document_id,
+        "filename": document.filename,
+        "from_version": from_version,
+        "to_version": to_version,
+        "from_sha256": from_sha256,
+        "to_sha256": to_sha256,
+    }
+    diff = load_diff(from_path, from_sha256, to_path, to_sha256)
+    # The cached diff is shared by content pair: splice the per-document fields in front of it
+    return json_response(orjson.dumps(meta)[:-1] + b"," + diff[1:], etag)
+
+
 @router.put("/documents/{document_id}", response_model=TechDocumentUploadResponse)
 async def update_document_by_id(
     request: Request,
@@ -218,4 +324,4 @@ def get_document_versions(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Document not found")
 
     versions = list_versions(db, document_id)
-    return [TechDocumentVersionResponse.model_validate(v) for v in versions]
+    return _versions_serializer.response(versions)
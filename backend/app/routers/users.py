@@ -16,14 +16,23 @@ from app.services.user_service import (
 from app.services.audit_service import log_action
 from app.dependencies import get_current_user, require_role
 from app.models.user import User
+from app.utils.cache import CACHE_USERS, response_cache
+from app.utils.http_cache import conditional_json_response
+from app.utils.serialization import ListSerializer
 
 router = APIRouter()
 
+_users_serializer = ListSerializer(UserResponse)
+
 
 @router.get("", response_model=List[UserResponse], dependencies=[Depends(require_role(["admin"]))])
-def get_users(db: Session = Depends(get_db)):
-    users = list_users(db)
-    return [UserResponse.model_validate(u) for u in users]
+def get_users(request: Request, db: Session = Depends(get_db)):
+    def produce() -> bytes:
+        users = list_users(db)
+        return _users_serializer.dumps(users)
+
+    cached = response_cache.get_or_set(CACHE_USERS, "list", produce)
+    return conditional_json_response(request, cached)
 
 
 @router.post("", response_model=UserResponse)
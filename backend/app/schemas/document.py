@@ -69,3 +69,27 @@ class DocumentCreate(BaseModel):
 class RevisionCreate(BaseModel):
     change_note: str
 
+
+
+class VisualDiffPage(BaseModel):
+    page: int
+    status: str  # changed | unchanged | added | removed
+    width: int
+    height: int
+    changed_pixels: int
+    changed_ratio: float
+    rows: int  # tile grid
+    columns: int
+
+
+class RevisionVisualDiffResponse(BaseModel):
+    from_revision_id: UUID
+    to_revision_id: UUID
+    from_revision_label: str
+    to_revision_label: str
+    status: str  # pending | done | failed | timeout
+    page_count: Optional[int] = None
+    tile_size: int
+    pages: List[VisualDiffPage] = []
+    error: Optional[str] = None
+    rendered_at: Optional[datetime] = None
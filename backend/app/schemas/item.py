@@ -9,7 +9,11 @@ from app.schemas.user import UserSummary
 from app.schemas.project import ProjectSectionResponse
 
 if TYPE_CHECKING:
-    from app.schemas.document import DocumentSummary
+    from app.schemas.document import DocumentSummary, DocumentResponse
+
+
+# Sort keys of GET /api/items (prefix with "-" for descending order)
+ITEM_SORT_FIELDS = ("part_number", "name", "progress", "updated_at")
 
 
 class ItemCreate(BaseModel):
@@ -71,7 +75,8 @@ class ProgressHistoryResponse(BaseModel):
     item_id: UUID
     old_progress: int
     new_progress: int
-    changed_by: UserSummary
+    # ProgressHistory.changed_by is the FK column; the user comes from the relationship
+    changed_by: UserSummary = Field(validation_alias="changed_by_user")
     changed_at: datetime
     comment: Optional[str]
 
@@ -92,7 +97,18 @@ class FileImportRequest(BaseModel):
     responsible_id: Optional[UUID] = None
 
 
+ITEM_DETAIL_INCLUDES = ("documents", "revisions", "progress_history")
+
+
+class ItemDetailResponse(BaseModel):
+    """Item page in one response; parts not requested via include= are null."""
+    item: ItemResponse
+    documents: Optional[List["DocumentResponse"]] = None
+    progress_history: Optional[List[ProgressHistoryResponse]] = None
+
+
 # Update forward references
-from app.schemas.document import DocumentSummary
+from app.schemas.document import DocumentSummary, DocumentResponse
 ItemResponse.model_rebuild()
+ItemDetailResponse.model_rebuild()
 
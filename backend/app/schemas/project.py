@@ -1,6 +1,6 @@
 from datetime import datetime
 from uuid import UUID
-from typing import Optional, List, TYPE_CHECKING
+from typing import Dict, Optional, List, TYPE_CHECKING
 
 from pydantic import BaseModel, Field
 
@@ -59,6 +59,28 @@ class ProjectSummary(BaseModel):
         from_attributes = True
 
 
+class SummaryAggregates(BaseModel):
+    items_count: int
+    status_counts: Dict[str, int]
+    completed_items: int
+    average_progress: Optional[float]
+    average_docs_completion: Optional[float]
+    documents_count: int
+    revisions_count: int
+
+
+class SectionSummary(SummaryAggregates):
+    section_id: Optional[UUID]
+    section_code: Optional[str]
+
+
+class ProjectSummaryResponse(SummaryAggregates):
+    project_id: UUID
+    name: str
+    status: ProjectStatus
+    sections: List[SectionSummary] = []
+
+
 # Update forward references
 from app.schemas.item import ItemSummary
 ProjectResponse.model_rebuild()
@@ -0,0 +1,64 @@
+from uuid import UUID
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel
+
+SEARCH_KINDS = ("item", "document", "revision", "tech_document")
+
+SearchKind = Literal["item", "document", "revision", "tech_document"]
+
+
+class SearchHit(BaseModel):
+    kind: SearchKind
+    id: UUID
+    title: str
+    subtitle: Optional[str] = None
+    project_id: Optional[UUID] = None
+    section_id: Optional[UUID] = None
+    item_id: Optional[UUID] = None
+    document_id: Optional[UUID] = None
+    rank: float
+
+
+class SearchResponse(BaseModel):
+    results: List[SearchHit]
+    next_cursor: Optional[str] = None
+
+
+class ContentSearchHit(BaseModel):
+    revision_id: UUID
+    document_id: UUID
+    item_id: UUID
+    document_title: str
+    revision_label: str
+    original_filename: str
+    is_current: bool
+    page_count: Optional[int] = None
+    rank: float
+    snippet: str  # HTML-escaped text with matches wrapped in <mark>
+
+
+class TechCellHit(BaseModel):
+    id: int
+    document_id: UUID
+    filename: str
+    version: int
+    is_current_version: bool
+    section_id: UUID
+    project_id: UUID
+    sheet: str
+    row_number: int
+    column_number: int
+    cell: str  # e.g. "C12"
+    value: str
+    rank: float
+
+
+class TechCellSearchResponse(BaseModel):
+    results: List[TechCellHit]
+    next_cursor: Optional[str] = None
+
+
+class ContentSearchResponse(BaseModel):
+    results: List[ContentSearchHit]
+    next_cursor: Optional[str] = None
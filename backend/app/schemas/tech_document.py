@@ -1,6 +1,6 @@
 from datetime import datetime
 from uuid import UUID
-from typing import List
+from typing import List, Optional, Union
 
 from pydantic import BaseModel
 
@@ -55,3 +55,57 @@ class TechDocumentPreviewResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class TechSheetRow(BaseModel):
+    row_number: int
+    cells: List[str]
+
+
+class TechSheetRowsResponse(BaseModel):
+    filename: str
+    version: int
+    sheet: str
+    sheets: List[str]
+    columns: int
+    header: Optional[List[str]] = None
+    total_rows: int
+    matched_rows: int
+    offset: int
+    limit: int
+    rows: List[TechSheetRow]
+
+
+class TechCellChange(BaseModel):
+    column: str
+    old: str
+    new: str
+
+
+class TechRowChange(BaseModel):
+    type: str  # added | removed | changed
+    old_row: Optional[int] = None
+    new_row: Optional[int] = None
+    # Row values for added/removed rows, cell changes for changed rows
+    cells: List[Union[str, TechCellChange]]
+
+
+class TechSheetDiff(BaseModel):
+    name: str
+    status: str  # added | removed | changed | unchanged
+    rows_added: int
+    rows_removed: int
+    rows_changed: int
+    changes: List[TechRowChange]
+    truncated: bool
+
+
+class TechDocumentDiffResponse(BaseModel):
+    document_id: UUID
+    filename: str
+    from_version: int
+    to_version: int
+    from_sha256: str
+    to_sha256: str
+    identical: bool
+    sheets: List[TechSheetDiff]
@@ -2,11 +2,13 @@ from uuid import UUID
 from typing import Optional, List, Any
 from datetime import datetime
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app.models.audit_log import AuditLog
+from app.utils.tracing import start_span, traced
 
 
+@traced()
 def log_action(
     db: Session,
     user_id: Optional[UUID],
@@ -22,7 +24,8 @@ def log_action(
         ip_address=ip_address,
     )
     db.add(log_entry)
-    db.commit()
+    with start_span("db.commit"):
+        db.commit()
     db.refresh(log_entry)
     return log_entry
 
@@ -37,7 +40,7 @@ def list_audit_logs(
     end_date: Optional[datetime] = None
 ) -> List[AuditLog]:
     """List audit logs with filtering and pagination."""
-    query = db.query(AuditLog)
+    query = db.query(AuditLog).options(selectinload(AuditLog.user))
     
     if user_id:
         query = query.filter(AuditLog.user_id == user_id)
@@ -0,0 +1,71 @@
+import logging
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.document import Document
+from app.models.document_revision import DocumentRevision
+from app.models.item import Item
+from app.services.file_storage_service import get_file_path
+from app.utils.zip_stream import ZipMember
+
+logger = logging.getLogger(__name__)
+
+MISSING_FILES_NAME = "_missing.txt"
+
+# (filename in the bundle, revision file)
+BundleEntry = Tuple[str, Path]
+
+
+def _member_stem(part_number: str, revision_label: str) -> str:
+    """Archive-safe `{part_number}_{revision}`: no directories, no hidden or `..` names."""
+    stem = f"{part_number}_{revision_label}".replace("/", "_").replace("\\", "_")
+    return stem.lstrip(". ") or "_"
+
+
+def list_bundle_entries(
+    db: Session,
+    project_id: Optional[UUID] = None,
+    section_id: Optional[UUID] = None,
+) -> List[BundleEntry]:
+    """Current revisions of live documents of a project or section, in one query.
+
+    Files are named `{part_number}_{revision}.pdf` like single downloads;
+    several documents of one item get a ` (2)`, ` (3)` ... suffix.
+    """
+    query = (
+        select(Item.part_number, DocumentRevision.revision_label, DocumentRevision.file_storage_uuid)
+        .join(Document, Document.id == DocumentRevision.document_id)
+        .join(Item, Item.id == Document.item_id)
+        .where(DocumentRevision.is_current == True, Document.is_deleted == False)
+        .order_by(Item.part_number, Document.created_at, Document.id)
+    )
+    if project_id is not None:
+        query = query.where(Item.project_id == project_id)
+    if section_id is not None:
+        query = query.where(Item.section_id == section_id)
+
+    entries = []
+    used = {}
+    for part_number, revision_label, storage_uuid in db.execute(query):
+        stem = _member_stem(part_number, revision_label)
+        used[stem] = used.get(stem, 0) + 1
+        suffix = f" ({used[stem]})" if used[stem] > 1 else ""
+        entries.append((f"{stem}{suffix}.pdf", get_file_path(storage_uuid)))
+    return entries
+
+
+def bundle_members(entries: Iterable[BundleEntry]) -> Iterator[ZipMember]:
+    """Archive members for the entries; files missing on disk are listed in `_missing.txt`."""
+    missing = []
+    for filename, path in entries:
+        if not path.exists():
+            logger.warning("Revision file missing on disk", extra={"path": str(path), "bundle_name": filename})
+            missing.append(filename)
+            continue
+        yield filename, path
+    if missing:
+        yield MISSING_FILES_NAME, ("\n".join(missing) + "\n").encode()
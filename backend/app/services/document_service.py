@@ -5,21 +5,31 @@ from typing import Optional, List, Tuple
 from pathlib import Path
 from datetime import datetime
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.sql import Select
 from fastapi import UploadFile, HTTPException, status
 
 from app.models.document import Document
 from app.models.document_revision import DocumentRevision
+from app.models.item import Item
 from app.services.file_storage_service import save_file, get_file_path
 from app.services.revision_service import get_current_revision
 from app.services.notification_service import notify_revision_uploaded
+from app.services.pdf_text_service import schedule_text_extraction
+from app.services.visual_diff_service import delete_visual_diff_files, schedule_visual_diff
+from app.utils.cache import CACHE_SUMMARY, invalidate_cache
+from app.utils.http_cache import collection_version
 from app.utils.revision_helper import get_next_revision
+from app.utils.tracing import start_span, traced
 from app.utils.validators import validate_pdf_header
 
 
 logger = logging.getLogger(__name__)
 
 
+@traced()
 async def create_document(
     db: Session,
     item_id: UUID,
@@ -57,9 +67,12 @@ async def create_document(
     )
     db.add(revision)
     
-    db.commit()
+    with start_span("db.commit"):
+        db.commit()
+    invalidate_cache(CACHE_SUMMARY)
     db.refresh(document)
     db.refresh(revision)
+    schedule_text_extraction([revision.id])
     
     # Notify responsible user and admins about new revision
     notify_revision_uploaded(db, document, revision)
@@ -67,6 +80,7 @@ async def create_document(
     return document
 
 
+@traced()
 def get_document(db: Session, document_id: UUID) -> Optional[Document]:
     """Get document by ID with revisions eagerly loaded."""
     return db.query(Document).options(
@@ -75,19 +89,50 @@ def get_document(db: Session, document_id: UUID) -> Optional[Document]:
     ).filter(Document.id == document_id).first()
 
 
-def list_documents(db: Session, item_id: Optional[UUID] = None, show_deleted: bool = False) -> List[Document]:
-    """List documents, optionally filtered by item, with revisions eagerly loaded."""
-    query = db.query(Document).options(
+def _documents_criteria(item_id: Optional[UUID], show_deleted: bool) -> list:
+    criteria = []
+    if not show_deleted:
+        criteria.append(Document.is_deleted == False)
+    if item_id:
+        criteria.append(Document.item_id == item_id)
+    return criteria
+
+
+def documents_query(item_id: Optional[UUID] = None, show_deleted: bool = False) -> Select:
+    """Build the document listing SELECT with revisions eagerly loaded."""
+    return select(Document).options(
         selectinload(Document.revisions),
         selectinload(Document.current_revision)
+    ).where(*_documents_criteria(item_id, show_deleted))
+
+
+def documents_version_query(item_id: Optional[UUID] = None, show_deleted: bool = False) -> Select:
+    """One-row SELECT whose values change whenever the documents_query response would."""
+    criteria = _documents_criteria(item_id, show_deleted)
+    document_ids = select(Document.id).where(*criteria)
+    return select(
+        *collection_version(Document.updated_at, *criteria),
+        *collection_version(DocumentRevision.uploaded_at, DocumentRevision.document_id.in_(document_ids)),
     )
-    if not show_deleted:
-        query = query.filter(Document.is_deleted == False)
-    if item_id:
-        query = query.filter(Document.item_id == item_id)
-    return query.all()
 
 
+@traced()
+def list_documents(db: Session, item_id: Optional[UUID] = None, show_deleted: bool = False) -> List[Document]:
+    """List documents, optionally filtered by item, with revisions eagerly loaded."""
+    return list(db.scalars(documents_query(item_id, show_deleted)).all())
+
+
+@traced()
+async def list_documents_async(
+    db: AsyncSession,
+    item_id: Optional[UUID] = None,
+    show_deleted: bool = False
+) -> List[Document]:
+    """Async variant of list_documents for the async engine."""
+    return list((await db.scalars(documents_query(item_id, show_deleted))).all())
+
+
+@traced()
 async def upload_revision(
     db: Session,
     document_id: UUID,
@@ -159,8 +204,12 @@ async def upload_revision(
         )
         db.add(new_revision)
         
-        db.commit()
+        with start_span("db.commit"):
+            db.commit()
+        invalidate_cache(CACHE_SUMMARY)
         db.refresh(new_revision)
+        schedule_text_extraction([new_revision.id])
+        schedule_visual_diff([(current_rev.id, new_revision.id)])
         
         # Notify responsible user and admins about new revision
         document = get_document(db, document_id)
@@ -175,6 +224,7 @@ async def upload_revision(
         raise e
 
 
+@traced()
 def soft_delete_document(db: Session, document_id: UUID, user_id: UUID) -> Optional[Document]:
     """Soft delete document by marking it as deleted."""
     document = get_document(db, document_id)
@@ -190,10 +240,12 @@ def soft_delete_document(db: Session, document_id: UUID, user_id: UUID) -> Optio
     document.deleted_by = user_id
     
     db.commit()
+    invalidate_cache(CACHE_SUMMARY)
     db.refresh(document)
     return document
 
 
+@traced()
 def hard_delete_document(db: Session, document_id: UUID) -> bool:
     """Hard delete document and all its files."""
     from app.services.file_storage_service import delete_file
@@ -203,37 +255,42 @@ def hard_delete_document(db: Session, document_id: UUID) -> bool:
         return False
     
     # Delete all revision files
+    revision_ids = [revision.id for revision in document.revisions]
     for revision in document.revisions:
         delete_file(revision.file_storage_uuid)
     
     db.delete(document)
     db.commit()
+    delete_visual_diff_files(revision_ids)
+    invalidate_cache(CACHE_SUMMARY)
     return True
 
 
+@traced()
 def get_revision_file_path(
     db: Session,
     document_id: UUID,
     revision_id: UUID
 ) -> Optional[Tuple[Path, str]]:
     """Get file path and download filename for a revision."""
-    revision = db.query(DocumentRevision).filter(
-        DocumentRevision.id == revision_id,
-        DocumentRevision.document_id == document_id
-    ).first()
-    
-    if not revision:
-        return None
-    
-    # Get document and item for filename
-    document = get_document(db, document_id)
-    if not document or document.is_deleted:
+    # Revision, live document and item part number in one query
+    row = (
+        db.query(DocumentRevision, Item.part_number)
+        .join(Document, Document.id == DocumentRevision.document_id)
+        .join(Item, Item.id == Document.item_id)
+        .filter(
+            DocumentRevision.id == revision_id,
+            DocumentRevision.document_id == document_id,
+            Document.is_deleted == False,
+        )
+        .first()
+    )
+    if not row:
         return None
-    from app.services.item_service import get_item
-    item = get_item(db, document.item_id)
+    revision, part_number = row
     
     # Build download filename: {part_number}_{revision}.pdf
-    filename = f"{item.part_number}_{revision.revision_label}.pdf"
+    filename = f"{part_number}_{revision.revision_label}.pdf"
     
     path = get_file_path(revision.file_storage_uuid)
     if not path.exists():
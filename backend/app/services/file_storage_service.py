@@ -6,9 +6,11 @@ from typing import Dict
 from fastapi import UploadFile
 
 from app.config import settings
+from app.utils.tracing import traced
 from app.utils.validators import stream_file_to_disk, ALLOWED_EXCEL_EXTENSIONS
 
 
+@traced()
 async def save_file(file: UploadFile) -> Dict:
     """Save uploaded file to storage and return metadata."""
     # Generate UUID for storage filename
@@ -39,6 +41,7 @@ def get_file_path(storage_uuid: uuid.UUID) -> Path:
     return Path(settings.FILE_STORAGE_PATH) / f"{storage_uuid}.pdf"
 
 
+@traced()
 def delete_file(storage_uuid: uuid.UUID) -> bool:
     """Delete file from storage."""
     path = get_file_path(storage_uuid)
@@ -48,6 +51,7 @@ def delete_file(storage_uuid: uuid.UUID) -> bool:
     return False
 
 
+@traced()
 async def save_excel_file(file: UploadFile) -> Dict:
     """Save uploaded Excel file to storage and return metadata."""
     file_uuid = uuid.uuid4()
@@ -106,6 +110,7 @@ def get_candidate_paths(storage_uuid: uuid.UUID, extension: str, kind: str = "te
     return paths
 
 
+@traced()
 def delete_excel_file(storage_uuid: uuid.UUID, extension: str) -> bool:
     """Delete Excel file from storage."""
     path = get_excel_file_path(storage_uuid, extension)
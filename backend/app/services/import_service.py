@@ -11,12 +11,16 @@ from app.models.document_revision import DocumentRevision
 from app.models.user import User, UserRole
 from app.models.notification import Notification
 from app.models.project_section import ProjectSection
-from app.services.project_service import get_or_create_section
+from app.services.project_service import get_or_create_sections
 from app.services.file_storage_service import save_file, delete_file
-from app.utils.filename_parser import parse_filename
+from app.services.pdf_text_service import schedule_text_extraction
+from app.utils.cache import CACHE_PROJECTS, CACHE_SECTIONS, CACHE_SUMMARY, invalidate_cache
+from app.utils.filename_parser import FilenameParser
+from app.utils.tracing import start_span, traced
 from app.utils.validators import validate_pdf_header
 
 
+@traced()
 def notify_item_imported(
     db: Session,
     item: Item,
@@ -53,6 +57,15 @@ def notify_item_imported(
         db.add(notification)
 
 
+def _effective_part_number(filename: str, parsed_part_number: Optional[str]) -> str:
+    """Parsed part number, or one generated from the filename (no extension, no spaces)."""
+    if parsed_part_number:
+        return parsed_part_number
+    base_name = filename.rsplit('.', 1)[0] if '.' in filename else filename
+    return base_name.replace(' ', '_')[:100]
+
+
+@traced()
 async def import_items_from_files(
     db: Session,
     project_id: UUID,
@@ -72,6 +85,7 @@ async def import_items_from_files(
     created_count = 0
     errors: List[Dict[str, str]] = []
     saved_files: List[UUID] = []  # Track saved files for cleanup on error
+    new_revisions: List[DocumentRevision] = []  # Queued for text extraction after the commit
     
     # Validate section_id belongs to project_id (early validation before any file processing)
     if section_id is not None:
@@ -86,47 +100,62 @@ async def import_items_from_files(
                 "errors": [{"filename": "batch", "error": f"Section with id '{section_id}' not found or does not belong to project '{project_id}'"}],
             }
     
+    # Validate PDF headers and parse the whole batch up front (non-blocking: failures skip the file)
+    filenames = [file.filename or "unnamed.pdf" for file in files]
+    invalid_files: Dict[int, str] = {}
+    for index, file in enumerate(files):
+        try:
+            await validate_pdf_header(file)
+        except Exception as e:
+            invalid_files[index] = f"Invalid PDF: {str(e)}"
+    
+    batch = FilenameParser().parse_many(filenames)
+    part_numbers = [
+        _effective_part_number(filename, parsed.get("part_number"))
+        for filename, parsed in zip(filenames, batch.results)
+    ]
+    valid_indexes = [index for index in range(len(files)) if index not in invalid_files]
+    
     try:
-        for file in files:
-            filename = file.filename or "unnamed.pdf"
-            
+        # Part numbers already taken; extended with items created by this batch
+        existing_part_numbers = set()
+        candidate_part_numbers = {part_numbers[index] for index in valid_indexes}
+        if candidate_part_numbers:
+            existing_part_numbers = {
+                row[0] for row in db.query(Item.part_number).filter(Item.part_number.in_(candidate_part_numbers))
+            }
+        
+        # Auto-detected sections for the whole batch (not committed: batch transaction)
+        sections_by_code: Dict[str, ProjectSection] = {}
+        if section_id is None:
+            sections_by_code = get_or_create_sections(
+                db,
+                project_id,
+                {batch.results[index]["section_code"] for index in valid_indexes} & batch.section_codes,
+            )
+        
+        for index, (filename, parsed, effective_part_number) in enumerate(zip(filenames, batch.results, part_numbers)):
+            file = files[index]
             try:
-                # Step 1: Validate PDF header (skip file if invalid)
-                try:
-                    await validate_pdf_header(file)
-                except Exception as e:
-                    errors.append({"filename": filename, "error": f"Invalid PDF: {str(e)}"})
+                # Step 1: Skip files that failed PDF header validation
+                if index in invalid_files:
+                    errors.append({"filename": filename, "error": invalid_files[index]})
                     continue
                 
-                # Step 2: Parse filename (non-blocking)
-                parsed = parse_filename(filename)
+                # Step 2: Filename already parsed with the batch
                 parsed_section_code = parsed.get("section_code")
-                parsed_part_number = parsed.get("part_number")
                 parsed_name = parsed.get("name") or filename
                 
                 # Step 3: Determine section_id
                 effective_section_id = section_id
                 if not effective_section_id and parsed_section_code:
-                    # Auto-detect section from parsed_section_code
-                    # Use commit=False to defer commit to batch transaction
-                    section = get_or_create_section(db, project_id, parsed_section_code, commit=False)
+                    section = sections_by_code.get(parsed_section_code)
                     if section:
                         effective_section_id = section.id
                 
-                # Step 4: Determine part_number
-                # If part_number is None after parsing, use filename as part_number
-                effective_part_number = parsed_part_number
-                if not effective_part_number:
-                    # Generate from filename (remove extension, replace spaces)
-                    base_name = filename.rsplit('.', 1)[0] if '.' in filename else filename
-                    effective_part_number = base_name.replace(' ', '_')[:100]
-                
-                # Step 5: Check for duplicate part_number in database
-                existing_item = db.query(Item).filter(
-                    Item.part_number == effective_part_number
-                ).first()
-                
-                if existing_item:
+                # Step 4: part_number computed for the batch (filename fallback if not parsed)
+                # Step 5: Check for duplicate part_number in database or earlier in the batch
+                if effective_part_number in existing_part_numbers:
                     errors.append({"filename": filename, "error": f"Part number '{effective_part_number}' already exists"})
                     continue
                 
@@ -140,6 +169,7 @@ async def import_items_from_files(
                 )
                 db.add(item)
                 db.flush()  # Get item ID
+                existing_part_numbers.add(effective_part_number)
                 
                 # Step 7: Save file using save_file
                 file_info = await save_file(file)
@@ -166,6 +196,7 @@ async def import_items_from_files(
                     author_id=current_user.id,
                 )
                 db.add(revision)
+                new_revisions.append(revision)
                 
                 # Step 10: Notify responsible user and admins
                 notify_item_imported(db, item, responsible_id)
@@ -182,7 +213,12 @@ async def import_items_from_files(
                 continue
         
         # Commit all changes atomically
-        db.commit()
+        db.flush()  # assigns ids to the last revisions for the extraction hook
+        revision_ids = [revision.id for revision in new_revisions]
+        with start_span("db.commit"):
+            db.commit()
+        invalidate_cache(CACHE_PROJECTS, CACHE_SECTIONS, CACHE_SUMMARY)
+        schedule_text_extraction(revision_ids)
         
         return {
             "created_count": created_count,
@@ -1,16 +1,26 @@
+from dataclasses import dataclass
 from uuid import UUID
-from typing import Optional, List
+from typing import AbstractSet, Optional, List, Sequence
 
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, noload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql import Select
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 
-from app.models.item import Item
+from app.models.item import Item, ItemStatus
+from app.models.document import Document
+from app.models.document_revision import DocumentRevision
 from app.models.project import Project
+from app.models.project_section import ProjectSection
 from app.models.user import User
 from app.models.progress_history import ProgressHistory
 from app.schemas.item import ItemCreate, ItemUpdate
 from app.services.notification_service import notify_progress_updated
+from app.utils.cache import CACHE_PROJECTS, CACHE_SUMMARY, invalidate_cache
+from app.utils.http_cache import collection_version
 
 
 def create_item(db: Session, item_data: ItemCreate) -> Item:
@@ -41,6 +51,7 @@ def create_item(db: Session, item_data: ItemCreate) -> Item:
     except IntegrityError:
         db.rollback()
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Failed to create item due to invalid data")
+    invalidate_cache(CACHE_PROJECTS, CACHE_SUMMARY)  # ProjectResponse embeds item summaries
     db.refresh(item)
     return item
 
@@ -50,14 +61,132 @@ def get_item(db: Session, item_id: UUID) -> Optional[Item]:
     return db.query(Item).filter(Item.id == item_id).first()
 
 
-def list_items(db: Session, project_id: Optional[UUID] = None, section_id: Optional[UUID] = None) -> List[Item]:
-    """List items, optionally filtered by project and/or section."""
-    query = db.query(Item)
+@dataclass(frozen=True)
+class ItemFilters:
+    """Optional filters, search and sort of the item listing (all None = no-op)."""
+    statuses: Sequence[ItemStatus] = ()
+    responsible_id: Optional[UUID] = None
+    progress_min: Optional[int] = None
+    progress_max: Optional[int] = None
+    has_documents: Optional[bool] = None
+    search: Optional[str] = None
+    prefix: bool = False
+    sort: Optional[str] = None
+
+
+_ITEM_SORT_COLUMNS = {
+    "part_number": Item.part_number,
+    "name": Item.name,
+    "progress": Item.current_progress,
+    "updated_at": Item.updated_at,
+}
+
+
+def _like_pattern(text: str, prefix: bool) -> str:
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%" if prefix else f"%{escaped}%"
+
+
+def _items_criteria(
+    project_id: Optional[UUID],
+    section_id: Optional[UUID],
+    filters: Optional[ItemFilters] = None,
+) -> list:
+    criteria = []
     if project_id:
-        query = query.filter(Item.project_id == project_id)
+        criteria.append(Item.project_id == project_id)
     if section_id:
-        query = query.filter(Item.section_id == section_id)
-    return query.all()
+        criteria.append(Item.section_id == section_id)
+    if filters is None:
+        return criteria
+    
+    if filters.statuses:
+        criteria.append(Item.status.in_(filters.statuses))
+    if filters.responsible_id:
+        criteria.append(Item.responsible_id == filters.responsible_id)
+    if filters.progress_min is not None:
+        criteria.append(Item.current_progress >= filters.progress_min)
+    if filters.progress_max is not None:
+        criteria.append(Item.current_progress <= filters.progress_max)
+    if filters.has_documents is not None:
+        has_documents = exists().where(Document.item_id == Item.id, Document.is_deleted == False)
+        criteria.append(has_documents if filters.has_documents else ~has_documents)
+    if filters.search:
+        # ILIKE on both columns is served by the gin_trgm_ops indexes (prefix and substring alike)
+        pattern = _like_pattern(filters.search, filters.prefix)
+        criteria.append(or_(
+            Item.part_number.ilike(pattern, escape="\\"),
+            Item.name.ilike(pattern, escape="\\"),
+        ))
+    return criteria
+
+
+def _items_order_by(sort: Optional[str]) -> list:
+    if not sort:
+        return []
+    column = _ITEM_SORT_COLUMNS[sort.lstrip("-")]
+    # Item.id breaks ties so the order is stable between requests
+    if sort.startswith("-"):
+        return [column.desc(), Item.id.desc()]
+    return [column.asc(), Item.id.asc()]
+
+
+def items_query(
+    project_id: Optional[UUID] = None,
+    section_id: Optional[UUID] = None,
+    filters: Optional[ItemFilters] = None,
+) -> Select:
+    """Build the item listing SELECT with every relation rendered by ItemResponse eagerly loaded."""
+    return select(Item).options(
+        selectinload(Item.section),
+        selectinload(Item.responsible),
+        selectinload(Item.documents).selectinload(Document.current_revision),
+    ).where(
+        *_items_criteria(project_id, section_id, filters)
+    ).order_by(
+        *_items_order_by(filters.sort if filters else None)
+    )
+
+
+def items_version_query(project_id: Optional[UUID] = None, section_id: Optional[UUID] = None) -> Select:
+    """One-row SELECT whose values change whenever the items_query response would.
+    
+    Covers the items themselves, their documents and revisions (original_filename),
+    sections (deleting one nulls items.section_id without touching updated_at)
+    and users (responsible name). Versioned over the whole project/section scope
+    rather than the filtered rows: a document upload can move an item into a
+    has_documents filter without touching the item itself.
+    """
+    criteria = _items_criteria(project_id, section_id)
+    item_ids = select(Item.id).where(*criteria)
+    document_ids = select(Document.id).where(Document.item_id.in_(item_ids))
+    return select(
+        *collection_version(Item.updated_at, *criteria),
+        *collection_version(Document.updated_at, Document.item_id.in_(item_ids)),
+        *collection_version(DocumentRevision.uploaded_at, DocumentRevision.document_id.in_(document_ids)),
+        *collection_version(ProjectSection.created_at),
+        *collection_version(User.updated_at),
+    )
+
+
+def list_items(
+    db: Session,
+    project_id: Optional[UUID] = None,
+    section_id: Optional[UUID] = None,
+    filters: Optional[ItemFilters] = None,
+) -> List[Item]:
+    """List items, optionally filtered by project and/or section, filters and search."""
+    return list(db.scalars(items_query(project_id, section_id, filters)).all())
+
+
+async def list_items_async(
+    db: AsyncSession,
+    project_id: Optional[UUID] = None,
+    section_id: Optional[UUID] = None,
+    filters: Optional[ItemFilters] = None,
+) -> List[Item]:
+    """Async variant of list_items for the async engine."""
+    return list((await db.scalars(items_query(project_id, section_id, filters))).all())
 
 
 def update_item(db: Session, item_id: UUID, item_data: ItemUpdate) -> Optional[Item]:
@@ -84,6 +213,7 @@ def update_item(db: Session, item_id: UUID, item_data: ItemUpdate) -> Optional[I
     except IntegrityError:
         db.rollback()
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Failed to update item due to invalid data")
+    invalidate_cache(CACHE_PROJECTS, CACHE_SUMMARY)
     db.refresh(item)
     return item
 
@@ -96,6 +226,7 @@ def delete_item(db: Session, item_id: UUID) -> bool:
     
     db.delete(item)
     db.commit()
+    invalidate_cache(CACHE_PROJECTS, CACHE_SUMMARY)
     return True
 
 
@@ -127,6 +258,7 @@ def update_progress(
     item.current_progress = new_progress
     
     db.commit()
+    invalidate_cache(CACHE_PROJECTS, CACHE_SUMMARY)
     db.refresh(item)
     
     # Notify admins about progress update
@@ -135,9 +267,61 @@ def update_progress(
     return item
 
 
-def get_progress_history(db: Session, item_id: UUID) -> List[ProgressHistory]:
-    """Get progress history for item."""
-    return db.query(ProgressHistory).filter(
+def get_progress_history(db: Session, item_id: UUID, limit: Optional[int] = None) -> List[ProgressHistory]:
+    """Get progress history for item (newest first), with the changing user loaded."""
+    query = select(ProgressHistory).options(
+        joinedload(ProgressHistory.changed_by_user)
+    ).where(
         ProgressHistory.item_id == item_id
-    ).order_by(ProgressHistory.changed_at.desc()).all()
+    ).order_by(ProgressHistory.changed_at.desc()).limit(limit)
+    return list(db.scalars(query).all())
+
+
+@dataclass
+class ItemDetail:
+    item: Item
+    documents: Optional[List[Document]]  # non-deleted, only when requested
+    progress_history: Optional[List[ProgressHistory]]
+
+
+def get_item_detail(
+    db: Session,
+    item_id: UUID,
+    include: AbstractSet[str],
+    history_limit: int = 20
+) -> Optional[ItemDetail]:
+    """Load everything the item page renders in a fixed number of queries.
+    
+    1. item + section + responsible (joined), 2. all its documents,
+    3. their current revisions, 4. all revisions (include "revisions", otherwise empty),
+    5. latest progress history + users (include "progress_history").
+    The documents list is attached to the item, so item_to_response never lazy loads.
+    """
+    item = db.scalars(
+        select(Item).options(
+            joinedload(Item.section),
+            joinedload(Item.responsible),
+        ).where(Item.id == item_id)
+    ).first()
+    if not item:
+        return None
+    
+    document_options = [
+        selectinload(Document.current_revision),
+        selectinload(Document.revisions) if "revisions" in include else noload(Document.revisions),
+    ]
+    all_documents = list(db.scalars(
+        select(Document).options(*document_options).where(Document.item_id == item_id).order_by(Document.created_at)
+    ).all())
+    set_committed_value(item, "documents", all_documents)
+    
+    documents = None
+    if "documents" in include or "revisions" in include:
+        documents = [document for document in all_documents if not document.is_deleted]
+    
+    progress_history = None
+    if "progress_history" in include:
+        progress_history = get_progress_history(db, item_id, limit=history_limit)
+    
+    return ItemDetail(item=item, documents=documents, progress_history=progress_history)
 
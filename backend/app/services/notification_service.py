@@ -2,6 +2,8 @@ from uuid import UUID
 from typing import Optional, List, Any
 from datetime import datetime
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models.notification import Notification
@@ -12,8 +14,10 @@ from app.models.item import Item
 from app.models.tech_document import TechDocument
 from app.models.project_section import ProjectSection
 from app.models.project import Project
+from app.utils.tracing import traced
 
 
+@traced()
 def create_notification(
     db: Session,
     user_id: UUID,
@@ -32,6 +36,7 @@ def create_notification(
     return notification
 
 
+@traced()
 def get_user_notifications(db: Session, user_id: UUID) -> List[Notification]:
     """Get all notifications for a user."""
     return db.query(Notification).filter(
@@ -39,6 +44,18 @@ def get_user_notifications(db: Session, user_id: UUID) -> List[Notification]:
     ).order_by(Notification.created_at.desc()).all()
 
 
+@traced()
+async def get_user_notifications_async(db: AsyncSession, user_id: UUID) -> List[Notification]:
+    """Async variant of get_user_notifications for the async engine."""
+    result = await db.scalars(
+        select(Notification).where(
+            Notification.user_id == user_id
+        ).order_by(Notification.created_at.desc())
+    )
+    return list(result.all())
+
+
+@traced()
 def mark_notification_as_read(
     db: Session,
     notification_id: UUID,
@@ -59,6 +76,7 @@ def mark_notification_as_read(
     return notification
 
 
+@traced()
 def mark_all_notifications_as_read(db: Session, user_id: UUID) -> None:
     """Mark all notifications as read for a user."""
     db.query(Notification).filter(
@@ -68,6 +86,7 @@ def mark_all_notifications_as_read(db: Session, user_id: UUID) -> None:
     db.commit()
 
 
+@traced()
 def notify_revision_uploaded(
     db: Session,
     document: Document,
@@ -100,6 +119,7 @@ def notify_revision_uploaded(
         create_notification(db, admin.id, message, payload)
 
 
+@traced()
 def notify_progress_updated(
     db: Session,
     item: Item,
@@ -121,6 +141,7 @@ def notify_progress_updated(
         create_notification(db, admin.id, message, payload)
 
 
+@traced()
 def notify_document_deleted(
     db: Session,
     document: Document,
@@ -148,6 +169,7 @@ def notify_document_deleted(
         create_notification(db, admin.id, message, payload)
 
 
+@traced()
 def notify_item_updated(
     db: Session,
     item: Item,
@@ -193,6 +215,7 @@ def notify_item_updated(
         create_notification(db, admin.id, message, payload)
 
 
+@traced()
 def notify_tech_document_uploaded(
     db: Session,
     document: TechDocument,
@@ -217,6 +240,7 @@ def notify_tech_document_uploaded(
         create_notification(db, admin.id, message, payload)
 
 
+@traced()
 def notify_tech_document_updated(
     db: Session,
     document: TechDocument,
@@ -243,6 +267,7 @@ def notify_tech_document_updated(
         create_notification(db, admin.id, message, payload)
 
 
+@traced()
 def notify_tech_document_deleted(
     db: Session,
     document: TechDocument,
@@ -267,6 +292,7 @@ def notify_tech_document_deleted(
         create_notification(db, admin.id, message, payload)
 
 
+@traced()
 def notify_tech_section_created(
     db: Session,
     section: ProjectSection,
@@ -290,6 +316,7 @@ def notify_tech_section_created(
         create_notification(db, admin.id, message, payload)
 
 
+@traced()
 def notify_tech_section_deleted(
     db: Session,
     section_id: UUID,
@@ -0,0 +1,149 @@
+import html
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import Numeric, and_, cast, func, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.document import Document
+from app.models.document_revision import DocumentRevision
+from app.models.document_revision_text import DocumentRevisionText
+from app.services.file_storage_service import get_file_path
+from app.services.search_service import decode_cursor, encode_cursor
+from app.utils.background_extraction import BackgroundExtractor
+from app.utils.pdf_text import extract_pdf_text
+from app.utils.search import TEXT_CONFIG, normalize_text, search_tsquery
+
+# \x02/\x03 never occur in stored text (clean_text strips control characters),
+# so the snippet can be HTML-escaped and the markers turned into <mark> safely
+_HEADLINE_OPTIONS = 'StartSel="\x02", StopSel="\x03", MaxFragments=2, MaxWords=25, MinWords=8, FragmentDelimiter=" … "'
+
+
+class PdfTextExtractor(BackgroundExtractor):
+    """Fills document_revision_texts for new revisions."""
+
+    name = "pdf-text"
+    extract = staticmethod(extract_pdf_text)
+
+    def prepare(self, db: Session, revision_id: UUID) -> Optional[Tuple]:
+        revision = db.get(DocumentRevision, revision_id)
+        if revision is None or db.get(DocumentRevisionText, revision_id) is not None:
+            return None
+        return str(get_file_path(revision.file_storage_uuid)), settings.PDF_TEXT_MAX_PAGES, settings.PDF_TEXT_MAX_CHARS
+
+    def store(self, db: Session, revision_id: UUID, status: str, result=None, error: Optional[str] = None) -> None:
+        content, page_count = result if result is not None else ("", None)
+        values = {
+            "status": status,
+            "content": content,
+            "page_count": page_count,
+            "error": error,
+            "extracted_at": datetime.utcnow(),
+        }
+        db.execute(
+            insert(DocumentRevisionText)
+            .values(revision_id=revision_id, **values)
+            .on_conflict_do_update(index_elements=[DocumentRevisionText.revision_id], set_=values)
+        )
+
+    def pending(self, db: Session, limit: int) -> List[UUID]:
+        return list(db.scalars(
+            select(DocumentRevision.id)
+            .outerjoin(DocumentRevisionText, DocumentRevisionText.revision_id == DocumentRevision.id)
+            .where(DocumentRevisionText.revision_id.is_(None))
+            .order_by(DocumentRevision.uploaded_at.desc())
+            .limit(limit)
+        ))
+
+
+pdf_text_extractor = PdfTextExtractor(
+    SessionLocal,
+    workers=settings.TEXT_EXTRACTION_WORKERS,
+    timeout=settings.TEXT_EXTRACTION_TIMEOUT_SECONDS,
+    enabled=settings.TEXT_EXTRACTION_ENABLED,
+)
+
+
+def schedule_text_extraction(revision_ids: Iterable[UUID]) -> None:
+    """Extraction hook for services creating revisions; call after the commit."""
+    pdf_text_extractor.enqueue(revision_ids)
+
+
+def render_snippet(headline: str) -> str:
+    return html.escape(headline).replace("\x02", "<mark>").replace("\x03", "</mark>")
+
+
+def search_revision_texts(
+    db: Session,
+    q: str,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    current_only: bool = False,
+) -> Tuple[List[dict], Optional[str]]:
+    """Revisions whose PDF text matches `q`, best first, with highlighted snippets.
+
+    The page is selected from the GIN index first; ts_headline (which re-parses
+    the whole text) runs only for the `limit` rows returned.
+    """
+    term = normalize_text(q)
+    if not term:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Empty search query")
+    tsquery = search_tsquery(term)
+
+    rank = cast(func.ts_rank_cd(DocumentRevisionText.search_vector, tsquery), Numeric(12, 6)).label("rank")
+    page = (
+        select(DocumentRevisionText.revision_id, rank)
+        .join(DocumentRevision, DocumentRevision.id == DocumentRevisionText.revision_id)
+        .join(Document, Document.id == DocumentRevision.document_id)
+        .where(Document.is_deleted == False, DocumentRevisionText.search_vector.op("@@")(tsquery))
+    )
+    if current_only:
+        page = page.where(DocumentRevision.is_current == True)
+    if cursor:
+        last_rank, _, last_id = decode_cursor(cursor)
+        page = page.where(or_(
+            rank < last_rank,
+            and_(rank == last_rank, DocumentRevisionText.revision_id > last_id),
+        ))
+    page = page.order_by(rank.desc(), DocumentRevisionText.revision_id).limit(limit + 1).subquery("page")
+
+    headline = func.ts_headline(
+        literal_column(f"'{TEXT_CONFIG}'::regconfig"), DocumentRevisionText.content, tsquery, _HEADLINE_OPTIONS
+    )
+    query = (
+        select(
+            DocumentRevision.id.label("revision_id"),
+            Document.id.label("document_id"),
+            Document.item_id,
+            Document.title.label("document_title"),
+            DocumentRevision.revision_label,
+            DocumentRevision.original_filename,
+            DocumentRevision.is_current,
+            DocumentRevisionText.page_count,
+            page.c.rank,
+            headline.label("headline"),
+        )
+        .select_from(page)
+        .join(DocumentRevisionText, DocumentRevisionText.revision_id == page.c.revision_id)
+        .join(DocumentRevision, DocumentRevision.id == page.c.revision_id)
+        .join(Document, Document.id == DocumentRevision.document_id)
+        .order_by(page.c.rank.desc(), page.c.revision_id)
+    )
+
+    rows = []
+    for row in db.execute(query):
+        hit = dict(row._mapping)
+        hit["snippet"] = render_snippet(hit.pop("headline"))
+        rows.append(hit)
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last["rank"], "revision", last["revision_id"])
+    return rows, next_cursor
@@ -1,12 +1,20 @@
 from uuid import UUID
-from typing import Optional, List
+from typing import Any, Dict, Iterable, Optional, List
 
+from sqlalchemy import distinct, exists, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
 from sqlalchemy.exc import IntegrityError
 
+from app.models.document import Document
+from app.models.document_revision import DocumentRevision
+from app.models.item import Item, ItemStatus
 from app.models.project import Project
 from app.models.project_section import ProjectSection
 from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.utils.cache import CACHE_PROJECTS, CACHE_SECTIONS, CACHE_SUMMARY, invalidate_cache
+from app.utils.http_cache import collection_version
 
 
 def create_project(db: Session, project_data: ProjectCreate) -> Project:
@@ -18,6 +26,7 @@ def create_project(db: Session, project_data: ProjectCreate) -> Project:
     )
     db.add(project)
     db.commit()
+    invalidate_cache(CACHE_PROJECTS, CACHE_SUMMARY)
     db.refresh(project)
     return project
 
@@ -43,6 +52,7 @@ def update_project(db: Session, project_id: UUID, project_data: ProjectUpdate) -
         setattr(project, field, value)
     
     db.commit()
+    invalidate_cache(CACHE_PROJECTS, CACHE_SUMMARY)
     db.refresh(project)
     return project
 
@@ -55,6 +65,7 @@ def delete_project(db: Session, project_id: UUID) -> bool:
     
     db.delete(project)
     db.commit()
+    invalidate_cache(CACHE_PROJECTS, CACHE_SECTIONS, CACHE_SUMMARY)
     return True
 
 
@@ -65,7 +76,8 @@ def create_section(db: Session, project_id: UUID, code: str, commit: bool = True
         db: Database session
         project_id: Project UUID
         code: Section code
-        commit: If True, commit transaction. If False, only flush (for batch operations).
+        commit: If True, commit transaction. If False, only flush (for batch operations);
+            the caller then invalidates the projects/sections cache after its commit.
     """
     existing = db.query(ProjectSection).filter(
         ProjectSection.project_id == project_id,
@@ -84,6 +96,7 @@ def create_section(db: Session, project_id: UUID, code: str, commit: bool = True
         db.add(section)
         if commit:
             db.commit()
+            invalidate_cache(CACHE_PROJECTS, CACHE_SECTIONS)
             db.refresh(section)
         else:
             db.flush()  # Get section.id without committing
@@ -105,6 +118,14 @@ def list_sections(db: Session, project_id: UUID) -> List[ProjectSection]:
     ).all()
 
 
+def sections_version_query(project_id: UUID) -> Select:
+    """One-row SELECT: project exists, then the version of its section list."""
+    return select(
+        exists().where(Project.id == project_id),
+        *collection_version(ProjectSection.created_at, ProjectSection.project_id == project_id),
+    )
+
+
 def get_or_create_section(db: Session, project_id: UUID, code: str, commit: bool = True) -> ProjectSection:
     """Get existing section or create new one (helper for import).
     
@@ -117,6 +138,38 @@ def get_or_create_section(db: Session, project_id: UUID, code: str, commit: bool
     return create_section(db, project_id, code, commit=commit)
 
 
+def get_or_create_sections(db: Session, project_id: UUID, codes: Iterable[str]) -> Dict[str, ProjectSection]:
+    """Get or create sections for many codes at once (import batches); returns code -> section.
+    
+    One INSERT ... ON CONFLICT DO NOTHING RETURNING creates the missing sections
+    and one SELECT loads those that already existed, so concurrent imports never
+    hit IntegrityError. Does not commit: the caller's transaction owns the rows
+    and invalidates the projects/sections cache after committing.
+    """
+    unique_codes = sorted(set(codes))  # stable order: concurrent batches lock rows in the same order
+    if not unique_codes:
+        return {}
+    
+    created = db.scalars(
+        pg_insert(ProjectSection)
+        .on_conflict_do_nothing(constraint="uq_project_section_code")
+        .returning(ProjectSection),
+        [{"project_id": project_id, "code": code} for code in unique_codes],
+    ).all()
+    sections = {section.code: section for section in created}
+    
+    missing = [code for code in unique_codes if code not in sections]
+    if missing:
+        existing = db.scalars(
+            select(ProjectSection).where(
+                ProjectSection.project_id == project_id,
+                ProjectSection.code.in_(missing)
+            )
+        )
+        sections.update((section.code, section) for section in existing)
+    return sections
+
+
 def delete_section(db: Session, section_id: UUID) -> bool:
     """Delete section."""
     section = db.query(ProjectSection).filter(ProjectSection.id == section_id).first()
@@ -125,5 +178,86 @@ def delete_section(db: Session, section_id: UUID) -> bool:
 
     db.delete(section)
     db.commit()
+    invalidate_cache(CACHE_PROJECTS, CACHE_SECTIONS, CACHE_SUMMARY)
     return True
 
+
+
+def project_summaries_query(project_ids: Optional[List[UUID]] = None):
+    """Per-project and per-section item/document aggregates in one grouped SELECT.
+    
+    GROUPING SETS produce one row per project (grouping(section_id) = 1) and
+    one row per (project, section) with items; projects without items still
+    get their project row thanks to the outer join.
+    """
+    document_counts = (
+        select(
+            Document.item_id,
+            func.count(distinct(Document.id)).label("documents"),
+            func.count(DocumentRevision.id).label("revisions"),
+        )
+        .outerjoin(DocumentRevision, DocumentRevision.document_id == Document.id)
+        .where(Document.is_deleted == False)
+        .group_by(Document.item_id)
+        .subquery()
+    )
+    project_key = (Project.id, Project.name, Project.status)
+    query = (
+        select(
+            *project_key,
+            Item.section_id,
+            ProjectSection.code,
+            func.grouping(Item.section_id).label("is_project_row"),
+            func.count(Item.id).label("items_count"),
+            *(func.count(Item.id).filter(Item.status == status).label(f"status_{status.value}") for status in ItemStatus),
+            func.count(Item.id).filter(Item.current_progress == 100).label("completed_items"),
+            func.avg(Item.current_progress).label("average_progress"),
+            func.avg(Item.docs_completion_percent).label("average_docs_completion"),
+            func.coalesce(func.sum(document_counts.c.documents), 0).label("documents_count"),
+            func.coalesce(func.sum(document_counts.c.revisions), 0).label("revisions_count"),
+        )
+        .select_from(Project)
+        .outerjoin(Item, Item.project_id == Project.id)
+        .outerjoin(ProjectSection, ProjectSection.id == Item.section_id)
+        .outerjoin(document_counts, document_counts.c.item_id == Item.id)
+        .group_by(func.grouping_sets(
+            tuple_(*project_key),
+            tuple_(*project_key, Item.section_id, ProjectSection.code),
+        ))
+        .order_by(Project.name, Project.id, ProjectSection.code.nulls_first())
+    )
+    if project_ids:
+        query = query.where(Project.id.in_(project_ids))
+    return query
+
+
+def _round(value) -> Optional[float]:
+    return round(float(value), 1) if value is not None else None
+
+
+def _aggregates(row) -> Dict[str, Any]:
+    return {
+        "items_count": row.items_count,
+        "status_counts": {status.value: getattr(row, f"status_{status.value}") for status in ItemStatus},
+        "completed_items": row.completed_items,
+        "average_progress": _round(row.average_progress),
+        "average_docs_completion": _round(row.average_docs_completion),
+        "documents_count": int(row.documents_count),
+        "revisions_count": int(row.revisions_count),
+    }
+
+
+def project_summaries(db: Session, project_ids: Optional[List[UUID]] = None) -> List[Dict[str, Any]]:
+    """Dashboard aggregates for the given projects (all projects if None), shaped as ProjectSummaryResponse."""
+    summaries: Dict[UUID, Dict[str, Any]] = {}
+    sections: Dict[UUID, List[Dict[str, Any]]] = {}
+    for row in db.execute(project_summaries_query(project_ids)):
+        if row.is_project_row:
+            summaries[row.id] = {"project_id": row.id, "name": row.name, "status": row.status, **_aggregates(row)}
+        elif row.items_count:
+            sections.setdefault(row.id, []).append(
+                {"section_id": row.section_id, "section_code": row.code, **_aggregates(row)}
+            )
+    for project_id, summary in summaries.items():
+        summary["sections"] = sections.get(project_id, [])
+    return list(summaries.values())
@@ -0,0 +1,92 @@
+from datetime import datetime, timezone
+from typing import Callable, Iterator, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import Select, and_, select
+
+from app.models.document import Document
+from app.models.document_revision import DocumentRevision
+from app.models.item import Item
+from app.models.project_section import ProjectSection
+from app.models.user import User
+
+REGISTER_FORMATS = ("xlsx", "csv")
+REGISTER_COLUMNS = (
+    "Обозначение",
+    "Наименование",
+    "Раздел",
+    "Статус",
+    "Прогресс, %",
+    "Документ",
+    "Ревизия",
+    "Загружена (UTC)",
+    "Автор",
+)
+# Rows fetched per round trip from the server-side cursor
+REGISTER_BATCH_SIZE = 1000
+
+
+def register_query(project_id: UUID, section_id: Optional[UUID] = None) -> Select:
+    """One row per live document with its current revision; items without documents get one empty row."""
+    query = (
+        select(
+            Item.part_number,
+            Item.name,
+            ProjectSection.code,
+            Item.status,
+            Item.current_progress,
+            Document.title,
+            DocumentRevision.revision_label,
+            DocumentRevision.uploaded_at,
+            User.full_name,
+        )
+        .select_from(Item)
+        .outerjoin(ProjectSection, ProjectSection.id == Item.section_id)
+        .outerjoin(Document, and_(Document.item_id == Item.id, Document.is_deleted == False))
+        .outerjoin(DocumentRevision, and_(DocumentRevision.document_id == Document.id, DocumentRevision.is_current == True))
+        .outerjoin(User, User.id == DocumentRevision.author_id)
+        .where(Item.project_id == project_id)
+        .order_by(Item.part_number, Document.created_at, Document.id)
+    )
+    if section_id is not None:
+        query = query.where(Item.section_id == section_id)
+    return query
+
+
+def _utc(value: Optional[datetime]) -> Optional[datetime]:
+    # Excel has no time zones: timestamps are exported as naive UTC
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.replace(microsecond=0)
+
+
+def iter_register_rows(
+    session_factory: Callable,
+    project_id: UUID,
+    section_id: Optional[UUID] = None,
+    text_dates: bool = False,
+) -> Iterator[Tuple]:
+    """Register rows read through a server-side cursor (`yield_per`).
+
+    Runs with its own session: the generator is consumed by a
+    StreamingResponse after the request's session has been closed.
+    """
+    with session_factory() as db:
+        result = db.execute(register_query(project_id, section_id).execution_options(yield_per=REGISTER_BATCH_SIZE))
+        for part_number, name, section_code, item_status, progress, title, label, uploaded_at, author in result:
+            uploaded_at = _utc(uploaded_at)
+            if text_dates and uploaded_at is not None:
+                uploaded_at = uploaded_at.isoformat(sep=" ", timespec="seconds")
+            yield (
+                part_number,
+                name,
+                section_code or "",
+                item_status.value,
+                progress,
+                title or "",
+                label or "",
+                uploaded_at or "",
+                author or "",
+            )
@@ -0,0 +1,152 @@
+import base64
+import json
+from decimal import Decimal, InvalidOperation
+from typing import AbstractSet, Any, Callable, List, Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import Numeric, and_, cast, func, literal, null, or_, select, tuple_, union_all
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from app.models.document import Document
+from app.models.document_revision import DocumentRevision
+from app.models.item import Item
+from app.models.project_section import ProjectSection
+from app.models.tech_document import TechDocument
+from app.utils.search import normalize_text, search_tsquery
+
+# Cursor: (rank, kind, id) of the last hit of the previous page
+Cursor = Tuple[Decimal, str, Any]
+
+
+def encode_cursor(rank: Decimal, kind: str, hit_id: Any) -> str:
+    raw = json.dumps([str(rank), kind, str(hit_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, id_type: Callable[[str], Any] = UUID) -> Cursor:
+    try:
+        rank, kind, hit_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return Decimal(rank), str(kind), id_type(hit_id)
+    except (ValueError, TypeError, InvalidOperation):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def _like_pattern(text: str) -> str:
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def match_clause(vector, tsquery, term: str, *columns):
+    """Full-text match on the stored vector, or substring/fuzzy match on the raw columns.
+
+    Each arm is served by an index: GIN on search_vector, gin_trgm_ops on the columns.
+    """
+    pattern = _like_pattern(term)
+    return or_(
+        vector.op("@@")(tsquery),
+        *(column.ilike(pattern, escape="\\") for column in columns),
+        *(literal(term).op("<%")(column) for column in columns),
+    )
+
+
+def rank_expression(vector, tsquery, term: str, *columns):
+    similarities = [func.word_similarity(term, column) for column in columns]
+    similarity = func.greatest(*similarities) if len(similarities) > 1 else similarities[0]
+    # numeric(12, 6): exact comparison when the rank round-trips through the cursor
+    return cast(func.ts_rank_cd(vector, tsquery) + similarity, Numeric(12, 6))
+
+
+def _hit_columns(kind: str, id_, title, subtitle, project_id, section_id, item_id, document_id, rank) -> list:
+    return [
+        literal(kind).label("kind"),
+        id_.label("id"),
+        title.label("title"),
+        subtitle.label("subtitle"),
+        project_id.label("project_id"),
+        section_id.label("section_id"),
+        item_id.label("item_id"),
+        document_id.label("document_id"),
+        rank.label("rank"),
+    ]
+
+
+def search_query(q: str, kinds: AbstractSet[str]) -> Select:
+    """UNION ALL of the per-table matches as one subquery-ready SELECT, unordered."""
+    term = normalize_text(q)
+    tsquery = search_tsquery(term)
+    branches = []
+
+    if "item" in kinds:
+        branches.append(select(*_hit_columns(
+            "item", Item.id, Item.part_number, Item.name,
+            Item.project_id, Item.section_id, Item.id, null(),
+            rank_expression(Item.search_vector, tsquery, term, Item.part_number, Item.name),
+        )).where(match_clause(Item.search_vector, tsquery, term, Item.part_number, Item.name)))
+
+    if "document" in kinds:
+        branches.append(select(*_hit_columns(
+            "document", Document.id, Document.title, Item.part_number,
+            Item.project_id, Item.section_id, Item.id, Document.id,
+            rank_expression(Document.search_vector, tsquery, term, Document.title),
+        )).join(Item, Item.id == Document.item_id).where(
+            Document.is_deleted == False,
+            match_clause(Document.search_vector, tsquery, term, Document.title),
+        ))
+
+    if "revision" in kinds:
+        branches.append(select(*_hit_columns(
+            "revision", DocumentRevision.id, DocumentRevision.original_filename, Document.title,
+            Item.project_id, Item.section_id, Item.id, Document.id,
+            rank_expression(DocumentRevision.search_vector, tsquery, term, DocumentRevision.original_filename),
+        )).join(Document, Document.id == DocumentRevision.document_id).join(Item, Item.id == Document.item_id).where(
+            Document.is_deleted == False,
+            match_clause(DocumentRevision.search_vector, tsquery, term, DocumentRevision.original_filename),
+        ))
+
+    if "tech_document" in kinds:
+        branches.append(select(*_hit_columns(
+            "tech_document", TechDocument.id, TechDocument.filename, ProjectSection.code,
+            ProjectSection.project_id, ProjectSection.id, null(), null(),
+            rank_expression(TechDocument.search_vector, tsquery, term, TechDocument.filename),
+        )).join(ProjectSection, ProjectSection.id == TechDocument.section_id).where(
+            TechDocument.is_deleted == False,
+            match_clause(TechDocument.search_vector, tsquery, term, TechDocument.filename),
+        ))
+
+    return union_all(*branches) if len(branches) > 1 else branches[0]
+
+
+def search(
+    db: Session,
+    q: str,
+    kinds: AbstractSet[str],
+    limit: int = 20,
+    cursor: Optional[str] = None,
+) -> Tuple[List[dict], Optional[str]]:
+    """Ranked hits across items, documents, revisions and tech documents with keyset pagination.
+
+    Ordered by rank (desc), then kind and id so that equal ranks page stably.
+    Returns (hits, next_cursor); next_cursor is None on the last page.
+    """
+    if not normalize_text(q):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Empty search query")
+
+    hits = search_query(q, kinds).subquery("hits")
+    query = select(hits)
+    if cursor:
+        rank, kind, hit_id = decode_cursor(cursor)
+        query = query.where(or_(
+            hits.c.rank < rank,
+            and_(hits.c.rank == rank, tuple_(hits.c.kind, hits.c.id) > tuple_(kind, hit_id)),
+        ))
+    query = query.order_by(hits.c.rank.desc(), hits.c.kind, hits.c.id).limit(limit + 1)
+
+    rows = [dict(row._mapping) for row in db.execute(query)]
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last["rank"], last["kind"], last["id"])
+    return rows, next_cursor
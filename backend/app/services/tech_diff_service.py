@@ -0,0 +1,94 @@
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+import orjson
+
+from app.services.tech_sheet_service import ensure_snapshot, snapshot_path
+from app.utils.columnar_snapshot import ColumnarSnapshot, SheetSnapshot
+from app.utils.sheet_diff import diff_sheet
+
+# Row entries listed per sheet; counters in the response stay exact
+MAX_CHANGES_PER_SHEET = 2000
+
+_diff_locks: Dict[str, threading.Lock] = {}
+_diff_locks_guard = threading.Lock()
+
+
+class _SheetRows:
+    """Sequence view of snapshot rows, decoded on access."""
+
+    def __init__(self, sheet: SheetSnapshot):
+        self.sheet = sheet
+
+    def __len__(self) -> int:
+        return self.sheet.row_count
+
+    def __getitem__(self, row: int) -> List[str]:
+        return self.sheet.row(row)
+
+
+def diff_path(from_sha256: str, to_sha256: str) -> Path:
+    return snapshot_path(from_sha256).parent / "diffs" / f"{from_sha256}-{to_sha256}.json"
+
+
+def diff_snapshots(old: ColumnarSnapshot, new: ColumnarSnapshot) -> Dict:
+    """Sheet-level status plus row/cell changes of every sheet present in both workbooks."""
+    old_sheets = {sheet.name: sheet for sheet in old.sheets}
+    new_names = {sheet.name for sheet in new.sheets}
+    sheets = []
+    for sheet in new.sheets:
+        previous = old_sheets.get(sheet.name)
+        if previous is None:
+            sheets.append({"name": sheet.name, "status": "added", "rows_added": sheet.row_count,
+                           "rows_removed": 0, "rows_changed": 0, "changes": [], "truncated": False})
+            continue
+        diff = diff_sheet(_SheetRows(previous), _SheetRows(sheet), MAX_CHANGES_PER_SHEET)
+        changed = diff["rows_added"] or diff["rows_removed"] or diff["rows_changed"]
+        sheets.append({"name": sheet.name, "status": "changed" if changed else "unchanged", **diff})
+    for sheet in old.sheets:
+        if sheet.name not in new_names:
+            sheets.append({"name": sheet.name, "status": "removed", "rows_added": 0,
+                           "rows_removed": sheet.row_count, "rows_changed": 0, "changes": [], "truncated": False})
+    return {"identical": all(sheet["status"] == "unchanged" for sheet in sheets), "sheets": sheets}
+
+
+def _write_atomic(path: Path, body: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, temp_name = tempfile.mkstemp(dir=path.parent, prefix=".diff-")
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(body)
+        os.replace(temp_name, path)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+        raise
+
+
+def load_diff(from_path: Path, from_sha256: str, to_path: Path, to_sha256: str) -> bytes:
+    """Serialized diff of two workbook contents, computed once per (sha256, sha256) pair.
+
+    Diffs are stored as JSON next to the snapshots: content hashes never
+    change meaning, so the cache needs no invalidation and is shared by
+    every worker and every document with the same pair of files.
+    """
+    path = diff_path(from_sha256, to_sha256)
+    if path.exists():
+        return path.read_bytes()
+
+    with _diff_locks_guard:
+        lock = _diff_locks.setdefault(path.name, threading.Lock())
+    try:
+        with lock:
+            if not path.exists():
+                # Private instances: the shared LRU may evict its copies mid-diff
+                old = ColumnarSnapshot(ensure_snapshot(from_path, from_sha256))
+                new = ColumnarSnapshot(ensure_snapshot(to_path, to_sha256))
+                _write_atomic(path, orjson.dumps(diff_snapshots(old, new)))
+    finally:
+        with _diff_locks_guard:
+            _diff_locks.pop(path.name, None)
+    return path.read_bytes()
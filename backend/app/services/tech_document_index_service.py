@@ -0,0 +1,227 @@
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from openpyxl.utils import get_column_letter
+from sqlalchemy import and_, delete, literal, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.project_section import ProjectSection
+from app.models.tech_document import TechDocument
+from app.models.tech_document_cell import TechDocumentCell
+from app.models.tech_document_index import TechDocumentIndex
+from app.models.tech_document_version import TechDocumentVersion
+from app.services.file_storage_service import get_excel_file_path
+from app.services.search_service import decode_cursor, encode_cursor, match_clause, rank_expression
+from app.utils.background_extraction import STATUS_DONE, BackgroundExtractor
+from app.utils.excel_cells import extract_excel_cells
+from app.utils.search import normalize_text, search_tsquery
+
+# Key of the indexer queue: (tech document id, version)
+VersionKey = Tuple[UUID, int]
+
+_CELL_COLUMNS = ("document_id", "version", "sheet", "row_number", "column_number", "value")
+_INSERT_BATCH = 5000
+
+
+def get_version_source(db: Session, document_id: UUID, version: int) -> Optional[Tuple[UUID, str, str]]:
+    """(storage_uuid, extension, sha256) of a version: current one in tech_documents, older ones archived."""
+    document = db.get(TechDocument, document_id)
+    if document is None:
+        return None
+    if document.version == version:
+        return document.storage_uuid, document.file_extension, document.sha256
+    archived = db.scalars(
+        select(TechDocumentVersion).where(
+            TechDocumentVersion.document_id == document_id,
+            TechDocumentVersion.version == version,
+        )
+    ).first()
+    if archived is None:
+        return None
+    return archived.storage_uuid, archived.file_extension, archived.sha256
+
+
+class ExcelCellIndexer(BackgroundExtractor):
+    """Fills tech_document_cells for new tech document versions.
+
+    Versions whose sha256 was already indexed (a re-uploaded workbook, a copy
+    in another section) are not parsed again: their cells are copied in SQL.
+    """
+
+    name = "excel-cells"
+    extract = staticmethod(extract_excel_cells)
+
+    def prepare(self, db: Session, key: VersionKey) -> Optional[Tuple]:
+        document_id, version = key
+        if db.get(TechDocumentIndex, (document_id, version)) is not None:
+            return None
+        source = get_version_source(db, document_id, version)
+        if source is None:
+            return None
+        storage_uuid, extension, sha256 = source
+
+        indexed = db.scalars(
+            select(TechDocumentIndex).where(
+                TechDocumentIndex.sha256 == sha256,
+                TechDocumentIndex.status == STATUS_DONE,
+            ).limit(1)
+        ).first()
+        if indexed is not None:
+            self._copy_cells(db, indexed, document_id, version)
+            db.commit()
+            return None
+        return str(get_excel_file_path(storage_uuid, extension)), settings.EXCEL_INDEX_MAX_CELLS
+
+    def _copy_cells(self, db: Session, source: TechDocumentIndex, document_id: UUID, version: int) -> None:
+        db.execute(
+            insert(TechDocumentCell).from_select(
+                list(_CELL_COLUMNS),
+                select(
+                    literal(document_id),
+                    literal(version),
+                    TechDocumentCell.sheet,
+                    TechDocumentCell.row_number,
+                    TechDocumentCell.column_number,
+                    TechDocumentCell.value,
+                ).where(
+                    TechDocumentCell.document_id == source.document_id,
+                    TechDocumentCell.version == source.version,
+                ),
+            )
+        )
+        self._store_index(db, document_id, version, source.sha256, STATUS_DONE, source.cell_count, None)
+
+    def store(self, db: Session, key: VersionKey, status: str, result=None, error: Optional[str] = None) -> None:
+        document_id, version = key
+        source = get_version_source(db, document_id, version)
+        if source is None:
+            return
+        cells = result or []
+        # Re-runs (another worker process, a retried backfill) replace the cells
+        db.execute(delete(TechDocumentCell).where(
+            TechDocumentCell.document_id == document_id,
+            TechDocumentCell.version == version,
+        ))
+        for start in range(0, len(cells), _INSERT_BATCH):
+            db.execute(insert(TechDocumentCell), [
+                dict(zip(_CELL_COLUMNS, (document_id, version, *cell)))
+                for cell in cells[start:start + _INSERT_BATCH]
+            ])
+        self._store_index(db, document_id, version, source[2], status, len(cells), error)
+
+    def _store_index(
+        self,
+        db: Session,
+        document_id: UUID,
+        version: int,
+        sha256: str,
+        status: str,
+        cell_count: int,
+        error: Optional[str],
+    ) -> None:
+        values = {
+            "sha256": sha256,
+            "status": status,
+            "cell_count": cell_count,
+            "error": error,
+            "indexed_at": datetime.utcnow(),
+        }
+        db.execute(
+            insert(TechDocumentIndex)
+            .values(document_id=document_id, version=version, **values)
+            .on_conflict_do_update(index_elements=[TechDocumentIndex.document_id, TechDocumentIndex.version], set_=values)
+        )
+
+    def pending(self, db: Session, limit: int) -> List[VersionKey]:
+        """Current versions of live documents without an index."""
+        rows = db.execute(
+            select(TechDocument.id, TechDocument.version)
+            .outerjoin(TechDocumentIndex, and_(
+                TechDocumentIndex.document_id == TechDocument.id,
+                TechDocumentIndex.version == TechDocument.version,
+            ))
+            .where(TechDocument.is_deleted == False, TechDocumentIndex.document_id.is_(None))
+            .order_by(TechDocument.created_at.desc())
+            .limit(limit)
+        )
+        return [(document_id, version) for document_id, version in rows]
+
+
+excel_cell_indexer = ExcelCellIndexer(
+    SessionLocal,
+    workers=settings.TEXT_EXTRACTION_WORKERS,
+    timeout=settings.TEXT_EXTRACTION_TIMEOUT_SECONDS,
+    enabled=settings.TEXT_EXTRACTION_ENABLED,
+)
+
+
+def schedule_cell_indexing(keys: Iterable[VersionKey]) -> None:
+    """Indexing hook for tech document uploads; call after the commit."""
+    excel_cell_indexer.enqueue(keys)
+
+
+def search_tech_cells(
+    db: Session,
+    q: str,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    section_id: Optional[UUID] = None,
+    all_versions: bool = False,
+) -> Tuple[List[dict], Optional[str]]:
+    """Cells of live tech documents matching `q`, best first (current versions unless `all_versions`)."""
+    term = normalize_text(q)
+    if not term:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Empty search query")
+    tsquery = search_tsquery(term)
+
+    hits = (
+        select(
+            TechDocumentCell.id,
+            TechDocumentCell.document_id,
+            TechDocument.filename,
+            TechDocumentCell.version,
+            (TechDocumentCell.version == TechDocument.version).label("is_current_version"),
+            TechDocument.section_id,
+            ProjectSection.project_id,
+            TechDocumentCell.sheet,
+            TechDocumentCell.row_number,
+            TechDocumentCell.column_number,
+            TechDocumentCell.value,
+            rank_expression(TechDocumentCell.search_vector, tsquery, term, TechDocumentCell.value).label("rank"),
+        )
+        .join(TechDocument, TechDocument.id == TechDocumentCell.document_id)
+        .join(ProjectSection, ProjectSection.id == TechDocument.section_id)
+        .where(
+            TechDocument.is_deleted == False,
+            match_clause(TechDocumentCell.search_vector, tsquery, term, TechDocumentCell.value),
+        )
+    )
+    if not all_versions:
+        hits = hits.where(TechDocumentCell.version == TechDocument.version)
+    if section_id:
+        hits = hits.where(TechDocument.section_id == section_id)
+    hits = hits.subquery("hits")
+
+    query = select(hits)
+    if cursor:
+        rank, _, cell_id = decode_cursor(cursor, id_type=int)
+        query = query.where(or_(hits.c.rank < rank, and_(hits.c.rank == rank, hits.c.id > cell_id)))
+    query = query.order_by(hits.c.rank.desc(), hits.c.id).limit(limit + 1)
+
+    rows = []
+    for row in db.execute(query):
+        hit = dict(row._mapping)
+        hit["cell"] = f"{get_column_letter(hit['column_number'])}{hit['row_number']}"
+        rows.append(hit)
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last["rank"], "cell", last["id"])
+    return rows, next_cursor
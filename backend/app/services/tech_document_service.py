@@ -3,13 +3,20 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import UploadFile, HTTPException, status
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.sql import Select
 
 from app.models.tech_document import TechDocument
 from app.models.tech_document_version import TechDocumentVersion
+from app.models.user import User
 from app.services.file_storage_service import save_excel_file, delete_excel_file
+from app.services.tech_document_index_service import schedule_cell_indexing
+from app.utils.http_cache import collection_version
+from app.utils.tracing import start_span, traced
 
 
+@traced()
 def list_documents(db: Session, section_id: UUID) -> List[TechDocument]:
     """List current tech documents for a section."""
     return db.query(TechDocument).options(
@@ -21,6 +28,25 @@ def list_documents(db: Session, section_id: UUID) -> List[TechDocument]:
     ).all()
 
 
+def documents_version_query(section_id: UUID) -> Select:
+    """One-row SELECT whose values change whenever the list_documents response would.
+    
+    Tech documents are updated in place (new version bumps `version`, not
+    created_at), so the sum of versions is part of the token.
+    """
+    criteria = (
+        TechDocument.section_id == section_id,
+        TechDocument.is_deleted == False,
+        TechDocument.is_current == True,
+    )
+    return select(
+        *collection_version(TechDocument.created_at, *criteria),
+        select(func.sum(TechDocument.version)).where(*criteria).scalar_subquery(),
+        *collection_version(User.updated_at),
+    )
+
+
+@traced()
 async def upload_document(
     db: Session,
     section_id: UUID,
@@ -43,15 +69,18 @@ async def upload_document(
             created_by=user_id,
         )
         db.add(document)
-        db.commit()
+        with start_span("db.commit"):
+            db.commit()
         db.refresh(document)
-        return document
     except Exception:
         db.rollback()
         delete_excel_file(file_info["uuid"], file_info["extension"])
         raise
+    schedule_cell_indexing([(document.id, document.version)])
+    return document
 
 
+@traced()
 def get_document(db: Session, document_id: UUID) -> Optional[TechDocument]:
     """Get tech document by ID."""
     return db.query(TechDocument).options(
@@ -59,6 +88,7 @@ def get_document(db: Session, document_id: UUID) -> Optional[TechDocument]:
     ).filter(TechDocument.id == document_id).first()
 
 
+@traced()
 async def update_document(
     db: Session,
     document_id: UUID,
@@ -98,16 +128,19 @@ async def update_document(
         document.version = document.version + 1
         document.is_current = True
 
-        db.commit()
+        with start_span("db.commit"):
+            db.commit()
         db.refresh(document)
-        return document
     except Exception:
         db.rollback()
         if file_info:
             delete_excel_file(file_info["uuid"], file_info["extension"])
         raise
+    schedule_cell_indexing([(document.id, document.version)])
+    return document
 
 
+@traced()
 def delete_document(db: Session, document_id: UUID, user_id: UUID, mode: str) -> bool:
     """Delete tech document (soft delete by default)."""
     document = get_document(db, document_id)
@@ -130,6 +163,7 @@ def delete_document(db: Session, document_id: UUID, user_id: UUID, mode: str) ->
     return True
 
 
+@traced()
 def list_versions(db: Session, document_id: UUID) -> List[TechDocumentVersion]:
     """List tech document versions."""
     return db.query(TechDocumentVersion).options(
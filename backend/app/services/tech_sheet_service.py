@@ -0,0 +1,199 @@
+import math
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from fastapi import HTTPException, status
+from openpyxl.utils import column_index_from_string
+
+from app.config import settings
+from app.utils.columnar_snapshot import ColumnarSnapshot, SheetSnapshot, build_snapshot, fold
+
+# Open snapshots kept mapped between requests (one mmap each, pages are shared via the OS cache)
+_OPEN_SNAPSHOTS = 32
+
+_FILTER_PATTERN = re.compile(r"^([A-Za-z]{1,3})(~|!=|>=|<=|=|>|<)(.*)$", re.DOTALL)
+_NUMERIC_OPERATORS = {">", "<", ">=", "<="}
+
+_snapshots: "OrderedDict[str, ColumnarSnapshot]" = OrderedDict()
+_snapshots_lock = threading.Lock()
+_build_locks: Dict[str, threading.Lock] = {}
+
+
+@dataclass(frozen=True)
+class SheetFilter:
+    column: int  # 0-based
+    operator: str
+    value: str
+
+
+def snapshot_path(sha256: str) -> Path:
+    storage_root = settings.TECH_FILE_STORAGE_PATH or settings.FILE_STORAGE_PATH
+    return Path(storage_root) / "snapshots" / f"{sha256}.colsnap"
+
+
+def ensure_snapshot(xlsx_path: Path, sha256: str) -> Path:
+    """Path of the snapshot of a workbook version, building it on first use."""
+    path = snapshot_path(sha256)
+    if path.exists():
+        return path
+    with _snapshots_lock:
+        build_lock = _build_locks.setdefault(sha256, threading.Lock())
+    try:
+        with build_lock:
+            if not path.exists():
+                try:
+                    build_snapshot(xlsx_path, path)
+                except Exception as exc:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"Failed to parse Excel file: {str(exc)}"
+                    )
+    finally:
+        with _snapshots_lock:
+            _build_locks.pop(sha256, None)
+    return path
+
+
+def load_snapshot(xlsx_path: Path, sha256: str) -> ColumnarSnapshot:
+    """Snapshot of a workbook version, shared by content hash and kept open in an LRU.
+
+    Eviction only drops the LRU reference: requests still holding the
+    snapshot keep using it, and the mapping is released with the last reference.
+    """
+    with _snapshots_lock:
+        snapshot = _snapshots.get(sha256)
+        if snapshot is not None:
+            _snapshots.move_to_end(sha256)
+            return snapshot
+
+    path = ensure_snapshot(xlsx_path, sha256)
+    with _snapshots_lock:
+        snapshot = _snapshots.get(sha256)
+        if snapshot is None:
+            snapshot = _snapshots[sha256] = ColumnarSnapshot(path)
+            while len(_snapshots) > _OPEN_SNAPSHOTS:
+                _snapshots.popitem(last=False)
+        return snapshot
+
+
+def parse_filters(filters: Sequence[str]) -> List[SheetFilter]:
+    """Parse `B~сверл`, `C>=10`, `A=005` style filters (column letter, operator, value)."""
+    parsed = []
+    for raw in filters:
+        match = _FILTER_PATTERN.match(raw)
+        if not match:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid filter: {raw}")
+        letters, operator, value = match.groups()
+        if operator == "~" and not value:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Filter value is required: {raw}")
+        if operator in _NUMERIC_OPERATORS and math.isnan(_parse_number(value)):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Filter value must be a number: {raw}")
+        parsed.append(SheetFilter(column_index_from_string(letters.upper()) - 1, operator, value))
+    return parsed
+
+
+def _parse_number(value: str) -> float:
+    try:
+        return float(value.strip().replace(",", "."))
+    except ValueError:
+        return math.nan
+
+
+def _column(sheet: SheetSnapshot, letter_index: int):
+    if letter_index >= sheet.column_count:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Unknown column")
+    return sheet.columns[letter_index]
+
+
+def _filter_rows(sheet: SheetSnapshot, rows: range, condition: SheetFilter) -> set:
+    column = _column(sheet, condition.column)
+    if condition.operator == "~":
+        return column.folded.find_rows(fold(condition.value)) & set(rows)
+
+    number = _parse_number(condition.value)
+    if condition.operator in _NUMERIC_OPERATORS:
+        compare = {
+            ">": lambda cell: cell > number,
+            "<": lambda cell: cell < number,
+            ">=": lambda cell: cell >= number,
+            "<=": lambda cell: cell <= number,
+        }[condition.operator]
+        # NaN (text or empty cell) compares false with everything
+        return {row for row in rows if compare(column.numbers[row])}
+
+    expected = fold(condition.value)
+    equal = {
+        row for row in rows
+        if column.numbers[row] == number or column.folded.get(row) == expected
+    }
+    return equal if condition.operator == "=" else set(rows) - equal
+
+
+def _sort_rows(column, rows: List[int], descending: bool) -> List[int]:
+    """Numbers by value before text (case-folded); empty cells stay last either way."""
+    numbers, text, empty = [], [], []
+    for row in rows:
+        if column.text.get(row) == "":
+            empty.append(row)
+        elif math.isnan(column.numbers[row]):
+            text.append(row)
+        else:
+            numbers.append(row)
+    numbers.sort(key=lambda row: column.numbers[row], reverse=descending)
+    text.sort(key=column.folded.get, reverse=descending)
+    return numbers + text + empty
+
+
+def query_sheet(
+    sheet: SheetSnapshot,
+    header: bool = True,
+    q: Optional[str] = None,
+    filters: Sequence[SheetFilter] = (),
+    sort: Optional[str] = None,
+    offset: int = 0,
+    limit: int = 100,
+) -> Dict:
+    """Filter, sort and page the rows of one sheet snapshot.
+
+    `q` matches a substring of any cell (case-insensitive, ё = е); filters
+    are ANDed. `sort` is a column letter, `-` prefix for descending.
+    """
+    data_rows = range(1 if header and sheet.row_count else 0, sheet.row_count)
+    matched: Optional[set] = None
+
+    if q and q.strip():
+        needle = fold(q.strip())
+        matched = set()
+        for column in sheet.columns:
+            matched |= column.folded.find_rows(needle)
+        matched &= set(data_rows)
+    for condition in filters:
+        rows = _filter_rows(sheet, data_rows, condition)
+        matched = rows if matched is None else matched & rows
+
+    rows = list(data_rows) if matched is None else sorted(matched)
+    if sort:
+        descending = sort.startswith("-")
+        letters = sort.lstrip("-")
+        if not re.fullmatch(r"[A-Za-z]{1,3}", letters):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid sort column: {sort}")
+        column = _column(sheet, column_index_from_string(letters.upper()) - 1)
+        rows = _sort_rows(column, rows, descending)
+
+    return {
+        "sheet": sheet.name,
+        "columns": sheet.column_count,
+        "header": sheet.row(0) if header and sheet.row_count else None,
+        "total_rows": len(data_rows),
+        "matched_rows": len(rows),
+        "offset": offset,
+        "limit": limit,
+        "rows": [
+            {"row_number": row + 1, "cells": sheet.row(row)}
+            for row in rows[offset:offset + limit]
+        ],
+    }
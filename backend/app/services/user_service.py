@@ -6,6 +6,7 @@ from fastapi import HTTPException, status
 
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
+from app.utils.cache import CACHE_USERS, invalidate_cache
 from app.utils.security import hash_password
 
 
@@ -27,6 +28,7 @@ def create_user(db: Session, user_data: UserCreate) -> User:
     )
     db.add(user)
     db.commit()
+    invalidate_cache(CACHE_USERS)
     db.refresh(user)
     return user
 
@@ -57,6 +59,7 @@ def update_user(db: Session, user_id: UUID, user_data: UserUpdate) -> Optional[U
         setattr(user, field, value)
     
     db.commit()
+    invalidate_cache(CACHE_USERS)
     db.refresh(user)
     return user
 
@@ -69,6 +72,7 @@ def deactivate_user(db: Session, user_id: UUID) -> Optional[User]:
     
     user.is_active = False
     db.commit()
+    invalidate_cache(CACHE_USERS)
     db.refresh(user)
     return user
 
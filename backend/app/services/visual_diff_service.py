@@ -0,0 +1,180 @@
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, aliased
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.document_revision import DocumentRevision
+from app.models.revision_visual_diff import RevisionVisualDiff
+from app.services.file_storage_service import get_file_path
+from app.utils.background_extraction import STATUS_TIMEOUT, BackgroundExtractor
+from app.utils.pdf_visual_diff import render_visual_diff, staging_dirs, tile_path
+
+# Key of the renderer queue: (previous revision id, new revision id)
+RevisionPair = Tuple[UUID, UUID]
+
+
+def visual_diff_dir(from_revision_id: UUID, to_revision_id: UUID) -> Path:
+    return Path(settings.FILE_STORAGE_PATH) / "visual_diffs" / f"{from_revision_id}_{to_revision_id}"
+
+
+def previous_revision_query(revision: DocumentRevision):
+    return (
+        select(DocumentRevision)
+        .where(
+            DocumentRevision.document_id == revision.document_id,
+            DocumentRevision.uploaded_at < revision.uploaded_at,
+        )
+        .order_by(DocumentRevision.uploaded_at.desc())
+        .limit(1)
+    )
+
+
+class VisualDiffRenderer(BackgroundExtractor):
+    """Renders page overlays for new revisions against the revision they replace.
+
+    Rendering a drawing is memory-hungry: each renderer process runs with an
+    address space cap (VISUAL_DIFF_MEMORY_LIMIT_MB), so a pathological PDF
+    fails with MemoryError in the worker instead of exhausting the host.
+    """
+
+    name = "visual-diff"
+    extract = staticmethod(render_visual_diff)
+
+    def prepare(self, db: Session, key: RevisionPair) -> Optional[Tuple]:
+        if db.get(RevisionVisualDiff, key) is not None:
+            return None
+        old, new = db.get(DocumentRevision, key[0]), db.get(DocumentRevision, key[1])
+        if old is None or new is None:
+            return None
+        return (
+            str(get_file_path(old.file_storage_uuid)),
+            str(get_file_path(new.file_storage_uuid)),
+            str(visual_diff_dir(*key)),
+            settings.VISUAL_DIFF_DPI,
+            settings.VISUAL_DIFF_MAX_PAGES,
+            settings.VISUAL_DIFF_MEMORY_LIMIT_MB,
+        )
+
+    def store(self, db: Session, key: RevisionPair, status: str, result=None, error: Optional[str] = None) -> None:
+        if status == STATUS_TIMEOUT:
+            # The terminated worker never cleaned up its staging directory
+            for directory in staging_dirs(visual_diff_dir(*key)):
+                shutil.rmtree(directory, ignore_errors=True)
+        pages = result or []
+        values = {
+            "status": status,
+            "pages": pages,
+            "page_count": len(pages) if result is not None else None,
+            "error": error,
+            "rendered_at": datetime.utcnow(),
+        }
+        db.execute(
+            insert(RevisionVisualDiff)
+            .values(from_revision_id=key[0], to_revision_id=key[1], **values)
+            .on_conflict_do_update(
+                index_elements=[RevisionVisualDiff.from_revision_id, RevisionVisualDiff.to_revision_id], set_=values
+            )
+        )
+
+    def pending(self, db: Session, limit: int) -> List[RevisionPair]:
+        """Current revisions paired with their predecessor, without a rendered diff."""
+        previous = aliased(DocumentRevision)
+        previous_id = (
+            select(previous.id)
+            .where(previous.document_id == DocumentRevision.document_id, previous.uploaded_at < DocumentRevision.uploaded_at)
+            .order_by(previous.uploaded_at.desc())
+            .limit(1)
+            .correlate(DocumentRevision)
+            .scalar_subquery()
+        )
+        pairs = (
+            select(previous_id.label("from_revision_id"), DocumentRevision.id.label("to_revision_id"))
+            .where(DocumentRevision.is_current == True)
+            .order_by(DocumentRevision.uploaded_at.desc())
+            .subquery()
+        )
+        rows = db.execute(
+            select(pairs.c.from_revision_id, pairs.c.to_revision_id)
+            .outerjoin(RevisionVisualDiff, and_(
+                RevisionVisualDiff.from_revision_id == pairs.c.from_revision_id,
+                RevisionVisualDiff.to_revision_id == pairs.c.to_revision_id,
+            ))
+            .where(pairs.c.from_revision_id.is_not(None), RevisionVisualDiff.from_revision_id.is_(None))
+            .limit(limit)
+        )
+        return [(from_id, to_id) for from_id, to_id in rows]
+
+
+visual_diff_renderer = VisualDiffRenderer(
+    SessionLocal,
+    workers=settings.VISUAL_DIFF_WORKERS,
+    timeout=settings.VISUAL_DIFF_TIMEOUT_SECONDS,
+    max_tasks_per_child=10,
+    enabled=settings.VISUAL_DIFF_ENABLED,
+)
+
+
+def schedule_visual_diff(pairs: Iterable[RevisionPair]) -> None:
+    """Rendering hook for services replacing a revision; call after the commit."""
+    visual_diff_renderer.enqueue(pairs)
+
+
+def get_visual_diff(
+    db: Session,
+    document_id: UUID,
+    revision_id: UUID,
+    against_id: Optional[UUID] = None,
+) -> Tuple[DocumentRevision, DocumentRevision, Optional[RevisionVisualDiff]]:
+    """(old revision, new revision, stored diff or None) of a revision pair.
+
+    The pair defaults to the revision and its predecessor. A missing diff is
+    queued, so the first viewer of an old pair triggers the render and every
+    later viewer gets the stored tiles.
+    """
+    new = db.get(DocumentRevision, revision_id)
+    if new is None or new.document_id != document_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Revision not found")
+    if against_id is None:
+        old = db.scalars(previous_revision_query(new)).first()
+        if old is None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No previous revision to compare with")
+    else:
+        old = db.get(DocumentRevision, against_id)
+        if old is None or old.document_id != document_id:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Revision not found")
+
+    diff = db.get(RevisionVisualDiff, (old.id, new.id))
+    if diff is None:
+        schedule_visual_diff([(old.id, new.id)])
+    return old, new, diff
+
+
+def get_tile_path(diff: RevisionVisualDiff, page: int, row: int, column: int) -> Path:
+    """Path of an overlay tile of a rendered diff; 404 for pages/tiles outside it."""
+    if diff.status != "done":
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Visual diff not available")
+    meta = next((item for item in diff.pages if item["page"] == page), None)
+    if meta is None or not (0 <= row < meta["rows"] and 0 <= column < meta["columns"]):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tile not found")
+    path = tile_path(visual_diff_dir(diff.from_revision_id, diff.to_revision_id), page, row, column)
+    if not path.exists():
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tile not found")
+    return path
+
+
+def delete_visual_diff_files(revision_ids: Iterable[UUID]) -> None:
+    """Remove tile directories of every pair involving the revisions (hard delete)."""
+    root = Path(settings.FILE_STORAGE_PATH) / "visual_diffs"
+    if not root.exists():
+        return
+    for revision_id in revision_ids:
+        for directory in root.glob(f"*{revision_id}*"):
+            shutil.rmtree(directory, ignore_errors=True)
@@ -0,0 +1,161 @@
+"""Background content extraction off the request path.
+
+Services enqueue keys (e.g. revision ids) after their commit; dispatcher
+threads pick them up, run the CPU-bound `extract` function in a separate
+process and store the result with their own DB session, so an upload
+response never waits for parsing. Each dispatcher owns a single-process
+pool: a job that exceeds the timeout is killed by terminating that pool
+only, and `max_tasks_per_child` recycles workers that leak memory on odd
+files.
+
+Keys are not persisted: on start the extractor backfills whatever has no
+stored result yet, which also covers keys lost in a restart. With several
+uvicorn workers each process runs its own extractor; `store` must be an
+upsert, so the rare duplicate run is harmless.
+"""
+import logging
+import multiprocessing
+import queue
+import threading
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+STATUS_TIMEOUT = "timeout"
+
+_STOP = object()
+
+
+class BackgroundExtractor:
+    """Queue + dispatcher threads + per-thread process pool.
+
+    Subclasses define `extract` (a module-level, picklable function),
+    `prepare` (key -> args for `extract`, or None to skip), `store` and
+    `pending` (keys without a stored result, for the startup backfill).
+    """
+
+    name = "extractor"
+    extract: Callable[..., Any] = None
+
+    def __init__(
+        self,
+        session_factory: Callable,
+        workers: int = 2,
+        timeout: float = 60,
+        max_tasks_per_child: int = 50,
+        enabled: bool = True,
+    ):
+        self.session_factory = session_factory
+        self.workers = workers
+        self.timeout = timeout
+        self.max_tasks_per_child = max_tasks_per_child
+        self.enabled = enabled and workers > 0
+        self._queue: "queue.Queue" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        # Keys waiting or in progress: enqueueing them again is a no-op
+        self._queued: set = set()
+        self._queued_lock = threading.Lock()
+
+    # -- subclass hooks -------------------------------------------------
+
+    def prepare(self, db, key) -> Optional[Tuple]:
+        raise NotImplementedError
+
+    def store(self, db, key, status: str, result: Any = None, error: Optional[str] = None) -> None:
+        raise NotImplementedError
+
+    def pending(self, db, limit: int) -> List:
+        raise NotImplementedError
+
+    # -- public API -----------------------------------------------------
+
+    def enqueue(self, keys: Iterable) -> None:
+        """Schedule keys for extraction; never blocks (no-op when disabled or already queued)."""
+        if not self.enabled:
+            return
+        for key in keys:
+            with self._queued_lock:
+                if key in self._queued:
+                    continue
+                self._queued.add(key)
+            self._queue.put(key)
+
+    def start(self, backfill_limit: int = 1000) -> None:
+        if not self.enabled or self._threads:
+            return
+        for n in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"{self.name}-{n}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        try:
+            with self.session_factory() as db:
+                self.enqueue(self.pending(db, backfill_limit))
+        except Exception:
+            logger.warning("%s: backfill query failed", self.name, exc_info=True)
+
+    def stop(self, timeout: float = 5) -> None:
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def process(self, db, key, pool=None) -> Optional[str]:
+        """Extract and store one key; returns the stored status (None if skipped).
+
+        Without `pool` the extraction runs inline (tests, scripts).
+        """
+        args = self.prepare(db, key)
+        if args is None:
+            return None
+        try:
+            if pool is None:
+                result = type(self).extract(*args)
+            else:
+                result = pool.apply_async(type(self).extract, args).get(self.timeout)
+        except multiprocessing.TimeoutError:
+            self.store(db, key, STATUS_TIMEOUT, error=f"Extraction exceeded {self.timeout}s")
+            db.commit()
+            raise
+        except Exception as exc:
+            logger.info("%s: extraction of %s failed: %s", self.name, key, exc)
+            self.store(db, key, STATUS_FAILED, error=str(exc)[:1000])
+            db.commit()
+            return STATUS_FAILED
+        self.store(db, key, STATUS_DONE, result=result)
+        db.commit()
+        return STATUS_DONE
+
+    # -- dispatcher -----------------------------------------------------
+
+    def _new_pool(self):
+        # spawn: forking a process that runs threads (and DB pools) is unsafe
+        context = multiprocessing.get_context("spawn")
+        return context.Pool(1, maxtasksperchild=self.max_tasks_per_child)
+
+    def _run(self) -> None:
+        pool = None
+        try:
+            while True:
+                key = self._queue.get()
+                if key is _STOP:
+                    return
+                if pool is None:
+                    pool = self._new_pool()
+                try:
+                    with self.session_factory() as db:
+                        self.process(db, key, pool)
+                except multiprocessing.TimeoutError:
+                    logger.warning("%s: extraction of %s timed out, restarting worker", self.name, key)
+                    pool.terminate()
+                    pool = None
+                except Exception:
+                    logger.exception("%s: failed to process %s", self.name, key)
+                finally:
+                    with self._queued_lock:
+                        self._queued.discard(key)
+        finally:
+            if pool is not None:
+                pool.terminate()
@@ -0,0 +1,189 @@
+"""Response cache for read-mostly reference data (projects, sections, users).
+
+Entries are serialized JSON bodies with their ETag, stored under
+"<namespace>:<generation>:<key>". Invalidating a namespace bumps its
+generation, so every key of the namespace is dropped at once without scanning.
+
+Backends:
+  - memory: per process (each uvicorn worker has its own copy; other workers
+    see a mutation after CACHE_TTL_SECONDS at most)
+  - redis:  shared between workers (CACHE_REDIS_URL, requires the `redis` package)
+  - none:   caching disabled, ETag/304 still work
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, NamedTuple, Optional, Tuple
+
+from app.config import settings
+
+CACHE_PROJECTS = "projects"
+CACHE_SECTIONS = "sections"
+CACHE_USERS = "users"
+CACHE_SUMMARY = "summary"
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: str
+
+
+def compute_etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+class InMemoryCacheBackend:
+    """Thread-safe TTL cache with LRU eviction beyond `max_entries`."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._counters: dict = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def get_counter(self, key: str) -> int:
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._counters.clear()
+
+
+class RedisCacheBackend:
+    """Shared backend over any Redis-protocol client exposing get/set(ex=)/incr/delete."""
+
+    def __init__(self, client, prefix: str = "mes_edms:cache:"):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisCacheBackend":
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package") from exc
+        return cls(redis.Redis.from_url(url, socket_timeout=0.5))
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        self.client.set(self.prefix + key, value, ex=ttl)
+
+    def get_counter(self, key: str) -> int:
+        value = self.client.get(self.prefix + key)
+        return int(value) if value is not None else 0
+
+    def incr(self, key: str) -> int:
+        return int(self.client.incr(self.prefix + key))
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
+
+
+class NullCacheBackend:
+    """Caching disabled: every lookup misses."""
+
+    def get(self, key: str) -> Optional[bytes]:
+        return None
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        pass
+
+    def get_counter(self, key: str) -> int:
+        return 0
+
+    def incr(self, key: str) -> int:
+        return 0
+
+    def clear(self) -> None:
+        pass
+
+
+class ResponseCache:
+    def __init__(self, backend, default_ttl: int):
+        self.backend = backend
+        self.default_ttl = default_ttl
+
+    def _key(self, namespace: str, key: str) -> str:
+        generation = self.backend.get_counter(f"gen:{namespace}")
+        return f"{namespace}:{generation}:{key}"
+
+    def get_or_set(
+        self,
+        namespace: str,
+        key: str,
+        producer: Callable[[], bytes],
+        ttl: Optional[int] = None,
+    ) -> CachedResponse:
+        """Return the cached body for (namespace, key) or build it with `producer`.
+
+        Exceptions raised by `producer` (e.g. HTTPException 404) propagate and
+        nothing is cached.
+        """
+        full_key = self._key(namespace, key)
+        stored = self.backend.get(full_key)
+        if stored is not None:
+            etag, _, body = stored.partition(b"\n")
+            return CachedResponse(body, etag.decode())
+
+        body = producer()
+        etag = compute_etag(body)
+        self.backend.set(full_key, etag.encode() + b"\n" + body, ttl or self.default_ttl)
+        return CachedResponse(body, etag)
+
+    def invalidate(self, *namespaces: str) -> None:
+        for namespace in namespaces:
+            self.backend.incr(f"gen:{namespace}")
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+
+def build_backend(kind: str, redis_url: Optional[str] = None):
+    """Backend for the CACHE_BACKEND setting: "memory", "redis" or "none"."""
+    if kind == "memory":
+        return InMemoryCacheBackend()
+    if kind == "redis":
+        if not redis_url:
+            raise ValueError("CACHE_REDIS_URL is required for the redis cache backend")
+        return RedisCacheBackend.from_url(redis_url)
+    if kind == "none":
+        return NullCacheBackend()
+    raise ValueError(f"Unknown cache backend: {kind}")
+
+
+response_cache = ResponseCache(build_backend(settings.CACHE_BACKEND, settings.CACHE_REDIS_URL), settings.CACHE_TTL_SECONDS)
+
+
+def invalidate_cache(*namespaces: str) -> None:
+    """Invalidation hook for service mutations; call after the commit."""
+    response_cache.invalidate(*namespaces)
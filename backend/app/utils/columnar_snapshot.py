@@ -0,0 +1,212 @@
+"""Columnar, memory-mappable snapshots of Excel workbooks.
+
+A workbook is parsed once (openpyxl read-only streaming) and written as one
+file per content hash. For every column of every sheet the file stores:
+
+  - offsets: uint64[rows + 1] into the UTF-8 text blob (cell text as
+    generate_preview renders it, "" for empty cells)
+  - text:    the concatenated UTF-8 text
+  - folded:  offsets + blob of the case-folded text ("ё" -> "е"), so a
+    substring filter is an `mmap.find` loop over one buffer
+  - numbers: float64[rows], NaN where the cell is not a number
+
+Layout: MAGIC | uint64 manifest offset | 8-byte aligned arrays | JSON manifest.
+Readers mmap the file and cast slices with memoryview, so opening a snapshot
+costs one read of the manifest and pages are loaded by the OS on demand.
+"""
+import json
+import math
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from bisect import bisect_right
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+MAGIC = b"MESCOL01"
+_HEADER = struct.Struct("<8sQ")
+_ALIGN = 8
+
+
+def fold(text: str) -> str:
+    return text.lower().replace("ё", "е")
+
+
+def cell_text(value) -> str:
+    return "" if value is None else str(value)
+
+
+def cell_number(value) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return math.nan
+
+
+class _Writer:
+    def __init__(self, file):
+        self.file = file
+        self.position = _HEADER.size
+
+    def write(self, data: bytes) -> List[int]:
+        """Write `data` 8-byte aligned; returns [offset, length]."""
+        padding = -self.position % _ALIGN
+        if padding:
+            self.file.write(b"\0" * padding)
+            self.position += padding
+        offset = self.position
+        self.file.write(data)
+        self.position += len(data)
+        return [offset, len(data)]
+
+
+def _text_column(writer: _Writer, texts: Sequence[str]) -> Dict[str, List[int]]:
+    encoded = [text.encode() for text in texts]
+    offsets = array("Q", [0])
+    total = 0
+    for chunk in encoded:
+        total += len(chunk)
+        offsets.append(total)
+    return {"offsets": writer.write(offsets.tobytes()), "blob": writer.write(b"".join(encoded))}
+
+
+def write_snapshot(path: Path, sheets: Iterable) -> None:
+    """Write sheets given as (name, rows) pairs, rows being lists of raw cell values.
+
+    Written to a temporary file and renamed, so concurrent builders and
+    readers never see a partial snapshot.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, temp_name = tempfile.mkstemp(dir=path.parent, prefix=".snapshot-")
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(_HEADER.pack(MAGIC, 0))
+            writer = _Writer(file)
+            manifest = {"sheets": []}
+            for name, rows in sheets:
+                rows = list(rows)
+                column_count = max((len(row) for row in rows), default=0)
+                columns = []
+                for index in range(column_count):
+                    values = [row[index] if index < len(row) else None for row in rows]
+                    texts = [cell_text(value) for value in values]
+                    numbers = array("d", (cell_number(value) for value in values))
+                    columns.append({
+                        "text": _text_column(writer, texts),
+                        "folded": _text_column(writer, [fold(text) for text in texts]),
+                        "numbers": writer.write(numbers.tobytes()),
+                    })
+                manifest["sheets"].append({"name": name, "rows": len(rows), "columns": columns})
+
+            manifest_offset = writer.write(json.dumps(manifest).encode())[0]
+            file.seek(0)
+            file.write(_HEADER.pack(MAGIC, manifest_offset))
+        os.replace(temp_name, path)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+        raise
+
+
+def build_snapshot(xlsx_path: Path, path: Path) -> None:
+    """Stream a workbook into a snapshot (rows padded from column A, like the preview)."""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(xlsx_path, read_only=True, data_only=True)
+    try:
+        write_snapshot(path, (
+            (sheet.title, (list(row) for row in sheet.iter_rows(min_row=1, min_col=1, values_only=True)))
+            for sheet in workbook.worksheets
+        ))
+    finally:
+        workbook.close()
+
+
+class _TextColumn:
+    def __init__(self, mapping: mmap.mmap, buffer: memoryview, spec: Dict[str, List[int]]):
+        self.mapping = mapping
+        offset, length = spec["offsets"]
+        self.offsets = buffer[offset:offset + length].cast("Q")
+        self.start, length = spec["blob"]
+        self.blob = buffer[self.start:self.start + length]
+
+    def get(self, row: int) -> str:
+        return str(self.blob[self.offsets[row]:self.offsets[row + 1]], "utf-8")
+
+    def find_rows(self, needle: str) -> set:
+        """Rows whose text contains `needle`: mmap.find over the blob, hit offsets bisected to rows."""
+        if not needle:
+            # Every cell contains the empty string (and find() would never advance past it)
+            return set(range(len(self.offsets) - 1))
+        pattern = needle.encode()
+        end = self.start + len(self.blob)
+        rows = set()
+        position = self.mapping.find(pattern, self.start, end)
+        while position != -1:
+            relative = position - self.start
+            row = bisect_right(self.offsets, relative) - 1
+            cell_end = self.offsets[row + 1]
+            if relative + len(pattern) <= cell_end:
+                rows.add(row)
+                position = self.mapping.find(pattern, self.start + cell_end, end)
+            else:
+                # The match spans two cells: retry from the next byte
+                position = self.mapping.find(pattern, position + 1, end)
+        return rows
+
+
+class SheetColumn:
+    def __init__(self, mapping: mmap.mmap, buffer: memoryview, spec: Dict):
+        self.text = _TextColumn(mapping, buffer, spec["text"])
+        self.folded = _TextColumn(mapping, buffer, spec["folded"])
+        offset, length = spec["numbers"]
+        self.numbers = buffer[offset:offset + length].cast("d")
+
+
+class SheetSnapshot:
+    def __init__(self, mapping: mmap.mmap, buffer: memoryview, spec: Dict):
+        self.name = spec["name"]
+        self.row_count = spec["rows"]
+        self.columns = [SheetColumn(mapping, buffer, column) for column in spec["columns"]]
+
+    @property
+    def column_count(self) -> int:
+        return len(self.columns)
+
+    def row(self, row: int) -> List[str]:
+        return [column.text.get(row) for column in self.columns]
+
+
+class ColumnarSnapshot:
+    """Read-only view over a snapshot file.
+
+    The mapping is released when the snapshot and every view taken from it
+    are garbage collected; close() is only for a caller that owns the
+    instance exclusively.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+        magic, manifest_offset = _HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Not a columnar snapshot: {path}")
+        manifest = json.loads(bytes(self._buffer[manifest_offset:]))
+        self.sheets = [SheetSnapshot(self._mmap, self._buffer, sheet) for sheet in manifest["sheets"]]
+
+    def sheet(self, name: Optional[str] = None) -> Optional[SheetSnapshot]:
+        if name is None:
+            return self.sheets[0] if self.sheets else None
+        return next((sheet for sheet in self.sheets if sheet.name == name), None)
+
+    def close(self) -> None:
+        try:
+            self._buffer.release()
+            self._mmap.close()
+        except BufferError:
+            # A reader still holds column views; the mapping is unmapped when they are collected
+            pass
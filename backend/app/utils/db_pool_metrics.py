@@ -0,0 +1,169 @@
+"""Connection pool instrumentation: checkout wait, hold time per endpoint, overflow and timeouts."""
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from app.utils.request_context import get_request_context
+
+# Upper bounds (ms) of the checkout wait histogram; the last bucket is +Inf
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+# Label for connections checked out outside of an HTTP request (startup, scripts)
+NO_REQUEST_ROUTE = "no_request"
+
+
+class PoolMetrics:
+    """Thread-safe accumulator for one connection pool."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.overflow_checkouts = 0
+            self.timeouts = 0
+            self.wait_count = 0
+            self.wait_total_ms = 0.0
+            self.wait_max_ms = 0.0
+            self.wait_buckets: List[int] = [0] * (len(WAIT_BUCKETS_MS) + 1)
+            self.max_checked_out = 0
+            self.max_overflow = 0
+            self.hold_by_route: Dict[str, List[float]] = {}  # route -> [count, total_ms, max_ms]
+
+    def record_wait(self, wait_ms: float, checked_out: int, overflow: int) -> None:
+        with self._lock:
+            self.checkouts += 1
+            if overflow > 0:
+                self.overflow_checkouts += 1
+            self.wait_count += 1
+            self.wait_total_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+            self.wait_buckets[bisect_left(WAIT_BUCKETS_MS, wait_ms)] += 1
+            self.max_checked_out = max(self.max_checked_out, checked_out)
+            self.max_overflow = max(self.max_overflow, overflow)
+
+    def record_timeout(self, wait_ms: float) -> None:
+        with self._lock:
+            self.timeouts += 1
+            self.wait_count += 1
+            self.wait_total_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+            self.wait_buckets[bisect_left(WAIT_BUCKETS_MS, wait_ms)] += 1
+
+    def record_hold(self, route: str, hold_ms: float) -> None:
+        with self._lock:
+            stats = self.hold_by_route.get(route)
+            if stats is None:
+                self.hold_by_route[route] = [1, hold_ms, hold_ms]
+            else:
+                stats[0] += 1
+                stats[1] += hold_ms
+                stats[2] = max(stats[2], hold_ms)
+
+    def snapshot(self, pool: Optional[Pool] = None) -> dict:
+        with self._lock:
+            buckets = []
+            cumulative = 0
+            for bound, count in zip(list(WAIT_BUCKETS_MS) + ["+Inf"], self.wait_buckets):
+                cumulative += count
+                buckets.append({"le_ms": bound, "count": cumulative})
+
+            routes = [
+                {
+                    "route": route,
+                    "checkouts": int(count),
+                    "total_hold_ms": round(total, 2),
+                    "avg_hold_ms": round(total / count, 2),
+                    "max_hold_ms": round(max_ms, 2),
+                }
+                for route, (count, total, max_ms) in self.hold_by_route.items()
+            ]
+            routes.sort(key=lambda r: r["total_hold_ms"], reverse=True)
+
+            data = {
+                "name": self.name,
+                "checkouts": self.checkouts,
+                "overflow_checkouts": self.overflow_checkouts,
+                "timeouts": self.timeouts,
+                "max_checked_out": self.max_checked_out,
+                "max_overflow": self.max_overflow,
+                "checkout_wait": {
+                    "count": self.wait_count,
+                    "avg_ms": round(self.wait_total_ms / self.wait_count, 3) if self.wait_count else 0.0,
+                    "max_ms": round(self.wait_max_ms, 3),
+                    "buckets": buckets,
+                },
+                "hold_by_route": routes,
+            }
+
+        if isinstance(pool, QueuePool):
+            data["current"] = {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": max(pool.overflow(), 0),
+            }
+        return data
+
+
+sync_pool_metrics = PoolMetrics("sync")
+async_pool_metrics = PoolMetrics("async")
+
+
+class _InstrumentedPoolMixin:
+    """Times QueuePool._do_get, the only place where a checkout blocks on the pool."""
+
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record_timeout((time.perf_counter() - started_at) * 1000)
+            raise
+        self.metrics.record_wait(
+            (time.perf_counter() - started_at) * 1000,
+            checked_out=self.checkedout(),
+            overflow=max(self.overflow(), 0),
+        )
+        return record
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    metrics = sync_pool_metrics
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    metrics = async_pool_metrics
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    connection_record.info["checked_out_at"] = time.perf_counter()
+    connection_record.info["request_context"] = get_request_context()
+
+
+def _route_label(context) -> str:
+    return context.route if context is not None else NO_REQUEST_ROUTE
+
+
+def instrument_engine(engine: Engine, metrics: PoolMetrics) -> None:
+    """Attach checkout/checkin listeners attributing connection hold time to routes."""
+
+    def on_checkin(dbapi_connection, connection_record) -> None:
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        context = connection_record.info.pop("request_context", None)
+        if checked_out_at is None:
+            return
+        metrics.record_hold(_route_label(context), (time.perf_counter() - checked_out_at) * 1000)
+
+    event.listen(engine, "checkout", _on_checkout)
+    event.listen(engine, "checkin", on_checkin)
@@ -0,0 +1,34 @@
+"""Excel cell extraction, run in extractor worker processes (keep imports light)."""
+from typing import List, Tuple
+
+from app.utils.pdf_text import clean_text
+
+# Longer values are truncated in the index (search and hit display only)
+MAX_VALUE_CHARS = 2000
+
+
+def extract_excel_cells(path: str, max_cells: int) -> List[Tuple[str, int, int, str]]:
+    """Non-empty cells as (sheet, row, column, text), 1-based, sheet by sheet.
+
+    Streams rows with openpyxl read-only mode like excel_preview_service, so
+    memory stays flat on large workbooks; stops after `max_cells` cells.
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    cells = []
+    try:
+        for sheet in workbook.worksheets:
+            for row_number, row in enumerate(sheet.iter_rows(min_row=1, min_col=1, values_only=True), 1):
+                for column_number, value in enumerate(row, 1):
+                    if value is None:
+                        continue
+                    text = clean_text(str(value))[:MAX_VALUE_CHARS]
+                    if not text:
+                        continue
+                    cells.append((sheet.title, row_number, column_number, text))
+                    if len(cells) >= max_cells:
+                        return cells
+        return cells
+    finally:
+        workbook.close()
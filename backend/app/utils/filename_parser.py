@@ -1,79 +1,108 @@
 import re
-from typing import Dict, Optional
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set
 
 
-def parse_filename(filename: str) -> Dict[str, Optional[str]]:
-    """
-    Parse filename to extract section_code, part_number, and name.
-    
-    Returns:
-        Dict with keys: section_code, part_number, name
-        - section_code: Optional[str] - e.g., "БНС.КМД"
-        - part_number: Optional[str] - e.g., "123.456.789.001"
-        - name: str - always non-empty, fallback to filename without extension
-    
-    Examples:
-        - "БНС.КМД.123.456.789.001 Корпус.pdf" -> {"section_code": "БНС.КМД", "part_number": "123.456.789.001", "name": "Корпус"}
-        - "БНС.ТХ.24. Ротор сборка.pdf" -> {"section_code": "БНС.ТХ", "part_number": "24", "name": "Ротор сборка"}
-        - "Документ без кода.pdf" -> {"section_code": None, "part_number": None, "name": "Документ без кода"}
-        - "random_file_name.pdf" -> {"section_code": None, "part_number": None, "name": "random_file_name"}
-    """
-    result: Dict[str, Optional[str]] = {
-        "section_code": None,
-        "part_number": None,
-        "name": ""
-    }
-    
-    try:
-        # Remove extension (.pdf, .PDF)
-        name_without_ext = filename
-        if filename.lower().endswith('.pdf'):
-            name_without_ext = filename[:-4]
-        
-        remaining = name_without_ext.strip()
-        
-        # Try to detect section code: match pattern like "БНС.КМД" or "БНС.ТХ" at start
-        # Pattern: ^([А-ЯA-Z0-9]+\.[А-ЯA-Z0-9]+)\.
-        section_pattern = r'^([А-ЯA-Z0-9]+\.[А-ЯA-Z0-9]+)\.'
-        section_match = re.match(section_pattern, remaining)
-        
-        if section_match:
-            result["section_code"] = section_match.group(1)
-            remaining = remaining[section_match.end():].strip()
-        
-        # Try to extract part_number: look for decimal pattern like "123.456.789.001"
-        # Pattern: (\d{2,3}\.\d{3}\.\d{3}\.\d{3})
-        part_number_pattern = r'^(\d{2,3}\.\d{3}\.\d{3}\.\d{3})\s*(.*)$'
-        part_number_match = re.match(part_number_pattern, remaining)
-        
-        if part_number_match:
-            result["part_number"] = part_number_match.group(1)
-            remaining = part_number_match.group(2).strip()
-        else:
-            # Try numeric prefix pattern: "24. Ротор сборка"
-            # Pattern: ^(\d{1,3})\.\s*(.+)
-            numeric_prefix_pattern = r'^(\d{1,3})\.\s*(.*)$'
-            numeric_match = re.match(numeric_prefix_pattern, remaining)
-            
-            if numeric_match:
-                result["part_number"] = numeric_match.group(1)
-                remaining = numeric_match.group(2).strip()
-        
-        # Extract name: use remaining text or fallback to filename without extension
-        if remaining:
-            result["name"] = remaining.strip()
-        else:
-            result["name"] = name_without_ext.strip()
-        
-        # Final fallback: ensure name is never empty
-        if not result["name"]:
-            result["name"] = filename
-            
-    except Exception:
-        # Parsing never blocks import: if regex fails, continue with fallback values
-        result["section_code"] = None
-        result["part_number"] = None
-        result["name"] = filename if filename else "unnamed"
-    
-    return result
+@dataclass
+class ParsedBatch:
+    """Parse results of an import batch plus the distinct codes it references."""
+
+    results: List[Dict[str, Optional[str]]] = field(default_factory=list)
+    section_codes: Set[str] = field(default_factory=set)
+    part_numbers: Set[str] = field(default_factory=set)
+
+
+class FilenameParser:
+    """Filename parser with precompiled patterns, reusable across an import batch."""
+
+    # Section code at start, e.g. "БНС.КМД." or "БНС.ТХ."
+    SECTION_PATTERN = re.compile(r'^([А-ЯA-Z0-9]+\.[А-ЯA-Z0-9]+)\.')
+    # Decimal part number, e.g. "123.456.789.001"
+    PART_NUMBER_PATTERN = re.compile(r'^(\d{2,3}\.\d{3}\.\d{3}\.\d{3})\s*(.*)$')
+    # Numeric prefix, e.g. "24. Ротор сборка"
+    NUMERIC_PREFIX_PATTERN = re.compile(r'^(\d{1,3})\.\s*(.*)$')
+
+    def parse(self, filename: str) -> Dict[str, Optional[str]]:
+        """
+        Parse filename to extract section_code, part_number, and name.
+
+        Returns:
+            Dict with keys: section_code, part_number, name
+            - section_code: Optional[str] - e.g., "БНС.КМД"
+            - part_number: Optional[str] - e.g., "123.456.789.001"
+            - name: str - always non-empty, fallback to filename without extension
+
+        Examples:
+            - "БНС.КМД.123.456.789.001 Корпус.pdf" -> {"section_code": "БНС.КМД", "part_number": "123.456.789.001", "name": "Корпус"}
+            - "БНС.ТХ.24. Ротор сборка.pdf" -> {"section_code": "БНС.ТХ", "part_number": "24", "name": "Ротор сборка"}
+            - "Документ без кода.pdf" -> {"section_code": None, "part_number": None, "name": "Документ без кода"}
+            - "random_file_name.pdf" -> {"section_code": None, "part_number": None, "name": "random_file_name"}
+        """
+        result: Dict[str, Optional[str]] = {
+            "section_code": None,
+            "part_number": None,
+            "name": ""
+        }
+
+        try:
+            # Remove extension (.pdf, .PDF)
+            name_without_ext = filename
+            if filename.lower().endswith('.pdf'):
+                name_without_ext = filename[:-4]
+
+            remaining = name_without_ext.strip()
+
+            # Try to detect section code at start
+            section_match = self.SECTION_PATTERN.match(remaining)
+            if section_match:
+                result["section_code"] = section_match.group(1)
+                remaining = remaining[section_match.end():].strip()
 
+            # Try to extract decimal part_number, else numeric prefix
+            part_number_match = self.PART_NUMBER_PATTERN.match(remaining)
+            if part_number_match:
+                result["part_number"] = part_number_match.group(1)
+                remaining = part_number_match.group(2).strip()
+            else:
+                numeric_match = self.NUMERIC_PREFIX_PATTERN.match(remaining)
+                if numeric_match:
+                    result["part_number"] = numeric_match.group(1)
+                    remaining = numeric_match.group(2).strip()
+
+            # Extract name: use remaining text or fallback to filename without extension
+            if remaining:
+                result["name"] = remaining.strip()
+            else:
+                result["name"] = name_without_ext.strip()
+
+            # Final fallback: ensure name is never empty
+            if not result["name"]:
+                result["name"] = filename
+
+        except Exception:
+            # Parsing never blocks import: if regex fails, continue with fallback values
+            result["section_code"] = None
+            result["part_number"] = None
+            result["name"] = filename if filename else "unnamed"
+
+        return result
+
+    def parse_many(self, filenames: Iterable[str]) -> ParsedBatch:
+        """Parse a whole batch up front; results keep the input order."""
+        batch = ParsedBatch()
+        for filename in filenames:
+            result = self.parse(filename)
+            batch.results.append(result)
+            if result["section_code"]:
+                batch.section_codes.add(result["section_code"])
+            if result["part_number"]:
+                batch.part_numbers.add(result["part_number"])
+        return batch
+
+
+_default_parser = FilenameParser()
+
+
+def parse_filename(filename: str) -> Dict[str, Optional[str]]:
+    """Parse a single filename (see FilenameParser.parse)."""
+    return _default_parser.parse(filename)
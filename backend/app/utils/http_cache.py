@@ -0,0 +1,68 @@
+"""Conditional JSON responses: ETag + If-None-Match -> 304 Not Modified.
+
+Two kinds of ETag:
+  - body ETags (strong) for responses served from the response cache;
+  - version ETags (weak) for list endpoints: a hash of a cheap aggregate
+    (row count + max timestamp per table the response renders), computed
+    with one SQL statement before loading and serializing the rows.
+"""
+import hashlib
+from typing import Any, Tuple
+
+from fastapi import Request, Response
+from sqlalchemy import func, select
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.utils.cache import CachedResponse
+
+# Clients may keep the body but must revalidate: mutations show up on the next request
+CACHE_CONTROL = "private, no-cache"
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of If-None-Match against `etag` (RFC 9110 13.1.2)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {value.strip().removeprefix("W/") for value in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def collection_version(column, *criteria: ColumnElement) -> Tuple[ColumnElement, ColumnElement]:
+    """count(*) and max(column) over the rows matching `criteria`, as scalar subqueries.
+
+    `column` is a timestamp that moves forward on insert/update (updated_at,
+    uploaded_at); the count catches deletions.
+    """
+    return (
+        select(func.count()).select_from(column.class_).where(*criteria).scalar_subquery(),
+        select(func.max(column)).where(*criteria).scalar_subquery(),
+    )
+
+
+def version_etag(*parts: Any) -> str:
+    """Weak ETag from a version token (resource name, filters and aggregate values)."""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+
+def json_response(body: bytes, etag: str) -> Response:
+    """Pre-serialized JSON body with its ETag."""
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
+
+
+def conditional_json_response(request: Request, cached: CachedResponse) -> Response:
+    """Serve a pre-serialized JSON body, or 304 if the client already has this version."""
+    if etag_matches(request, cached.etag):
+        return not_modified(cached.etag)
+    return json_response(cached.body, cached.etag)
@@ -0,0 +1,78 @@
+"""Prometheus metrics shared by middleware, storage and database instrumentation.
+
+Multi-worker deployments: set PROMETHEUS_MULTIPROC_DIR to an empty, writable
+directory before the workers start; /metrics then aggregates all workers.
+"""
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+DB_STATEMENT_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by route template and status code",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route"],
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served",
+    ["method", "route"],
+    multiprocess_mode="livesum",
+)
+HTTP_REQUEST_BYTES = Counter(
+    "http_request_body_bytes_total",
+    "Bytes received in request bodies (uploads)",
+    ["method", "route"],
+)
+HTTP_RESPONSE_BYTES = Counter(
+    "http_response_body_bytes_total",
+    "Bytes sent in response bodies (downloads)",
+    ["method", "route"],
+)
+HTTP_REQUEST_DB_STATEMENTS = Histogram(
+    "http_request_db_statements",
+    "SQL statements executed per HTTP request",
+    ["method", "route"],
+    buckets=DB_STATEMENT_BUCKETS,
+)
+FILE_IO_DURATION = Histogram(
+    "file_io_duration_seconds",
+    "Time spent in file storage operations",
+    ["operation"],
+)
+FILE_IO_BYTES = Counter(
+    "file_io_bytes_total",
+    "Bytes moved by file storage operations",
+    ["operation"],
+)
+
+
+def render_latest() -> tuple[bytes, str]:
+    """Render metrics in Prometheus text format, aggregating workers in multiprocess mode."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead(pid: int) -> None:
+    """Drop live gauges of an exiting worker (multiprocess mode only)."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid)
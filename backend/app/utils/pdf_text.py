@@ -0,0 +1,35 @@
+"""PDF text extraction, run in extractor worker processes (keep imports light)."""
+import re
+from typing import Tuple
+
+# Control characters (NUL is rejected by Postgres text; \x02/\x03 mark search highlights)
+_CONTROL_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+_BLANK_RUNS = re.compile(r"[ \t]+")
+
+
+def clean_text(text: str) -> str:
+    text = _CONTROL_CHARS.sub(" ", text)
+    lines = (_BLANK_RUNS.sub(" ", line).strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def extract_pdf_text(path: str, max_pages: int, max_chars: int) -> Tuple[str, int]:
+    """Text of the first `max_pages` pages, cut at `max_chars`; returns (text, page_count).
+
+    Scanned drawings without a text layer yield an empty string.
+    """
+    from pypdf import PdfReader
+
+    reader = PdfReader(path)
+    page_count = len(reader.pages)
+    parts = []
+    size = 0
+    for page in reader.pages[:max_pages]:
+        text = clean_text(page.extract_text() or "")
+        if not text:
+            continue
+        parts.append(text)
+        size += len(text) + 1
+        if size >= max_chars:
+            break
+    return "\n".join(parts)[:max_chars], page_count
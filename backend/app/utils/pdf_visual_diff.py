@@ -0,0 +1,157 @@
+"""Visual page diff of two PDFs, run in renderer worker processes (keep imports light).
+
+Corresponding pages are rasterized (pypdfium2), compared in grayscale and
+written as an overlay cut into PNG tiles (Pillow):
+
+  - the new page, faded, as background
+  - red: ink present only in the old revision (removed)
+  - blue: ink present only in the new revision (added)
+
+A page present in one revision only is rendered entirely red or blue.
+"""
+import math
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+TILE_SIZE = 512
+# Pixels per rendered page; large sheets (A0) are rendered below the configured DPI
+MAX_PAGE_PIXELS = 40_000_000
+# Grayscale difference treated as a change (anti-aliasing noise stays below)
+CHANGE_THRESHOLD = 48
+
+_REMOVED_COLOR = (220, 30, 30)
+_ADDED_COLOR = (30, 90, 220)
+
+_memory_limit_mb: Optional[int] = None
+
+
+def limit_memory(max_memory_mb: int) -> None:
+    """Cap the address space of this worker process; allocations above it fail with MemoryError."""
+    global _memory_limit_mb
+    if max_memory_mb <= 0 or _memory_limit_mb == max_memory_mb:
+        return
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return
+    limit = max_memory_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    _memory_limit_mb = max_memory_mb
+
+
+def tile_path(root: Path, page: int, row: int, column: int) -> Path:
+    return root / f"page-{page}" / f"{row}-{column}.png"
+
+
+def staging_dirs(output: Path) -> List[Path]:
+    """Temporary directories of renders into `output` that never finished (killed workers)."""
+    return list(output.parent.glob(f".{output.name}-*"))
+
+
+def _render(document, index: int, dpi: int):
+    page = document[index]
+    try:
+        width, height = page.get_size()
+        scale = min(dpi / 72, math.sqrt(MAX_PAGE_PIXELS / max(width * height, 1)))
+        return page.render(scale=scale).to_pil().convert("L")
+    finally:
+        page.close()
+
+
+def diff_overlay(old, new):
+    """(overlay RGB image, changed pixel count) of two grayscale pages; either may be None."""
+    from PIL import Image, ImageChops
+
+    width = max(image.width for image in (old, new) if image is not None)
+    height = max(image.height for image in (old, new) if image is not None)
+
+    def canvas(image):
+        padded = Image.new("L", (width, height), 255)
+        if image is not None:
+            padded.paste(image, (0, 0))
+        return padded
+
+    old, new = canvas(old), canvas(new)
+
+    def mask(darker, lighter):
+        # Pixels where `darker` has ink that `lighter` does not
+        return ImageChops.subtract(lighter, darker).point(lambda value: 255 if value > CHANGE_THRESHOLD else 0)
+
+    removed, added = mask(old, new), mask(new, old)
+    overlay = Image.blend(new.convert("RGB"), Image.new("RGB", (width, height), (255, 255, 255)), 0.7)
+    overlay.paste(_REMOVED_COLOR, mask=removed)
+    overlay.paste(_ADDED_COLOR, mask=added)
+    changed = ImageChops.lighter(removed, added).histogram()[255]
+    return overlay, changed
+
+
+def _save_tiles(overlay, directory: Path) -> dict:
+    directory.mkdir(parents=True)
+    rows = math.ceil(overlay.height / TILE_SIZE)
+    columns = math.ceil(overlay.width / TILE_SIZE)
+    for row in range(rows):
+        for column in range(columns):
+            box = (column * TILE_SIZE, row * TILE_SIZE,
+                   min((column + 1) * TILE_SIZE, overlay.width), min((row + 1) * TILE_SIZE, overlay.height))
+            overlay.crop(box).save(directory / f"{row}-{column}.png", optimize=True)
+    return {"rows": rows, "columns": columns}
+
+
+def render_visual_diff(
+    old_path: str,
+    new_path: str,
+    output_dir: str,
+    dpi: int,
+    max_pages: int,
+    max_memory_mb: int,
+) -> List[dict]:
+    """Render overlay tiles of the first `max_pages` pages into `output_dir`; returns page metadata.
+
+    Tiles are written to a temporary directory renamed into place at the end,
+    so readers never see a partially rendered diff.
+    """
+    limit_memory(max_memory_mb)
+    import pypdfium2 as pdfium
+
+    output = Path(output_dir)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=output.parent, prefix=f".{output.name}-"))
+    old_document = pdfium.PdfDocument(old_path)
+    new_document = pdfium.PdfDocument(new_path)
+    try:
+        pages = []
+        old_count, new_count = len(old_document), len(new_document)
+        for index in range(min(max(old_count, new_count), max_pages)):
+            old = _render(old_document, index, dpi) if index < old_count else None
+            new = _render(new_document, index, dpi) if index < new_count else None
+            overlay, changed = diff_overlay(old, new)
+            if old is None:
+                page_status = "added"
+            elif new is None:
+                page_status = "removed"
+            else:
+                page_status = "changed" if changed else "unchanged"
+            pages.append({
+                "page": index + 1,
+                "status": page_status,
+                "width": overlay.width,
+                "height": overlay.height,
+                "changed_pixels": changed,
+                "changed_ratio": round(changed / (overlay.width * overlay.height), 6),
+                **_save_tiles(overlay, staging / f"page-{index + 1}"),
+            })
+            del old, new, overlay
+
+        if output.exists():
+            shutil.rmtree(output)
+        os.replace(staging, output)
+        return pages
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    finally:
+        old_document.close()
+        new_document.close()
@@ -0,0 +1,50 @@
+"""Request-scoped context shared by middleware and database instrumentation.
+
+The context lives in a ContextVar, so it follows the request into sync routes
+and dependencies executed on the threadpool.
+"""
+import time
+from contextvars import ContextVar, Token
+from typing import Dict, List, Optional
+
+from starlette.types import Scope
+
+
+class RequestContext:
+    """Per-request state used to attribute DB and timing metrics to a route."""
+
+    __slots__ = ("scope", "started_at", "request_id", "db_statements", "db_time_ms", "statement_stats")
+
+    def __init__(self, scope: Scope):
+        self.scope = scope
+        self.started_at = time.perf_counter()
+        self.request_id: Optional[str] = None  # set by TracingMiddleware
+        self.db_statements = 0
+        self.db_time_ms = 0.0
+        # raw SQL text -> [count, total_ms]; fingerprinted only when reported
+        self.statement_stats: Dict[str, List[float]] = {}
+
+    @property
+    def route(self) -> str:
+        """Route template label, e.g. "GET /api/items/{item_id}"."""
+        route = self.scope.get("route")
+        path = getattr(route, "path", None)
+        if path is None:
+            return "unmatched"
+        return f"{self.scope.get('method', '')} {path}"
+
+
+_current_request: ContextVar[Optional[RequestContext]] = ContextVar("current_request", default=None)
+
+
+def get_request_context() -> Optional[RequestContext]:
+    """Return the context of the request being served, or None outside of requests."""
+    return _current_request.get()
+
+
+def bind_request_context(context: RequestContext) -> Token:
+    return _current_request.set(context)
+
+
+def reset_request_context(token: Token) -> None:
+    _current_request.reset(token)
@@ -0,0 +1,33 @@
+"""Text normalization shared by the search columns and search queries.
+
+Stored `search_vector` columns are generated by Postgres from
+`search_vector_sql(...)`, so they are maintained on every write; queries are
+normalized the same way (lower case, "ё" -> "е") before being parsed.
+"""
+from typing import Tuple
+
+from sqlalchemy import func, literal_column
+
+# Codes and file names: no stemming. Names and titles: Russian stemming
+# (the russian configuration stems Latin words with the English stemmer).
+CODE_CONFIG = "simple"
+TEXT_CONFIG = "russian"
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(text.lower().replace("ё", "е").split())
+
+
+def search_vector_sql(*parts: Tuple[str, str, str]) -> str:
+    """GENERATED ALWAYS expression from (column, ts config, weight) triples."""
+    return " || ".join(
+        f"setweight(to_tsvector('{config}', translate(lower(coalesce({column}, '')), 'ё', 'е')), '{weight}')"
+        for column, config, weight in parts
+    )
+
+
+def search_tsquery(normalized: str):
+    """websearch_to_tsquery over both configurations, so stemmed and verbatim terms match."""
+    return func.websearch_to_tsquery(literal_column(f"'{CODE_CONFIG}'::regconfig"), normalized).op("||")(
+        func.websearch_to_tsquery(literal_column(f"'{TEXT_CONFIG}'::regconfig"), normalized)
+    )
@@ -0,0 +1,163 @@
+"""Row/cell diff of two worksheets.
+
+Rows are compared by hash. Alignment is a patience diff: the common prefix
+and suffix are trimmed, rows whose hash occurs exactly once on both sides
+become anchors (longest increasing subsequence), and the gaps between
+anchors are aligned the same way. Only a gap without anchors that is still
+small falls back to difflib, so a 20,000-row sheet is never compared
+row-by-row against every other row. Replaced blocks are paired row by row
+into "changed" rows with cell-level differences.
+"""
+import hashlib
+from bisect import bisect_left
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from openpyxl.utils import get_column_letter
+
+# Gaps without anchors up to this many row pairs are aligned with difflib
+_SMALL_GAP = 250_000
+
+Opcode = Tuple[str, int, int, int, int]
+
+
+def row_hash(cells: Sequence[str]) -> bytes:
+    """Hash of a row's text; trailing empty cells are ignored."""
+    end = len(cells)
+    while end and cells[end - 1] == "":
+        end -= 1
+    return hashlib.blake2b("\x1f".join(cells[:end]).encode(), digest_size=8).digest()
+
+
+def _longest_increasing(pairs: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Longest subsequence of (i, j) pairs (sorted by i) with increasing j."""
+    tails: List[int] = []
+    tail_index: List[int] = []
+    previous: List[Optional[int]] = []
+    for index, (_, j) in enumerate(pairs):
+        position = bisect_left(tails, j)
+        previous.append(tail_index[position - 1] if position else None)
+        if position == len(tails):
+            tails.append(j)
+            tail_index.append(index)
+        else:
+            tails[position] = j
+            tail_index[position] = index
+    result = []
+    index = tail_index[-1] if tail_index else None
+    while index is not None:
+        result.append(pairs[index])
+        index = previous[index]
+    return result[::-1]
+
+
+def _anchors(a: Sequence[bytes], b: Sequence[bytes], a_lo: int, a_hi: int, b_lo: int, b_hi: int):
+    """Pairs of rows unique on both sides of the range, longest order-preserving chain."""
+    seen: Dict[bytes, List[int]] = {}  # hash -> [count in a, count in b, index in a, index in b]
+    for i in range(a_lo, a_hi):
+        entry = seen.setdefault(a[i], [0, 0, i, 0])
+        entry[0] += 1
+    for j in range(b_lo, b_hi):
+        entry = seen.get(b[j])
+        if entry is not None:
+            entry[1] += 1
+            entry[3] = j
+    pairs = sorted((i, j) for count_a, count_b, i, j in seen.values() if count_a == 1 and count_b == 1)
+    return _longest_increasing(pairs)
+
+
+def align(a: Sequence[bytes], b: Sequence[bytes]) -> List[Opcode]:
+    """difflib-style opcodes ("equal", "delete", "insert", "replace") aligning `a` to `b`."""
+    opcodes: List[Opcode] = []
+
+    def emit(tag: str, i1: int, i2: int, j1: int, j2: int) -> None:
+        if i1 == i2 and j1 == j2:
+            return
+        if i1 == i2:
+            tag = "insert" if tag == "replace" else tag
+        elif j1 == j2:
+            tag = "delete" if tag == "replace" else tag
+        if opcodes and opcodes[-1][0] == tag:
+            _, i1, _, j1, _ = opcodes.pop()
+        opcodes.append((tag, i1, i2, j1, j2))
+
+    # Work items, popped left to right: ("range", ...) is aligned, ("emit", ...) is output as is
+    stack = [("range", 0, len(a), 0, len(b))]
+    while stack:
+        kind, a_lo, a_hi, b_lo, b_hi = stack.pop()
+        if kind == "emit":
+            emit("equal", a_lo, a_hi, b_lo, b_hi)
+            continue
+
+        prefix = 0
+        while a_lo + prefix < a_hi and b_lo + prefix < b_hi and a[a_lo + prefix] == b[b_lo + prefix]:
+            prefix += 1
+        emit("equal", a_lo, a_lo + prefix, b_lo, b_lo + prefix)
+        a_lo += prefix
+        b_lo += prefix
+        suffix = 0
+        while a_lo < a_hi - suffix and b_lo < b_hi - suffix and a[a_hi - suffix - 1] == b[b_hi - suffix - 1]:
+            suffix += 1
+        a_hi -= suffix
+        b_hi -= suffix
+        work = []
+
+        anchors = _anchors(a, b, a_lo, a_hi, b_lo, b_hi) if a_lo < a_hi and b_lo < b_hi else []
+        if anchors:
+            i, j = a_lo, b_lo
+            for anchor_i, anchor_j in anchors:
+                work.append(("range", i, anchor_i, j, anchor_j))
+                work.append(("emit", anchor_i, anchor_i + 1, anchor_j, anchor_j + 1))
+                i, j = anchor_i + 1, anchor_j + 1
+            work.append(("range", i, a_hi, j, b_hi))
+        elif 0 < (a_hi - a_lo) * (b_hi - b_lo) <= _SMALL_GAP:
+            matcher = SequenceMatcher(None, a[a_lo:a_hi], b[b_lo:b_hi], autojunk=False)
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+                emit(tag, a_lo + i1, a_lo + i2, b_lo + j1, b_lo + j2)
+        else:
+            emit("replace", a_lo, a_hi, b_lo, b_hi)
+
+        if suffix:
+            work.append(("emit", a_hi, a_hi + suffix, b_hi, b_hi + suffix))
+        stack.extend(reversed(work))
+    return opcodes
+
+
+def _changed_cells(old: Sequence[str], new: Sequence[str]) -> List[dict]:
+    cells = []
+    for index in range(max(len(old), len(new))):
+        before = old[index] if index < len(old) else ""
+        after = new[index] if index < len(new) else ""
+        if before != after:
+            cells.append({"column": get_column_letter(index + 1), "old": before, "new": after})
+    return cells
+
+
+def diff_sheet(old: Sequence[Sequence[str]], new: Sequence[Sequence[str]], max_changes: int) -> dict:
+    """Changed, added and removed rows of a sheet (1-based row numbers).
+
+    Counters are exact; at most `max_changes` row entries are listed.
+    """
+    old_hashes = [row_hash(old[i]) for i in range(len(old))]
+    new_hashes = [row_hash(new[j]) for j in range(len(new))]
+    counts = {"rows_added": 0, "rows_removed": 0, "rows_changed": 0}
+    changes: List[dict] = []
+
+    def add(change: dict, counter: str) -> None:
+        counts[counter] += 1
+        if len(changes) < max_changes:
+            changes.append(change)
+
+    for tag, i1, i2, j1, j2 in align(old_hashes, new_hashes):
+        if tag == "equal":
+            continue
+        paired = min(i2 - i1, j2 - j1) if tag == "replace" else 0
+        for offset in range(paired):
+            i, j = i1 + offset, j1 + offset
+            add({"type": "changed", "old_row": i + 1, "new_row": j + 1, "cells": _changed_cells(old[i], new[j])}, "rows_changed")
+        for i in range(i1 + paired, i2):
+            add({"type": "removed", "old_row": i + 1, "cells": list(old[i])}, "rows_removed")
+        for j in range(j1 + paired, j2):
+            add({"type": "added", "new_row": j + 1, "cells": list(new[j])}, "rows_added")
+
+    return {**counts, "changes": changes, "truncated": len(changes) < sum(counts.values())}
@@ -0,0 +1,78 @@
+"""Per-request SQL statement accounting: statement count, DB time and SQL fingerprints."""
+import re
+import time
+from typing import List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.utils.request_context import RequestContext, get_request_context
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_BIND_PARAM = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<!:):\w+")  # psycopg2, asyncpg, named
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """Normalize SQL so statements differing only in literals/params group together."""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _BIND_PARAM.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _IN_LIST.sub("IN (?)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def top_fingerprints(context: RequestContext, limit: int = 10) -> List[dict]:
+    """Aggregate the request's statements by fingerprint, most frequent first."""
+    grouped: dict = {}
+    for statement, (count, total_ms) in context.statement_stats.items():
+        stats = grouped.setdefault(fingerprint(statement), [0, 0.0])
+        stats[0] += count
+        stats[1] += total_ms
+    ranked: List[Tuple[str, List[float]]] = sorted(
+        grouped.items(), key=lambda entry: (entry[1][0], entry[1][1]), reverse=True
+    )
+    return [
+        {"sql": sql, "count": int(count), "total_ms": round(total_ms, 2)}
+        for sql, (count, total_ms) in ranked[:limit]
+    ]
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    request_context = get_request_context()
+    if request_context is not None:
+        request_context.db_statements += 1
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    request_context = get_request_context()
+    started = conn.info.get("query_started_at")
+    if request_context is None or not started:
+        return
+    elapsed_ms = (time.perf_counter() - started.pop()) * 1000
+    request_context.db_time_ms += elapsed_ms
+    stats = request_context.statement_stats.get(statement)
+    if stats is None:
+        request_context.statement_stats[statement] = [1, elapsed_ms]
+    else:
+        stats[0] += 1
+        stats[1] += elapsed_ms
+
+
+def _handle_error(exception_context) -> None:
+    # Failed statements never reach after_cursor_execute: drop their start marker
+    connection = exception_context.connection
+    if connection is not None and get_request_context() is not None:
+        started = connection.info.get("query_started_at")
+        if started:
+            started.pop()
+
+
+def instrument_statements(engine: Engine) -> None:
+    """Count and time statements executed by `engine` against the current request."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
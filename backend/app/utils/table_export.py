@@ -0,0 +1,82 @@
+"""Tabular exports streamed row by row (StreamingResponse bodies).
+
+CSV is encoded and yielded in batches as rows arrive. XLSX uses openpyxl's
+write-only mode: rows go to the worksheet's temporary file instead of
+memory, and the finished workbook (a ZIP, which openpyxl cannot emit
+incrementally) is written to a temporary file and streamed from there.
+Memory use is constant in both cases.
+
+User-entered text is never exported as a formula: XLSX writes it as string
+cells, CSV prefixes values that spreadsheets would evaluate with a quote.
+"""
+import csv
+import io
+import tempfile
+from typing import Iterable, Iterator, Sequence
+
+CHUNK_SIZE = 1024 * 1024
+_CSV_BATCH_ROWS = 500
+# Leading characters that make Excel/LibreOffice evaluate a CSV field as a formula
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_value(value):
+    # A lone "-" (empty placeholder) is not evaluated and stays readable
+    if isinstance(value, str) and len(value) > 1 and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def stream_csv(header: Sequence[str], rows: Iterable[Sequence], delimiter: str = ";") -> Iterator[bytes]:
+    """UTF-8 CSV with BOM and `;` separators, so Excel with a Russian locale opens it as is."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=delimiter, lineterminator="\r\n")
+    buffer.write("﻿")
+    writer.writerow(header)
+    pending = 0
+    for row in rows:
+        writer.writerow([_csv_value(value) for value in row])
+        pending += 1
+        if pending == _CSV_BATCH_ROWS:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue().encode()
+
+
+def _xlsx_value(sheet, value):
+    # openpyxl stores any string starting with "=" as a formula
+    if isinstance(value, str) and value.startswith("="):
+        from openpyxl.cell import WriteOnlyCell
+
+        cell = WriteOnlyCell(sheet, value=value)
+        cell.data_type = "s"
+        return cell
+    return value
+
+
+def stream_xlsx(title: str, header: Sequence[str], rows: Iterable[Sequence], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Single-sheet workbook with a bold, frozen header row."""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title)
+    sheet.freeze_panes = "A2"
+    bold = Font(bold=True)
+    header_cells = []
+    for value in header:
+        cell = WriteOnlyCell(sheet, value=value)
+        cell.font = bold
+        header_cells.append(cell)
+    sheet.append(header_cells)
+    for row in rows:
+        sheet.append([_xlsx_value(sheet, value) for value in row])
+
+    with tempfile.TemporaryFile() as file:
+        workbook.save(file)
+        file.seek(0)
+        while chunk := file.read(chunk_size):
+            yield chunk
@@ -0,0 +1,262 @@
+"""Lightweight request tracing: nested spans per request, exported offline.
+
+Span records follow the OpenTelemetry data model (32-hex trace id, 16-hex span
+id, parent span id, start/end in unix nanoseconds, attributes, status), and an
+incoming W3C `traceparent` header is honoured, so exported traces can be
+loaded into OTel tooling. No collector is needed: spans go to an in-memory
+ring buffer (served by GET /metrics/traces) or to a JSON-lines file.
+
+Tracing is off unless an exporter is configured (TRACING_EXPORTER); disabled
+spans cost one global lookup.
+"""
+import functools
+import inspect
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+STATUS_UNSET = "STATUS_CODE_UNSET"
+STATUS_ERROR = "STATUS_CODE_ERROR"
+
+SPAN_KIND_SERVER = "SPAN_KIND_SERVER"
+SPAN_KIND_INTERNAL = "SPAN_KIND_INTERNAL"
+
+
+def _new_trace_id() -> str:
+    return os.urandom(16).hex()
+
+
+def _new_span_id() -> str:
+    return os.urandom(8).hex()
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[tuple[str, str]]:
+    """Return (trace_id, parent_span_id) from a W3C traceparent header, if valid."""
+    if not value:
+        return None
+    match = _TRACEPARENT.match(value.strip().lower())
+    if not match or match.group(1) == "0" * 32 or match.group(2) == "0" * 16:
+        return None
+    return match.group(1), match.group(2)
+
+
+class Span:
+    """One timed operation; finished spans are handed to the exporter."""
+
+    __slots__ = (
+        "name", "kind", "trace_id", "span_id", "parent_span_id",
+        "start_ns", "end_ns", "attributes", "status", "status_message",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_span_id: Optional[str] = None,
+        kind: str = SPAN_KIND_INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = _new_span_id()
+        self.parent_span_id = parent_span_id
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.status = STATUS_UNSET
+        self.status_message: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.status = STATUS_ERROR
+        self.status_message = str(exc)[:500]
+        self.attributes["exception.type"] = type(exc).__name__
+
+    @property
+    def duration_ms(self) -> float:
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1_000_000
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id or "",
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "durationMs": round(self.duration_ms, 3),
+            "attributes": self.attributes,
+            "status": {"code": self.status, "message": self.status_message or ""},
+        }
+
+
+class InMemorySpanExporter:
+    """Keeps the most recent finished spans in a bounded ring buffer."""
+
+    def __init__(self, max_spans: int = 10000):
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    def get_finished_spans(
+        self,
+        trace_id: Optional[str] = None,
+        request_id: Optional[str] = None,
+    ) -> List[Span]:
+        with self._lock:
+            spans = list(self._spans)
+        if request_id is not None:
+            spans = [s for s in spans if s.attributes.get("request.id") == request_id]
+        if trace_id is not None:
+            spans = [s for s in spans if s.trace_id == trace_id]
+        return spans
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+    def shutdown(self) -> None:
+        self.clear()
+
+
+class FileSpanExporter:
+    """Appends finished spans as JSON lines, one span per line."""
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), ensure_ascii=False, default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+_exporter = None
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def configure_tracing(exporter) -> None:
+    """Install the span exporter; None disables tracing."""
+    global _exporter
+    previous, _exporter = _exporter, exporter
+    if previous is not None and previous is not exporter:
+        previous.shutdown()
+
+
+def build_exporter(kind: str, file_path: Optional[str] = None, max_spans: int = 10000):
+    """Exporter for the TRACING_EXPORTER setting: "none", "memory" or "file"."""
+    if kind == "memory":
+        return InMemorySpanExporter(max_spans)
+    if kind == "file":
+        if not file_path:
+            raise ValueError("TRACING_FILE_PATH is required for the file exporter")
+        return FileSpanExporter(file_path)
+    if kind == "none":
+        return None
+    raise ValueError(f"Unknown tracing exporter: {kind}")
+
+
+def get_exporter():
+    return _exporter
+
+
+def get_current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+@contextmanager
+def start_span(
+    name: str,
+    attributes: Optional[Dict[str, Any]] = None,
+    kind: str = SPAN_KIND_INTERNAL,
+    trace_id: Optional[str] = None,
+    parent_span_id: Optional[str] = None,
+) -> Iterator[Optional[Span]]:
+    """Open a span as a child of the current one; yields None when tracing is off.
+
+    `trace_id`/`parent_span_id` start a new local root (used for incoming
+    requests); otherwise the span joins the current trace or starts one.
+    """
+    exporter = _exporter
+    if exporter is None:
+        yield None
+        return
+
+    parent = _current_span.get()
+    if trace_id is None:
+        if parent is not None:
+            trace_id, parent_span_id = parent.trace_id, parent.span_id
+        else:
+            trace_id = _new_trace_id()
+
+    span = Span(name, trace_id, parent_span_id, kind, attributes)
+    if parent is not None and "request.id" in parent.attributes:
+        span.attributes.setdefault("request.id", parent.attributes["request.id"])
+
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as exc:
+        span.record_exception(exc)
+        raise
+    finally:
+        _current_span.reset(token)
+        span.end_ns = time.time_ns()
+        exporter.export(span)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Decorator wrapping a sync or async function call in a span.
+
+    The default span name is "<module>.<function>", e.g. "document_service.upload_revision".
+    """
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__qualname__}"
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _exporter is None:
+                    return await func(*args, **kwargs)
+                with start_span(span_name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _exporter is None:
+                return func(*args, **kwargs)
+            with start_span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -1,14 +1,19 @@
 import os
 import hashlib
+import time
 
 from fastapi import UploadFile, HTTPException, status
 
+from app.utils.metrics import FILE_IO_BYTES, FILE_IO_DURATION
+from app.utils.tracing import traced
+
 ALLOWED_EXTENSIONS = {".pdf"}
 PDF_MAGIC_BYTES = b"%PDF-"
 ALLOWED_EXCEL_EXTENSIONS = {".xlsx", ".xlsm"}
 EXCEL_MAGIC_BYTES = b"PK\x03\x04"
 
 
+@traced()
 async def validate_pdf_header(file: UploadFile) -> None:
     """Validate PDF without loading entire file into RAM."""
     # 1. Extension check
@@ -31,6 +36,7 @@ async def validate_pdf_header(file: UploadFile) -> None:
         )
 
 
+@traced()
 async def validate_excel_file(file: UploadFile) -> None:
     """Validate Excel file without loading entire file into RAM."""
     # 1. Extension check
@@ -53,6 +59,7 @@ async def validate_excel_file(file: UploadFile) -> None:
         )
 
 
+@traced()
 async def stream_file_to_disk(
     file: UploadFile,
     output_path: str,
@@ -62,6 +69,7 @@ async def stream_file_to_disk(
     sha256_hash = hashlib.sha256()
     bytes_written = 0
     chunk_size = 8192  # 8KB chunks
+    started_at = time.perf_counter()
     
     try:
         with open(output_path, 'wb') as f:
@@ -89,6 +97,9 @@ async def stream_file_to_disk(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to save file: {str(e)}"
         )
+    finally:
+        FILE_IO_DURATION.labels("stream_to_disk").observe(time.perf_counter() - started_at)
+        FILE_IO_BYTES.labels("stream_to_disk").inc(bytes_written)
     
     return {
         "sha256": sha256_hash.hexdigest(),
@@ -0,0 +1,63 @@
+"""ZIP archives generated on the fly for StreamingResponse.
+
+zipfile writes to a non-seekable sink using data descriptors (sizes and CRC
+after each member), so an archive can be produced front to back without a
+temporary file. Members are copied in fixed-size chunks and the sink is
+drained after every chunk: memory use does not depend on file or archive
+size. PDFs are already compressed, so members are stored (ZIP_STORED).
+"""
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, Tuple, Union
+
+CHUNK_SIZE = 1024 * 1024
+
+# (name in the archive, file on disk or in-memory content)
+ZipMember = Tuple[str, Union[Path, bytes]]
+
+
+class _Sink:
+    """Write-only, non-seekable file object collecting zipfile output between yields."""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        # zipfile records member offsets with tell(); seek() is never called
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def stream_zip(members: Iterable[ZipMember], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield a stored (uncompressed) ZIP archive of `members`, ZIP64 when needed."""
+    sink = _Sink()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+        for name, source in members:
+            if isinstance(source, bytes):
+                archive.writestr(name, source)
+                yield sink.drain()
+                continue
+            stat = source.stat()
+            info = zipfile.ZipInfo(name, date_time=datetime.fromtimestamp(stat.st_mtime).timetuple()[:6])
+            info.compress_type = zipfile.ZIP_STORED
+            info.file_size = stat.st_size  # lets zipfile decide on ZIP64 up front
+            with open(source, "rb") as file, archive.open(info, mode="w") as entry:
+                while chunk := file.read(chunk_size):
+                    entry.write(chunk)
+                    yield sink.drain()
+            yield sink.drain()
+    yield sink.drain()
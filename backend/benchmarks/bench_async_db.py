@@ -0,0 +1,133 @@
+"""Load benchmark: sync (threadpool) vs async (asyncpg) database access.
+
+Reproduces how FastAPI serves each kind of route:
+  - sync:  `def` route -> run_in_threadpool -> psycopg2 Session (40 worker threads)
+  - async: `async def` route -> AsyncSession on the event loop
+
+Usage:
+    python benchmarks/bench_async_db.py --clients 500 --requests 20 --scenario notifications
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Awaitable, Callable, List
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from starlette.concurrency import run_in_threadpool
+
+from app.database import SessionLocal, AsyncSessionLocal, engine, async_engine
+from app.models.user import User
+from app.services.item_service import list_items, list_items_async
+from app.services.notification_service import get_user_notifications, get_user_notifications_async
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _pick_user_id():
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.is_active == True).first()  # noqa: E712
+        if not user:
+            raise SystemExit("No active users found: seed the database first (scripts/seed_admin.py)")
+        return user.id
+    finally:
+        db.close()
+
+
+def build_sync_call(scenario: str, user_id) -> Callable[[], Awaitable[None]]:
+    def handler() -> None:
+        db = SessionLocal()
+        try:
+            if scenario == "me":
+                db.query(User).filter(User.id == user_id).first()
+            elif scenario == "notifications":
+                get_user_notifications(db, user_id)
+            else:
+                list_items(db)
+        finally:
+            db.close()
+
+    async def call() -> None:
+        await run_in_threadpool(handler)
+
+    return call
+
+
+def build_async_call(scenario: str, user_id) -> Callable[[], Awaitable[None]]:
+    async def call() -> None:
+        async with AsyncSessionLocal() as db:
+            if scenario == "me":
+                await db.get(User, user_id)
+            elif scenario == "notifications":
+                await get_user_notifications_async(db, user_id)
+            else:
+                await list_items_async(db)
+
+    return call
+
+
+async def run_mode(call: Callable[[], Awaitable[None]], clients: int, requests_per_client: int) -> dict:
+    latencies: List[float] = []
+    errors = 0
+
+    async def client() -> None:
+        nonlocal errors
+        for _ in range(requests_per_client):
+            started_at = time.perf_counter()
+            try:
+                await call()
+            except Exception:
+                errors += 1
+                continue
+            latencies.append((time.perf_counter() - started_at) * 1000)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    elapsed = time.perf_counter() - started_at
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(_percentile(latencies, 50), 2) if latencies else None,
+        "p95_ms": round(_percentile(latencies, 95), 2) if latencies else None,
+        "p99_ms": round(_percentile(latencies, 99), 2) if latencies else None,
+        "mean_ms": round(statistics.fmean(latencies), 2) if latencies else None,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=20, help="requests per client")
+    parser.add_argument("--scenario", choices=["me", "notifications", "items"], default="notifications")
+    parser.add_argument("--mode", choices=["sync", "async", "both"], default="both")
+    args = parser.parse_args()
+
+    user_id = _pick_user_id()
+    report = {"scenario": args.scenario, "clients": args.clients, "requests_per_client": args.requests}
+
+    if args.mode in ("sync", "both"):
+        report["sync"] = await run_mode(build_sync_call(args.scenario, user_id), args.clients, args.requests)
+    if args.mode in ("async", "both"):
+        report["async"] = await run_mode(build_async_call(args.scenario, user_id), args.clients, args.requests)
+
+    print(json.dumps(report, indent=2))
+
+    engine.dispose()
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,152 @@
+"""Micro-benchmark: per-request overhead of BaseHTTPMiddleware vs pure ASGI AuditMiddleware.
+
+Drives the ASGI app directly (no server, no sockets) so the numbers isolate
+middleware cost. The streaming scenario mimics `preview_revision`
+(a StreamingResponse of 64 KiB chunks).
+
+Usage:
+    python benchmarks/bench_middleware.py --requests 20000 --scenario json
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from typing import List, Optional
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.middleware.audit_middleware import AuditMiddleware
+
+CHUNK = b"x" * 65536
+
+
+class LegacyAuditMiddleware(BaseHTTPMiddleware):
+    """The previous BaseHTTPMiddleware implementation, kept for comparison."""
+
+    async def dispatch(self, request: Request, call_next):
+        request.state.ip = self._get_client_ip(request)
+        return await call_next(request)
+
+    def _get_client_ip(self, request: Request) -> Optional[str]:
+        forwarded_for = request.headers.get("X-Forwarded-For")
+        if forwarded_for:
+            return forwarded_for.split(",")[0].strip()
+        if request.client:
+            return request.client.host
+        return None
+
+
+def build_app(middleware_class, chunks: int) -> FastAPI:
+    app = FastAPI()
+    if middleware_class is not None:
+        app.add_middleware(middleware_class)
+
+    @app.get("/json")
+    async def read_json(request: Request):
+        return {"ip": getattr(request.state, "ip", None)}
+
+    @app.get("/stream")
+    async def read_stream():
+        async def body():
+            for _ in range(chunks):
+                yield CHUNK
+
+        return StreamingResponse(body(), media_type="application/pdf")
+
+    return app
+
+
+async def call(app, path: str) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench"), (b"x-forwarded-for", b"10.0.0.1, 10.0.0.2")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    received = 0
+    request_sent = False
+    response_done = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # Like a real server: block until the response is finished, then report disconnect
+        await response_done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal received
+        if message["type"] == "http.response.body":
+            received += len(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_done.set()
+
+    await app(scope, receive, send)
+    return received
+
+
+async def run(app, path: str, requests: int) -> dict:
+    for _ in range(min(requests // 10, 500)):  # warm-up
+        await call(app, path)
+
+    latencies: List[float] = []
+    started_at = time.perf_counter()
+    for _ in range(requests):
+        request_started_at = time.perf_counter()
+        await call(app, path)
+        latencies.append((time.perf_counter() - request_started_at) * 1_000_000)
+    elapsed = time.perf_counter() - started_at
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "throughput_rps": round(requests / elapsed, 1),
+        "mean_us": round(statistics.fmean(latencies), 1),
+        "p50_us": round(latencies[len(latencies) // 2], 1),
+        "p99_us": round(latencies[int(len(latencies) * 0.99) - 1], 1),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--scenario", choices=["json", "stream"], default="json")
+    parser.add_argument("--chunks", type=int, default=16, help="64 KiB chunks per streaming response")
+    args = parser.parse_args()
+
+    path = "/json" if args.scenario == "json" else "/stream"
+    report = {"scenario": args.scenario, "requests": args.requests}
+    for name, middleware_class in (
+        ("none", None),
+        ("base_http_middleware", LegacyAuditMiddleware),
+        ("pure_asgi", AuditMiddleware),
+    ):
+        report[name] = await run(build_app(middleware_class, args.chunks), path, args.requests)
+
+    baseline = report["none"]["mean_us"]
+    for name in ("base_http_middleware", "pure_asgi"):
+        report[name]["overhead_us"] = round(report[name]["mean_us"] - baseline, 1)
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
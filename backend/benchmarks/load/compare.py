@@ -0,0 +1,79 @@
+"""Compare two load reports from run.py and fail on regressions.
+
+A scenario regresses when its p95 (or p99) latency grows by more than
+`--threshold` (relative) or its median SQL statement count grows at all.
+
+Usage:
+    python benchmarks/load/compare.py reports/base.json reports/head.json --threshold 0.15
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+
+def _ratio(before: Optional[float], after: Optional[float]) -> Optional[float]:
+    if not before or after is None:
+        return None
+    return (after - before) / before
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> List[str]:
+    """Return human-readable regression messages (empty when nothing regressed)."""
+    regressions: List[str] = []
+    for name, after in current["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            continue
+
+        for metric in ("p95_ms", "p99_ms"):
+            change = _ratio(before.get(metric), after.get(metric))
+            if change is not None and change > threshold:
+                regressions.append(
+                    f"{name}: {metric} {before[metric]} -> {after[metric]} (+{change:.0%}, threshold {threshold:.0%})"
+                )
+
+        statements_before = (before.get("db_statements") or {}).get("p50")
+        statements_after = (after.get("db_statements") or {}).get("p50")
+        if statements_before is not None and statements_after is not None and statements_after > statements_before:
+            regressions.append(f"{name}: SQL statements per request {statements_before} -> {statements_after}")
+
+        if after.get("errors", 0) > before.get("errors", 0):
+            regressions.append(f"{name}: errors {before.get('errors', 0)} -> {after['errors']}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed relative latency growth")
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text())
+    current = json.loads(args.current.read_text())
+
+    print(f"{'scenario':<20}{'p95 before':>12}{'p95 after':>12}{'change':>10}{'stmts':>12}")
+    for name, after in current["scenarios"].items():
+        before = baseline["scenarios"].get(name, {})
+        change = _ratio(before.get("p95_ms"), after.get("p95_ms"))
+        statements = (
+            f"{(before.get('db_statements') or {}).get('p50')}->{(after.get('db_statements') or {}).get('p50')}"
+        )
+        print(
+            f"{name:<20}{str(before.get('p95_ms')):>12}{str(after.get('p95_ms')):>12}"
+            f"{(f'{change:+.0%}' if change is not None else '-'):>10}{statements:>12}"
+        )
+
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print("\nRegressions:")
+        for message in regressions:
+            print(f"  - {message}")
+        sys.exit(1)
+    print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""Concurrent HTTP load test against a running API seeded by seed.py.
+
+Each scenario runs `--clients` concurrent clients for `--requests` requests
+each and records latency percentiles, throughput, status codes and, when the
+server runs with DEBUG=true, SQL statements and DB time per request (from the
+X-DB-Statements / X-DB-Time-Ms headers). The JSON report includes the git
+commit so runs can be compared with compare.py.
+
+Usage:
+    DEBUG=true uvicorn app.main:app --workers 4 &
+    python benchmarks/load/run.py --clients 50 --requests 40 --output reports/$(git rev-parse --short HEAD).json
+    python benchmarks/load/run.py --scenarios items_list,download
+"""
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import subprocess
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+DEFAULT_MANIFEST = Path(__file__).with_name("manifest.json")
+UPLOAD_SIZE = 256 * 1024
+IMPORT_BATCH = 5
+
+
+def _percentile(samples: List[float], pct: float) -> Optional[float]:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return round(ordered[index], 2)
+
+
+def _pdf(size: int) -> bytes:
+    body = b"%PDF-1.4\n% load test\n" + random.randbytes(size)
+    return body + b"\n%%EOF"
+
+
+Request = Callable[[httpx.AsyncClient, random.Random], Awaitable[httpx.Response]]
+
+
+def build_scenarios(manifest: dict) -> Dict[str, Request]:
+    """Map scenario name -> coroutine issuing one request of that kind."""
+    projects = manifest["project_ids"]
+    items = manifest["item_ids"]
+    downloads = manifest["downloads"]
+    tech_document_id = manifest["tech_document_id"]
+    upload_pdf = _pdf(UPLOAD_SIZE)
+
+    async def items_list(client, rng):
+        return await client.get("/api/items", params={"project_id": rng.choice(projects)})
+
+    async def documents_list(client, rng):
+        return await client.get("/api/documents", params={"item_id": rng.choice(items)})
+
+    async def notification_poll(client, rng):
+        return await client.get("/api/v1/notifications/my")
+
+    async def upload(client, rng):
+        target = rng.choice(downloads)
+        return await client.post(
+            f"/api/documents/{target['document_id']}/revisions",
+            data={"change_note": "load test"},
+            files={"file": ("load.pdf", upload_pdf, "application/pdf")},
+        )
+
+    async def download(client, rng):
+        target = rng.choice(downloads)
+        return await client.get(
+            f"/api/documents/{target['document_id']}/revisions/{target['revision_id']}/download"
+        )
+
+    async def import_batch(client, rng):
+        files = [
+            ("files", (f"LOADIMP-{uuid.uuid4().hex[:12]} Деталь.pdf", upload_pdf, "application/pdf"))
+            for _ in range(IMPORT_BATCH)
+        ]
+        return await client.post("/api/items/import", data={"project_id": rng.choice(projects)}, files=files)
+
+    async def audit_browse(client, rng):
+        return await client.get("/api/audit", params={"page": rng.randint(1, 200), "per_page": 100})
+
+    async def tech_preview(client, rng):
+        return await client.get(f"/api/tech/documents/{tech_document_id}/preview")
+
+    return {
+        "items_list": items_list,
+        "documents_list": documents_list,
+        "notification_poll": notification_poll,
+        "upload": upload,
+        "download": download,
+        "import": import_batch,
+        "audit_browse": audit_browse,
+        "tech_preview": tech_preview,
+    }
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    request: Request,
+    clients: int,
+    requests_per_client: int,
+    seed: int,
+) -> dict:
+    latencies: List[float] = []
+    statements: List[int] = []
+    db_times: List[float] = []
+    statuses: Dict[str, int] = {}
+    errors = 0
+    response_bytes = 0
+
+    async def worker(worker_id: int) -> None:
+        nonlocal errors, response_bytes
+        rng = random.Random(seed * 1000 + worker_id)
+        for _ in range(requests_per_client):
+            started_at = time.perf_counter()
+            try:
+                response = await request(client, rng)
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            latencies.append((time.perf_counter() - started_at) * 1000)
+            statuses[str(response.status_code)] = statuses.get(str(response.status_code), 0) + 1
+            response_bytes += len(response.content)
+            if response.status_code >= 400:
+                errors += 1
+            if "X-DB-Statements" in response.headers:
+                statements.append(int(response.headers["X-DB-Statements"]))
+                db_times.append(float(response.headers["X-DB-Time-Ms"]))
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker(n) for n in range(clients)))
+    elapsed = time.perf_counter() - started_at
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "status_codes": statuses,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": _percentile(latencies, 50),
+        "p95_ms": _percentile(latencies, 95),
+        "p99_ms": _percentile(latencies, 99),
+        "mean_ms": round(statistics.fmean(latencies), 2) if latencies else None,
+        "max_ms": round(max(latencies), 2) if latencies else None,
+        "response_bytes": response_bytes,
+        "db_statements": {
+            "p50": _percentile(statements, 50),
+            "max": max(statements) if statements else None,
+            "db_time_p50_ms": _percentile(db_times, 50),
+        } if statements else None,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--manifest", type=Path, default=DEFAULT_MANIFEST)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=40, help="requests per client and scenario")
+    parser.add_argument("--scenarios", default="all", help="comma-separated scenario names or 'all'")
+    parser.add_argument("--seed", type=int, default=42, help="random seed for target selection")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--output", type=Path, help="write the JSON report here (default: stdout only)")
+    args = parser.parse_args()
+
+    manifest = json.loads(args.manifest.read_text())
+    scenarios = build_scenarios(manifest)
+    selected = list(scenarios) if args.scenarios == "all" else args.scenarios.split(",")
+    unknown = [name for name in selected if name not in scenarios]
+    if unknown:
+        raise SystemExit(f"Unknown scenarios: {', '.join(unknown)} (available: {', '.join(scenarios)})")
+
+    limits = httpx.Limits(max_connections=args.clients, max_keepalive_connections=args.clients)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        login = await client.post(
+            "/api/auth/login", json={"email": manifest["admin_email"], "password": manifest["password"]}
+        )
+        login.raise_for_status()
+        client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+        report = {
+            "commit": _git_commit(),
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "base_url": args.base_url,
+            "clients": args.clients,
+            "requests_per_client": args.requests,
+            "seed": args.seed,
+            "python": platform.python_version(),
+            "scenarios": {},
+        }
+        for name in selected:
+            print(f"Running {name}...")
+            report["scenarios"][name] = await run_scenario(
+                client, scenarios[name], args.clients, args.requests, args.seed
+            )
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
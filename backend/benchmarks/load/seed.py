@@ -0,0 +1,372 @@
+"""Seed a Postgres database with realistic volumes for the load benchmark.
+
+Rows are generated server-side with INSERT ... SELECT FROM generate_series,
+so the default volumes (10 projects, 50k items, 200k revisions, 1M audit rows,
+500k notifications) load in minutes. Names, part numbers, labels and
+distributions are deterministic; only UUIDs differ between runs.
+
+Writes a manifest (credentials, sample ids) consumed by run.py.
+
+Usage:
+    python benchmarks/load/seed.py --reset
+    python benchmarks/load/seed.py --items 5000 --revisions 20000 --audit 100000 --notifications 50000
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from openpyxl import Workbook
+from sqlalchemy import text
+
+from app.config import settings
+from app.database import SessionLocal, engine
+from app.models.project_section import ProjectSection
+from app.models.tech_document import TechDocument
+from app.models.user import User, UserRole
+from app.services.file_storage_service import get_excel_file_path, get_file_path
+from app.utils.security import hash_password
+
+BENCH_PREFIX = "Bench project"
+BENCH_EMAIL_DOMAIN = "bench.local"
+BENCH_ADMIN_EMAIL = f"admin@{BENCH_EMAIL_DOMAIN}"
+BENCH_PASSWORD = "bench-password"
+REVISION_LABELS = ["-", "A", "B", "C", "D", "E", "F", "G", "H", "J"]
+SECTIONS_PER_PROJECT = 20
+DEFAULT_MANIFEST = Path(__file__).with_name("manifest.json")
+
+
+def _step(name: str, started_at: float) -> None:
+    print(f"  {name}: {time.perf_counter() - started_at:.1f}s")
+
+
+def reset(db) -> None:
+    """Remove data from previous seed and benchmark runs.
+
+    Projects cascade to sections, items, documents and revisions; rows that
+    reference benchmark users with ON DELETE RESTRICT go before the users.
+    """
+    db.execute(text("DELETE FROM projects WHERE name LIKE :prefix"), {"prefix": f"{BENCH_PREFIX} %"})
+    db.execute(text("DELETE FROM audit_log WHERE action_type LIKE 'bench.%'"))
+    db.execute(
+        text("DELETE FROM tech_documents WHERE created_by IN (SELECT id FROM users WHERE email LIKE :domain)"),
+        {"domain": f"%@{BENCH_EMAIL_DOMAIN}"},
+    )
+    db.execute(
+        text(
+            "DELETE FROM document_revisions WHERE author_id IN (SELECT id FROM users WHERE email LIKE :domain)"
+        ),
+        {"domain": f"%@{BENCH_EMAIL_DOMAIN}"},
+    )
+    db.execute(text("DELETE FROM users WHERE email LIKE :domain"), {"domain": f"%@{BENCH_EMAIL_DOMAIN}"})
+    db.commit()
+
+
+def seed_users(db, count: int) -> None:
+    password_hash = hash_password(BENCH_PASSWORD)
+    db.add(User(
+        full_name="Bench Admin",
+        email=BENCH_ADMIN_EMAIL,
+        password_hash=password_hash,
+        role=UserRole.admin,
+        is_active=True,
+    ))
+    for n in range(1, count):
+        db.add(User(
+            full_name=f"Bench Responsible {n}",
+            email=f"responsible{n}@{BENCH_EMAIL_DOMAIN}",
+            password_hash=password_hash,
+            role=UserRole.responsible,
+            is_active=True,
+        ))
+    db.commit()
+
+
+BENCH_USERS_CTE = """
+    bench_users AS (
+        SELECT id, row_number() OVER (ORDER BY email) - 1 AS rn
+        FROM users WHERE email LIKE :domain
+    )
+"""
+
+BENCH_PROJECTS_CTE = """
+    bench_projects AS (
+        SELECT id, row_number() OVER (ORDER BY name) - 1 AS rn
+        FROM projects WHERE name LIKE :prefix
+    )
+"""
+
+
+def seed_projects(db, projects: int) -> None:
+    db.execute(
+        text("""
+            INSERT INTO projects (id, name, status, description, created_at, updated_at)
+            SELECT uuid_generate_v4(), :prefix_name || ' ' || lpad(g::text, 3, '0'), 'active',
+                   'Load benchmark project', now(), now()
+            FROM generate_series(1, :projects) AS g
+        """),
+        {"prefix_name": BENCH_PREFIX, "projects": projects},
+    )
+    db.execute(
+        text(f"""
+            WITH {BENCH_PROJECTS_CTE}
+            INSERT INTO project_sections (id, project_id, code, created_at)
+            SELECT uuid_generate_v4(), p.id, (100 + s)::text || '.' || lpad(s::text, 3, '0'), now()
+            FROM bench_projects p CROSS JOIN generate_series(1, :sections) AS s
+        """),
+        {"prefix": f"{BENCH_PREFIX} %", "sections": SECTIONS_PER_PROJECT},
+    )
+    db.commit()
+
+
+def seed_items(db, items: int) -> None:
+    db.execute(
+        text(f"""
+            WITH {BENCH_PROJECTS_CTE}, {BENCH_USERS_CTE},
+            bench_sections AS (
+                SELECT s.id, s.project_id, row_number() OVER (PARTITION BY s.project_id ORDER BY s.code) - 1 AS rn
+                FROM project_sections s JOIN bench_projects p ON p.id = s.project_id
+            ),
+            user_count AS (SELECT count(*) AS n FROM bench_users),
+            project_count AS (SELECT count(*) AS n FROM bench_projects)
+            INSERT INTO items (
+                id, project_id, section_id, part_number, name, status,
+                current_progress, docs_completion_percent, responsible_id, created_at, updated_at
+            )
+            SELECT uuid_generate_v4(), p.id, s.id,
+                   'BENCH-' || lpad(g::text, 7, '0'),
+                   'Изделие ' || g || ' корпус ' || (g % 97),
+                   (ARRAY['draft', 'in_progress', 'completed', 'cancelled']::item_status[])[1 + g % 4],
+                   (g * 37) % 101, (g * 13) % 101, u.id,
+                   now() - (g || ' minutes')::interval, now() - (g || ' seconds')::interval
+            FROM generate_series(1, :items) AS g
+            CROSS JOIN project_count pc
+            CROSS JOIN user_count uc
+            JOIN bench_projects p ON p.rn = g % pc.n
+            LEFT JOIN bench_sections s ON s.project_id = p.id AND s.rn = (g / pc.n) % :sections
+            JOIN bench_users u ON u.rn = g % uc.n
+        """),
+        {
+            "prefix": f"{BENCH_PREFIX} %",
+            "domain": f"%@{BENCH_EMAIL_DOMAIN}",
+            "items": items,
+            "sections": SECTIONS_PER_PROJECT + 1,  # every 21st item has no section
+        },
+    )
+    db.commit()
+
+
+def seed_documents(db, revisions_per_document: int) -> None:
+    db.execute(text("""
+        INSERT INTO documents (id, item_id, title, type, created_at, updated_at, is_deleted)
+        SELECT uuid_generate_v4(), i.id, i.name, 'Чертеж', i.created_at, i.updated_at, false
+        FROM items i WHERE i.part_number LIKE 'BENCH-%'
+    """))
+    db.execute(
+        text(f"""
+            WITH {BENCH_USERS_CTE}
+            INSERT INTO document_revisions (
+                id, document_id, revision_label, file_storage_uuid, original_filename, mime_type,
+                file_size_bytes, sha256_hash, is_current, change_note, author_id, uploaded_at
+            )
+            SELECT uuid_generate_v4(), d.id, (:labels)[r], uuid_generate_v4(),
+                   i.part_number || '_' || (:labels)[r] || '.pdf', 'application/pdf',
+                   100000 + (r * 7919) % 5000000, md5(d.id::text || r) || md5(r || d.id::text),
+                   r = :per_document, CASE WHEN r > 1 THEN 'Изменение ' || r END,
+                   (SELECT id FROM bench_users ORDER BY rn LIMIT 1),
+                   d.created_at + (r || ' hours')::interval
+            FROM documents d
+            JOIN items i ON i.id = d.item_id AND i.part_number LIKE 'BENCH-%'
+            CROSS JOIN generate_series(1, :per_document) AS r
+        """),
+        {"domain": f"%@{BENCH_EMAIL_DOMAIN}", "labels": REVISION_LABELS, "per_document": revisions_per_document},
+    )
+    db.commit()
+
+
+def seed_audit(db, rows: int) -> None:
+    db.execute(
+        text(f"""
+            WITH {BENCH_USERS_CTE}, user_count AS (SELECT count(*) AS n FROM bench_users)
+            INSERT INTO audit_log (timestamp, user_id, action_type, ip_address, payload)
+            SELECT now() - (g || ' seconds')::interval, u.id,
+                   (ARRAY['bench.document_upload', 'bench.revision_upload', 'bench.download', 'bench.user_update'])[1 + g % 4],
+                   ('10.0.' || (g / 250) % 250 || '.' || g % 250)::inet,
+                   jsonb_build_object('seq', g, 'part_number', 'BENCH-' || lpad((g % 50000)::text, 7, '0'))
+            FROM generate_series(1, :rows) AS g
+            CROSS JOIN user_count uc
+            JOIN bench_users u ON u.rn = g % uc.n
+        """),
+        {"domain": f"%@{BENCH_EMAIL_DOMAIN}", "rows": rows},
+    )
+    db.commit()
+
+
+def seed_notifications(db, rows: int) -> None:
+    db.execute(
+        text(f"""
+            WITH {BENCH_USERS_CTE}, user_count AS (SELECT count(*) AS n FROM bench_users)
+            INSERT INTO notifications (id, user_id, message, read_at, created_at, event_payload)
+            SELECT uuid_generate_v4(), u.id,
+                   'Загружена новая ревизия изделия BENCH-' || lpad((g % 50000)::text, 7, '0'),
+                   CASE WHEN g % 10 < 7 THEN now() - (g || ' seconds')::interval END,
+                   now() - (g || ' seconds')::interval,
+                   jsonb_build_object('seq', g)
+            FROM generate_series(1, :rows) AS g
+            CROSS JOIN user_count uc
+            JOIN bench_users u ON u.rn = g % uc.n
+        """),
+        {"domain": f"%@{BENCH_EMAIL_DOMAIN}", "rows": rows},
+    )
+    db.commit()
+
+
+def _pdf_bytes(size: int, seed: str) -> bytes:
+    header = b"%PDF-1.4\n% bench " + seed.encode() + b"\n"
+    filler = hashlib.sha256(seed.encode()).hexdigest().encode() * (size // 64 + 1)
+    return (header + filler)[: max(size - 6, len(header))] + b"\n%%EOF"
+
+
+def write_revision_files(db, count: int, size: int) -> list:
+    """Write PDFs for `count` current revisions so download/preview hit real files."""
+    rows = db.execute(
+        text("""
+            SELECT d.id, r.id, r.file_storage_uuid
+            FROM document_revisions r
+            JOIN documents d ON d.id = r.document_id
+            JOIN items i ON i.id = d.item_id
+            WHERE i.part_number LIKE 'BENCH-%' AND r.is_current
+            ORDER BY i.part_number
+            LIMIT :count
+        """),
+        {"count": count},
+    ).all()
+    Path(settings.FILE_STORAGE_PATH).mkdir(parents=True, exist_ok=True)
+    downloads = []
+    for document_id, revision_id, storage_uuid in rows:
+        get_file_path(storage_uuid).write_bytes(_pdf_bytes(size, str(storage_uuid)))
+        downloads.append({"document_id": str(document_id), "revision_id": str(revision_id)})
+    return downloads
+
+
+def seed_tech_document(db, rows: int, columns: int) -> str:
+    """Create one tech section document backed by a generated Excel workbook."""
+    section = db.execute(
+        text("""
+            SELECT s.id FROM project_sections s JOIN projects p ON p.id = s.project_id
+            WHERE p.name LIKE :prefix ORDER BY p.name, s.code LIMIT 1
+        """),
+        {"prefix": f"{BENCH_PREFIX} %"},
+    ).scalar_one()
+    admin = db.query(User).filter(User.email == BENCH_ADMIN_EMAIL).one()
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Маршрут")
+    sheet.append([f"Колонка {c}" for c in range(1, columns + 1)])
+    for r in range(1, rows + 1):
+        sheet.append([f"R{r}C{c}" if c % 3 else r * c for c in range(1, columns + 1)])
+
+    storage_uuid = uuid.uuid4()
+    path = get_excel_file_path(storage_uuid, ".xlsx")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    workbook.save(path)
+    data = path.read_bytes()
+
+    document = TechDocument(
+        section_id=section,
+        filename="bench_route.xlsx",
+        storage_uuid=storage_uuid,
+        file_extension=".xlsx",
+        size_bytes=len(data),
+        sha256=hashlib.sha256(data).hexdigest(),
+        version=1,
+        is_current=True,
+        created_by=admin.id,
+    )
+    db.add(document)
+    db.commit()
+    return str(document.id)
+
+
+def build_manifest(db, downloads: list, tech_document_id: str) -> dict:
+    project_ids = [str(r[0]) for r in db.execute(
+        text("SELECT id FROM projects WHERE name LIKE :prefix ORDER BY name"), {"prefix": f"{BENCH_PREFIX} %"}
+    )]
+    item_ids = [str(r[0]) for r in db.execute(text(
+        "SELECT id FROM items WHERE part_number LIKE 'BENCH-%' ORDER BY part_number LIMIT 500"
+    ))]
+    section_ids = [str(r[0]) for r in db.query(ProjectSection.id).filter(
+        ProjectSection.project_id.in_(project_ids)
+    ).order_by(ProjectSection.code).limit(100)]
+    return {
+        "admin_email": BENCH_ADMIN_EMAIL,
+        "password": BENCH_PASSWORD,
+        "project_ids": project_ids,
+        "section_ids": section_ids,
+        "item_ids": item_ids,
+        "downloads": downloads,
+        "tech_document_id": tech_document_id,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=10)
+    parser.add_argument("--items", type=int, default=50000)
+    parser.add_argument("--revisions", type=int, default=200000, help="total revisions (spread evenly over documents)")
+    parser.add_argument("--audit", type=int, default=1000000)
+    parser.add_argument("--notifications", type=int, default=500000)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--files", type=int, default=200, help="current revisions backed by real PDF files")
+    parser.add_argument("--file-size", type=int, default=512 * 1024, help="bytes per seeded PDF")
+    parser.add_argument("--excel-rows", type=int, default=5000)
+    parser.add_argument("--excel-columns", type=int, default=20)
+    parser.add_argument("--reset", action="store_true", help="remove previously seeded benchmark data first")
+    parser.add_argument("--manifest", type=Path, default=DEFAULT_MANIFEST)
+    args = parser.parse_args()
+
+    revisions_per_document = max(1, min(len(REVISION_LABELS), round(args.revisions / max(args.items, 1))))
+
+    db = SessionLocal()
+    try:
+        if args.reset:
+            reset(db)
+        elif db.query(User).filter(User.email == BENCH_ADMIN_EMAIL).first():
+            raise SystemExit("Benchmark data already present: rerun with --reset")
+
+        print("Seeding benchmark data...")
+        started_at = time.perf_counter()
+        seed_users(db, args.users)
+        _step("users", started_at)
+        seed_projects(db, args.projects)
+        _step("projects + sections", started_at)
+        seed_items(db, args.items)
+        _step("items", started_at)
+        seed_documents(db, revisions_per_document)
+        _step(f"documents + revisions ({revisions_per_document} per document)", started_at)
+        seed_audit(db, args.audit)
+        _step("audit log", started_at)
+        seed_notifications(db, args.notifications)
+        _step("notifications", started_at)
+        downloads = write_revision_files(db, args.files, args.file_size)
+        tech_document_id = seed_tech_document(db, args.excel_rows, args.excel_columns)
+        _step("files", started_at)
+        db.execute(text("ANALYZE"))
+        db.commit()
+
+        args.manifest.write_text(json.dumps(build_manifest(db, downloads, tech_document_id), indent=2))
+        print(f"Manifest written to {args.manifest}")
+    finally:
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Synthetic ORM objects for micro-benchmarks (transient, no database needed).
+
+Relationships are populated with set_committed_value, so the objects look like
+rows loaded with eager loading and nothing triggers a lazy load.
+"""
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models.document import Document
+from app.models.document_revision import DocumentRevision
+from app.models.item import Item, ItemStatus
+from app.models.notification import Notification
+from app.models.project import Project, ProjectStatus
+from app.models.project_section import ProjectSection
+from app.models.user import User, UserRole
+from app.utils.revision_helper import ALLOWED_LETTERS
+
+BASE_TIME = datetime(2025, 1, 1, 12, 0, 0)
+
+
+def make_user(n: int) -> User:
+    return User(
+        id=uuid.uuid4(),
+        full_name=f"Пользователь {n}",
+        email=f"user{n}@example.com",
+        password_hash="x",
+        role=UserRole.responsible,
+        is_active=True,
+        created_at=BASE_TIME,
+    )
+
+
+def make_document(item: Item, n: int, author: User, revisions: int) -> Document:
+    document = Document(
+        id=uuid.uuid4(),
+        item_id=item.id,
+        title=f"{item.name} — лист {n}",
+        type="Чертеж",
+        created_at=BASE_TIME,
+        is_deleted=False,
+    )
+    labels = ["-"] + ALLOWED_LETTERS
+    revision_rows = [
+        DocumentRevision(
+            id=uuid.uuid4(),
+            document_id=document.id,
+            revision_label=labels[r],
+            file_storage_uuid=uuid.uuid4(),
+            original_filename=f"{item.part_number}_{labels[r]}.pdf",
+            mime_type="application/pdf",
+            file_size_bytes=100_000 + r,
+            sha256_hash="0" * 64,
+            is_current=r == revisions - 1,
+            change_note=None if r == 0 else f"Изменение {r}",
+            author_id=author.id,
+            uploaded_at=BASE_TIME + timedelta(hours=r),
+        )
+        for r in range(revisions)
+    ]
+    for revision in revision_rows:
+        set_committed_value(revision, "author", author)
+    set_committed_value(document, "revisions", revision_rows)
+    set_committed_value(document, "current_revision", revision_rows[-1])
+    return document
+
+
+def make_items(count: int, documents_per_item: int = 2, revisions: int = 4) -> list:
+    project_id = uuid.uuid4()
+    users = [make_user(n) for n in range(20)]
+    sections = [
+        ProjectSection(id=uuid.uuid4(), project_id=project_id, code=f"БНС.{n:03d}", created_at=BASE_TIME)
+        for n in range(20)
+    ]
+    items = []
+    for n in range(count):
+        section = sections[n % len(sections)]
+        item = Item(
+            id=uuid.uuid4(),
+            project_id=project_id,
+            section_id=section.id,
+            part_number=f"{100 + n % 900}.{n % 1000:03d}.{n // 1000 % 1000:03d}.{n % 7:03d}",
+            name=f"Изделие {n}",
+            status=ItemStatus.in_progress,
+            current_progress=n % 101,
+            docs_completion_percent=n % 101,
+            responsible_id=users[n % len(users)].id,
+            created_at=BASE_TIME,
+        )
+        set_committed_value(item, "section", section)
+        set_committed_value(item, "responsible", users[n % len(users)])
+        set_committed_value(
+            item,
+            "documents",
+            [make_document(item, d, users[n % len(users)], revisions) for d in range(documents_per_item)],
+        )
+        items.append(item)
+    return items
+
+
+@pytest.fixture(scope="session")
+def items():
+    return make_items(1000)
+
+
+@pytest.fixture(scope="session")
+def documents(items):
+    return [document for item in items for document in item.documents]
+
+
+@pytest.fixture(scope="session")
+def project(items):
+    project = Project(
+        id=items[0].project_id,
+        name="Проект",
+        status=ProjectStatus.active,
+        description="Синтетический проект",
+        created_at=BASE_TIME,
+    )
+    set_committed_value(project, "items", items)
+    set_committed_value(project, "sections", list({item.section.id: item.section for item in items}.values()))
+    return project
+
+
+@pytest.fixture(scope="session")
+def notifications():
+    user_id = uuid.uuid4()
+    return [
+        Notification(
+            id=uuid.uuid4(),
+            user_id=user_id,
+            message=f"Загружена новая ревизия изделия {n}",
+            read_at=None if n % 3 else BASE_TIME,
+            created_at=BASE_TIME,
+            event_payload={"item_id": str(uuid.uuid4()), "revision_label": "A"},
+        )
+        for n in range(5000)
+    ]
+
+
+@pytest.fixture(scope="session")
+def filenames():
+    templates = [
+        "БНС.КМД.{a:03d}.{b:03d}.789.{c:03d} Корпус сварной.pdf",
+        "БНС.ТХ.{c}. Ротор сборка {a}.pdf",
+        "{a:03d}.{b:03d}.{c:03d}.001 Кронштейн.PDF",
+        "Документ без кода {a}.pdf",
+        "random_file_name_{a}_{b}.pdf",
+    ]
+    return [
+        templates[n % len(templates)].format(a=n % 1000, b=(n * 7) % 1000, c=n % 100)
+        for n in range(10000)
+    ]
@@ -0,0 +1,26 @@
+"""Micro-benchmarks for pure-Python helpers on the bulk import and listing paths."""
+from app.utils.filename_parser import FilenameParser, parse_filename
+from app.utils.revision_helper import ALLOWED_LETTERS, get_next_revision
+
+
+def test_parse_filename_bulk_import(benchmark, filenames):
+    results = benchmark(lambda: [parse_filename(name) for name in filenames])
+    assert len(results) == len(filenames)
+    assert results[0]["section_code"] == "БНС.КМД"
+
+
+def test_parse_many_bulk_import(benchmark, filenames):
+    batch = benchmark(FilenameParser().parse_many, filenames)
+    assert len(batch.results) == len(filenames)
+    assert "БНС.КМД" in batch.section_codes
+
+
+def test_get_next_revision_full_chain(benchmark):
+    def walk_chains():
+        for _ in range(1000):
+            label = "-"
+            for _ in range(len(ALLOWED_LETTERS)):
+                label = get_next_revision(label)
+        return label
+
+    assert benchmark(walk_chains) == ALLOWED_LETTERS[-1]
@@ -0,0 +1,71 @@
+"""Micro-benchmarks for ORM -> Pydantic response conversion used by the routers."""
+import json
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.routers.items import item_to_response
+from app.schemas.document import DocumentResponse
+from app.schemas.notification import NotificationResponse
+from app.schemas.project import ProjectResponse
+from app.schemas.user import UserResponse
+from app.utils.serialization import ListSerializer
+
+
+def test_item_to_response_listing(benchmark, items):
+    responses = benchmark(lambda: [item_to_response(item) for item in items])
+    assert len(responses) == len(items)
+    assert responses[0].original_filename is not None
+
+
+def test_document_response_listing(benchmark, documents):
+    responses = benchmark(lambda: [DocumentResponse.model_validate(d) for d in documents])
+    assert len(responses[0].revisions) == 4
+
+
+def test_notification_response_poll(benchmark, notifications):
+    responses = benchmark(lambda: [NotificationResponse.model_validate(n) for n in notifications])
+    assert len(responses) == len(notifications)
+
+
+def test_project_response_with_items(benchmark, project):
+    response = benchmark(ProjectResponse.model_validate, project)
+    assert len(response.items) == len(project.items)
+
+
+def test_user_response_listing(benchmark, items):
+    users = list({item.responsible.id: item.responsible for item in items}.values()) * 50
+    responses = benchmark(lambda: [UserResponse.model_validate(u) for u in users])
+    assert len(responses) == len(users)
+
+
+def _default_response_body(schema, rows) -> bytes:
+    """The pre-ListSerializer path: model_validate per row, then what FastAPI does with
+    the returned list (re-validate against response_model, jsonable_encoder, json.dumps)."""
+    adapter = TypeAdapter(List[schema])
+    models = [schema.model_validate(row) for row in rows]
+    content = adapter.dump_python(adapter.validate_python(models, from_attributes=True), mode="json")
+    return json.dumps(jsonable_encoder(content), ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def test_documents_body_default(benchmark, documents):
+    body = benchmark(_default_response_body, DocumentResponse, documents)
+    assert body.startswith(b"[{")
+
+
+def test_documents_body_list_serializer(benchmark, documents):
+    serializer = ListSerializer(DocumentResponse)
+    body = benchmark(serializer.dumps, documents)
+    assert body == _default_response_body(DocumentResponse, documents)
+
+
+def test_notifications_body_default(benchmark, notifications):
+    body = benchmark(_default_response_body, NotificationResponse, notifications)
+    assert body.startswith(b"[{")
+
+
+def test_notifications_body_list_serializer(benchmark, notifications):
+    serializer = ListSerializer(NotificationResponse)
+    body = benchmark(serializer.dumps, notifications)
+    assert body == _default_response_body(NotificationResponse, notifications)
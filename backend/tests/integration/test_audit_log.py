@@ -323,3 +323,24 @@ def test_audit_log_contains_user_id(client, admin_token, admin_user, db, project
     assert audit_log is not None
     assert audit_log.user_id == admin_user.id
 
+
+
+def test_audit_log_listing_includes_user(client, admin_token, admin_user, db, project):
+    """GET /api/audit renders the acting user of each entry."""
+    client.patch(
+        f"/api/projects/{project.id}",
+        json={"name": "Audited"},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+
+    response = client.get(
+        "/api/audit",
+        params={"action_type": "project.update"},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+
+    assert response.status_code == 200
+    entries = response.json()
+    assert len(entries) == 1
+    assert entries[0]["user"]["id"] == str(admin_user.id)
+    assert entries[0]["payload"]["new_values"]["name"] == "Audited"
@@ -298,3 +298,44 @@ def test_notification_created_on_new_revision(client, admin_token, item, db, res
     assert len(notifications) >= 1
     assert "A" in notifications[0].message  # Revision A
 
+
+
+def test_visual_diff_between_revisions(client, admin_token, item, db, make_pdf):
+    """The overlay of a revision pair is rendered once and served as tiles."""
+    pytest.importorskip("pypdfium2")
+    pytest.importorskip("PIL")
+    from app.services.visual_diff_service import visual_diff_renderer
+
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    doc = client.post(
+        "/api/documents",
+        files={"file": ("drawing.pdf", io.BytesIO(make_pdf("Rev -")), "application/pdf")},
+        data={"item_id": str(item.id), "title": "Drawing"},
+        headers=headers,
+    ).json()
+    first_id = doc["current_revision"]["id"]
+    assert client.get(
+        f"/api/documents/{doc['id']}/revisions/{first_id}/visual-diff", headers=headers
+    ).status_code == 400
+
+    revision = client.post(
+        f"/api/documents/{doc['id']}/revisions",
+        files={"file": ("drawing_A.pdf", io.BytesIO(make_pdf("Rev A")), "application/pdf")},
+        data={"change_note": "Title block"},
+        headers=headers,
+    ).json()
+    url = f"/api/documents/{doc['id']}/revisions/{revision['id']}/visual-diff"
+
+    pending = client.get(url, headers=headers).json()
+    assert (pending["status"], pending["from_revision_label"], pending["to_revision_label"]) == ("pending", "-", "A")
+
+    assert visual_diff_renderer.process(db, (UUID(first_id), UUID(revision["id"]))) == "done"
+    result = client.get(url, headers=headers).json()
+    assert result["status"] == "done"
+    [page] = result["pages"]
+    assert page["status"] == "changed"
+
+    tile = client.get(f"{url}/pages/1/tiles/0/0.png", headers=headers)
+    assert tile.status_code == 200
+    assert tile.headers["content-type"] == "image/png"
+    assert client.get(f"{url}/pages/2/tiles/0/0.png", headers=headers).status_code == 404
@@ -221,3 +221,98 @@ def test_update_item_section_id_audit_log(client, admin_token, db, project, sect
     assert "new_values" in audit_log.payload
     assert audit_log.payload["old_values"]["section_id"] is None
     assert audit_log.payload["new_values"]["section_id"] == str(section.id)
+
+
+def test_items_list_not_modified_until_item_changes(client, admin_token, project):
+    """Items list answers If-None-Match with 304 until an item changes."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    created = client.post(
+        "/api/items",
+        json={"project_id": str(project.id), "part_number": "ETAG-001", "name": "ETag Item"},
+        headers=headers,
+    )
+    assert created.status_code == 200
+
+    first = client.get("/api/items", params={"project_id": str(project.id)}, headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    not_modified = client.get(
+        "/api/items", params={"project_id": str(project.id)}, headers={**headers, "If-None-Match": etag}
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    other_filter = client.get("/api/items", headers={**headers, "If-None-Match": etag})
+    assert other_filter.status_code == 200
+
+    client.patch(f"/api/items/{created.json()['id']}", json={"name": "Renamed"}, headers=headers)
+    changed = client.get(
+        "/api/items", params={"project_id": str(project.id)}, headers={**headers, "If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert changed.json()[0]["name"] == "Renamed"
+
+
+def test_item_detail_endpoint(client, admin_token, project):
+    """Item detail returns the requested parts and validates include=."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    item = client.post(
+        "/api/items",
+        json={"project_id": str(project.id), "part_number": "DETAIL-001", "name": "Detail Item"},
+        headers=headers,
+    ).json()
+    client.patch(f"/api/items/{item['id']}/progress", json={"new_progress": 40}, headers=headers)
+
+    full = client.get(f"/api/items/{item['id']}/detail", headers=headers)
+    assert full.status_code == 200
+    body = full.json()
+    assert body["item"]["part_number"] == "DETAIL-001"
+    assert body["documents"] == []
+    assert body["progress_history"][0]["new_progress"] == 40
+    assert body["progress_history"][0]["changed_by"]["email"] == "admin@test.com"
+
+    only_item = client.get(f"/api/items/{item['id']}/detail", params={"include": ""}, headers=headers)
+    assert only_item.json()["documents"] is None
+    assert only_item.json()["progress_history"] is None
+
+    bad = client.get(f"/api/items/{item['id']}/detail", params={"include": "comments"}, headers=headers)
+    assert bad.status_code == 400
+
+    missing = client.get(f"/api/items/{uuid4()}/detail", headers=headers)
+    assert missing.status_code == 404
+
+
+def test_items_list_filters_sort_and_search(client, admin_token, project):
+    """Status, progress range, search and sort are applied server-side."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    for part_number, name, item_status in (
+        ("ABC-100", "Рама сварная", "in_progress"),
+        ("ABC-200", "Кронштейн", "draft"),
+        ("XYZ-1_0", "Рама опорная", "in_progress"),
+    ):
+        item = client.post(
+            "/api/items",
+            json={"project_id": str(project.id), "part_number": part_number, "name": name, "status": item_status},
+            headers=headers,
+        ).json()
+        if part_number == "ABC-100":
+            client.patch(f"/api/items/{item['id']}/progress", json={"new_progress": 60}, headers=headers)
+
+    def part_numbers(**params):
+        response = client.get("/api/items", params={"project_id": str(project.id), **params}, headers=headers)
+        assert response.status_code == 200
+        return [i["part_number"] for i in response.json()]
+
+    assert part_numbers(status="in_progress", sort="part_number") == ["ABC-100", "XYZ-1_0"]
+    assert part_numbers(status=["draft", "in_progress"], sort="-part_number") == ["XYZ-1_0", "ABC-200", "ABC-100"]
+    assert part_numbers(progress_min=50) == ["ABC-100"]
+    assert part_numbers(q="рама", sort="name") == ["ABC-100", "XYZ-1_0"]
+    assert part_numbers(q="1_", sort="part_number") == ["XYZ-1_0"]  # "_" is literal, not a wildcard
+    assert part_numbers(q="abc", match="prefix", sort="part_number") == ["ABC-100", "ABC-200"]
+    assert part_numbers(q="200", match="prefix") == []
+    assert part_numbers(has_documents=True) == []
+    assert len(part_numbers(has_documents=False)) == 3
+
+    bad = client.get("/api/items", params={"sort": "created_by"}, headers=headers)
+    assert bad.status_code == 400
@@ -2,6 +2,7 @@ import pytest
 
 from app.models.project import Project, ProjectStatus
 from app.models.audit_log import AuditLog
+from app.utils.cache import InMemoryCacheBackend, response_cache
 
 
 @pytest.fixture
@@ -97,3 +98,143 @@ def test_update_project_not_found(client, admin_token):
 
     assert response.status_code == 404
 
+
+
+@pytest.fixture
+def memory_cache(monkeypatch):
+    """Enable the in-process response cache (conftest disables it)."""
+    monkeypatch.setattr(response_cache, "backend", InMemoryCacheBackend())
+    return response_cache
+
+
+def test_projects_list_etag_revalidation(client, admin_token, project, memory_cache):
+    """Unchanged project list answers 304; a mutation invalidates it."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    first = client.get("/api/projects", headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    not_modified = client.get("/api/projects", headers={**headers, "If-None-Match": etag})
+    assert not_modified.status_code == 304
+
+    client.patch(f"/api/projects/{project.id}", json={"name": "Renamed"}, headers=headers)
+
+    changed = client.get("/api/projects", headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json()[0]["name"] == "Renamed"
+
+
+def test_project_summary_endpoints(client, admin_token, project):
+    """Summary routes resolve before /{project_id} and 404 on unknown projects."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    single = client.get(f"/api/projects/{project.id}/summary", headers=headers)
+    assert single.status_code == 200
+    assert single.json()["project_id"] == str(project.id)
+    assert single.json()["items_count"] == 0
+
+    many = client.get("/api/projects/summary", params={"project_id": [str(project.id)]}, headers=headers)
+    assert many.status_code == 200
+    assert [s["project_id"] for s in many.json()] == [str(project.id)]
+
+    missing = client.get("/api/projects/00000000-0000-0000-0000-000000000000/summary", headers=headers)
+    assert missing.status_code == 404
+
+
+def test_project_and_section_bundles(client, admin_token, db, project, responsible_user):
+    import io
+    import zipfile
+
+    from app.models.item import Item
+    from app.models.project_section import ProjectSection
+
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    section = ProjectSection(project_id=project.id, code="KM")
+    db.add(section)
+    db.commit()
+    items = [
+        Item(project_id=project.id, section_id=section.id, part_number="BND-001", name="Рама", responsible_id=responsible_user.id),
+        Item(project_id=project.id, part_number="BND-002", name="Стойка", responsible_id=responsible_user.id),
+    ]
+    db.add_all(items)
+    db.commit()
+
+    def upload(item, title, content):
+        return client.post(
+            "/api/documents",
+            files={"file": ("drawing.pdf", io.BytesIO(content), "application/pdf")},
+            data={"item_id": str(item.id), "title": title},
+            headers=headers,
+        ).json()
+
+    drawing = upload(items[0], "Чертёж", b"%PDF-1.4 frame -")
+    client.post(
+        f"/api/documents/{drawing['id']}/revisions",
+        files={"file": ("drawing.pdf", io.BytesIO(b"%PDF-1.4 frame A"), "application/pdf")},
+        data={"change_note": "Размеры"},
+        headers=headers,
+    )
+    upload(items[0], "Спецификация", b"%PDF-1.4 frame spec")
+    upload(items[0], "Ведомость", b"%PDF-1.4 frame list")
+    upload(items[1], "Чертёж", b"%PDF-1.4 post")
+
+    response = client.get(f"/api/projects/{project.id}/bundle", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+    assert sorted(archive.namelist()) == ["BND-001_- (2).pdf", "BND-001_-.pdf", "BND-001_A.pdf", "BND-002_-.pdf"]
+    assert archive.read("BND-001_A.pdf") == b"%PDF-1.4 frame A"
+
+    section_bundle = client.get(f"/api/projects/sections/{section.id}/bundle", headers=headers)
+    assert len(zipfile.ZipFile(io.BytesIO(section_bundle.content)).namelist()) == 3
+
+    assert client.get("/api/projects/00000000-0000-0000-0000-000000000000/bundle", headers=headers).status_code == 404
+
+
+def test_project_register_export(client, admin_token, admin_user, db, project, responsible_user):
+    import csv
+    import io
+
+    from openpyxl import load_workbook
+
+    from app.models.item import Item
+    from app.models.project_section import ProjectSection
+
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    section = ProjectSection(project_id=project.id, code="KM")
+    db.add(section)
+    db.commit()
+    framed = Item(project_id=project.id, section_id=section.id, part_number="REG-001", name="Рама", responsible_id=responsible_user.id)
+    bare = Item(project_id=project.id, part_number="REG-002", name="=СУММ(A1:A9)", responsible_id=responsible_user.id)
+    db.add_all([framed, bare])
+    db.commit()
+    client.post(
+        "/api/documents",
+        files={"file": ("drawing.pdf", io.BytesIO(b"%PDF-1.4 frame"), "application/pdf")},
+        data={"item_id": str(framed.id), "title": "Чертёж"},
+        headers=headers,
+    )
+
+    response = client.get(f"/api/projects/{project.id}/register", params={"format": "csv"}, headers=headers)
+    assert response.status_code == 200
+    rows = list(csv.reader(io.StringIO(response.content.decode("utf-8-sig")), delimiter=";"))
+    assert rows[0][0] == "Обозначение"
+    assert rows[1][:7] == ["REG-001", "Рама", "KM", "draft", "0", "Чертёж", "-"]
+    assert rows[1][8] == admin_user.full_name
+    assert rows[2] == ["REG-002", "'=СУММ(A1:A9)", "", "draft", "0", "", "", "", ""]
+
+    workbook_response = client.get(
+        f"/api/projects/{project.id}/register", params={"section_id": str(section.id)}, headers=headers
+    )
+    sheet = load_workbook(io.BytesIO(workbook_response.content)).active
+    assert [row[0] for row in sheet.iter_rows(values_only=True)] == ["Обозначение", "REG-001"]
+
+    assert client.get(f"/api/projects/{project.id}/register", params={"format": "pdf"}, headers=headers).status_code == 400
+
+    other = Project(name="Other Project")
+    db.add(other)
+    db.commit()
+    foreign = client.get(f"/api/projects/{other.id}/register", params={"section_id": str(section.id)}, headers=headers)
+    assert foreign.status_code == 404
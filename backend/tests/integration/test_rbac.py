@@ -180,3 +180,22 @@ def test_responsible_cannot_view_audit_log(client, responsible_token):
     
     assert response.status_code == 403
 
+
+
+def test_traces_require_admin(client, admin_token, viewer_token):
+    """Span attributes expose request paths: traces are admin-only."""
+    assert client.get("/metrics/traces").status_code == 401
+    viewer = client.get("/metrics/traces", headers={"Authorization": f"Bearer {viewer_token}"})
+    assert viewer.status_code == 403
+    admin = client.get("/metrics/traces", headers={"Authorization": f"Bearer {admin_token}"})
+    assert admin.status_code != 403
+
+
+def test_db_pool_metrics_require_admin(client, admin_token, viewer_token):
+    """Pool saturation and per-route hold times are admin-only; /metrics stays open for scraping."""
+    assert client.get("/metrics/db-pool").status_code == 401
+    viewer = client.get("/metrics/db-pool", headers={"Authorization": f"Bearer {viewer_token}"})
+    assert viewer.status_code == 403
+    admin = client.get("/metrics/db-pool", headers={"Authorization": f"Bearer {admin_token}"})
+    assert admin.status_code == 200
+    assert client.get("/metrics").status_code == 200
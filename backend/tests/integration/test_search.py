@@ -0,0 +1,116 @@
+import io
+
+import pytest
+
+from app.models.project import Project
+from app.models.project_section import ProjectSection
+from app.services.pdf_text_service import pdf_text_extractor
+
+
+@pytest.fixture
+def project(db):
+    """Create test project."""
+    project = Project(name="Search Project")
+    db.add(project)
+    db.commit()
+    db.refresh(project)
+    return project
+
+
+@pytest.fixture
+def section(db, project):
+    """Create test section."""
+    section = ProjectSection(project_id=project.id, code="КМД")
+    db.add(section)
+    db.commit()
+    db.refresh(section)
+    return section
+
+
+@pytest.fixture
+def items(client, admin_token, project, section):
+    """Create items to search through."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    created = []
+    for part_number, name in (
+        ("БНС.КМД.00010", "Рама сварная"),
+        ("БНС.КМД.00020", "Кронштейн"),
+        ("БНС.КМ.00030", "Ёмкость опорная"),
+    ):
+        response = client.post(
+            "/api/items",
+            json={"project_id": str(project.id), "part_number": part_number, "name": name},
+            headers=headers,
+        )
+        created.append(response.json())
+    return created
+
+
+def test_search_items_by_stem_code_and_yo(client, admin_token, items):
+    """Russian stemming, part number substrings and ё/е folding all match."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    def titles(q):
+        response = client.get("/api/search", params={"q": q}, headers=headers)
+        assert response.status_code == 200
+        return [hit["title"] for hit in response.json()["results"]]
+
+    assert titles("рамы") == ["БНС.КМД.00010"]
+    assert set(titles("КМД.000")[:2]) == {"БНС.КМД.00010", "БНС.КМД.00020"}
+    assert titles("емкость") == ["БНС.КМ.00030"]
+
+
+def test_search_cursor_pagination(client, admin_token, items):
+    """Pages do not overlap and the last page has no cursor."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    first = client.get("/api/search", params={"q": "БНС", "limit": 2}, headers=headers).json()
+    assert len(first["results"]) == 2
+    assert first["next_cursor"]
+
+    second = client.get(
+        "/api/search", params={"q": "БНС", "limit": 2, "cursor": first["next_cursor"]}, headers=headers
+    ).json()
+    assert len(second["results"]) == 1
+    assert second["next_cursor"] is None
+
+    seen = {hit["id"] for hit in first["results"] + second["results"]}
+    assert seen == {item["id"] for item in items}
+
+
+def test_search_validates_parameters(client, admin_token):
+    """Unknown kinds, blank queries and broken cursors are rejected."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    assert client.get("/api/search", params={"q": "рама", "kind": "user"}, headers=headers).status_code == 400
+    assert client.get("/api/search", params={"q": "   "}, headers=headers).status_code == 400
+    assert client.get("/api/search", params={"q": "рама", "cursor": "x"}, headers=headers).status_code == 400
+    assert client.get("/api/search", params={"q": "рама"}).status_code in (401, 403)
+
+
+def test_content_search_finds_text_inside_pdfs(client, admin_token, db, items, make_pdf):
+    """Extracted PDF text is searchable, with escaped, highlighted snippets."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    pdf = make_pdf("Notes: weld seams <A> per GOST 14771", "Title block: frame assembly")
+    document = client.post(
+        "/api/documents",
+        files={"file": ("frame.pdf", io.BytesIO(pdf), "application/pdf")},
+        data={"item_id": items[0]["id"], "title": "Сборочный чертеж"},
+        headers=headers,
+    ).json()
+    revision_id = document["current_revision"]["id"]
+
+    assert pdf_text_extractor.process(db, revision_id) == "done"
+    assert pdf_text_extractor.process(db, revision_id) is None  # already extracted
+
+    response = client.get("/api/search/content", params={"q": "welded seams"}, headers=headers)
+    assert response.status_code == 200
+    [hit] = response.json()["results"]
+    assert hit["revision_id"] == revision_id
+    assert hit["document_title"] == "Сборочный чертеж"
+    assert hit["page_count"] == 2
+    assert "<mark>seams</mark>" in hit["snippet"]
+    assert "&lt;A&gt;" in hit["snippet"]
+
+    missing = client.get("/api/search/content", params={"q": "hydraulics"}, headers=headers)
+    assert missing.json() == {"results": [], "next_cursor": None}
@@ -7,6 +7,8 @@ from app.models.project_section import ProjectSection
 from app.models.tech_document import TechDocument
 from app.models.audit_log import AuditLog
 from app.models.notification import Notification
+from app.models.tech_document_index import TechDocumentIndex
+from app.services.tech_document_index_service import excel_cell_indexer
 
 
 def build_excel_file() -> io.BytesIO:
@@ -217,3 +219,136 @@ def test_notification_sent(client, admin_token, admin_user, section, db):
         Notification.user_id == admin_user.id
     ).all()
     assert len(notifications) >= 1
+
+
+def test_cell_index_search_and_unchanged_version_reuse(client, admin_token, db, section):
+    """Cells are searchable by sheet/cell; a re-upload with the same sha256 copies the index."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    workbook = Workbook()
+    workbook.active.title = "Маршрут"
+    workbook.active["B3"] = "Сверлить отверстие Ø12"
+    workbook.active["C4"] = "Фрезерная"
+    stream = io.BytesIO()
+    workbook.save(stream)
+    content = stream.getvalue()
+    mime = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+    document = client.post(
+        f"/api/tech/sections/{section.id}/documents",
+        files={"file": ("route.xlsx", io.BytesIO(content), mime)},
+        headers=headers,
+    ).json()
+    assert excel_cell_indexer.process(db, (document["id"], 1)) == "done"
+
+    response = client.get("/api/search/tech-documents", params={"q": "отверстия"}, headers=headers)
+    assert response.status_code == 200
+    [hit] = response.json()["results"]
+    assert (hit["filename"], hit["sheet"], hit["cell"], hit["version"]) == ("route.xlsx", "Маршрут", "B3", 1)
+    assert hit["value"] == "Сверлить отверстие Ø12"
+
+    client.put(
+        f"/api/tech/documents/{document['id']}",
+        files={"file": ("route.xlsx", io.BytesIO(content), mime)},
+        headers=headers,
+    )
+    assert excel_cell_indexer.process(db, (document["id"], 2)) is None  # copied, not parsed
+    index = db.get(TechDocumentIndex, (document["id"], 2))
+    assert (index.status, index.cell_count) == ("done", 2)
+
+    current = client.get("/api/search/tech-documents", params={"q": "фрезерная"}, headers=headers).json()
+    assert [(h["version"], h["cell"]) for h in current["results"]] == [(2, "C4")]
+    history = client.get(
+        "/api/search/tech-documents", params={"q": "фрезерная", "all_versions": True}, headers=headers
+    ).json()
+    assert sorted(h["version"] for h in history["results"]) == [1, 2]
+
+
+def test_document_rows_filter_sort_and_versions(client, admin_token, section):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    mime = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    workbook = Workbook()
+    workbook.active.title = "Маршрут"
+    workbook.active.append(["№", "Операция", "Время"])
+    for number in range(1, 301):
+        workbook.active.append([f"{number * 5:03d}", "Сверлить" if number % 100 == 0 else "Точить", number])
+    stream = io.BytesIO()
+    workbook.save(stream)
+    stream.seek(0)
+
+    document = client.post(
+        f"/api/tech/sections/{section.id}/documents",
+        files={"file": ("route.xlsx", stream, mime)},
+        headers=headers,
+    ).json()
+
+    response = client.get(
+        f"/api/tech/documents/{document['id']}/rows",
+        params={"filter": ["B~сверл"], "sort": "-C", "limit": 2},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert (result["sheet"], result["sheets"], result["version"]) == ("Маршрут", ["Маршрут"], 1)
+    assert result["header"] == ["№", "Операция", "Время"]
+    assert (result["total_rows"], result["matched_rows"]) == (300, 3)
+    assert [row["row_number"] for row in result["rows"]] == [301, 201]
+
+    client.put(
+        f"/api/tech/documents/{document['id']}",
+        files={"file": ("route.xlsx", build_excel_file(), mime)},
+        headers=headers,
+    )
+    current = client.get(f"/api/tech/documents/{document['id']}/rows", params={"header": False}, headers=headers).json()
+    assert (current["version"], current["total_rows"]) == (2, 2)
+    archived = client.get(f"/api/tech/documents/{document['id']}/rows", params={"version": 1}, headers=headers).json()
+    assert archived["total_rows"] == 300
+
+    for params, code in [({"sheet": "Нет"}, 404), ({"version": 9}, 404), ({"filter": ["C>x"]}, 400)]:
+        assert client.get(f"/api/tech/documents/{document['id']}/rows", params=params, headers=headers).status_code == code
+
+
+def test_document_diff_between_versions(client, admin_token, section):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    mime = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+    def workbook_bytes(operation: str) -> io.BytesIO:
+        workbook = Workbook()
+        workbook.active.title = "Маршрут"
+        workbook.active.append(["005", "Заготовительная"])
+        workbook.active.append(["010", operation])
+        stream = io.BytesIO()
+        workbook.save(stream)
+        stream.seek(0)
+        return stream
+
+    document = client.post(
+        f"/api/tech/sections/{section.id}/documents",
+        files={"file": ("route.xlsx", workbook_bytes("Точить"), mime)},
+        headers=headers,
+    ).json()
+    assert client.get(f"/api/tech/documents/{document['id']}/diff", headers=headers).status_code == 400
+
+    client.put(
+        f"/api/tech/documents/{document['id']}",
+        files={"file": ("route.xlsx", workbook_bytes("Сверлить"), mime)},
+        headers=headers,
+    )
+    response = client.get(f"/api/tech/documents/{document['id']}/diff", headers=headers)
+    assert response.status_code == 200
+    result = response.json()
+    assert (result["from_version"], result["to_version"], result["identical"]) == (1, 2, False)
+    [sheet] = result["sheets"]
+    assert (sheet["name"], sheet["status"], sheet["rows_changed"]) == ("Маршрут", "changed", 1)
+    assert sheet["changes"] == [{
+        "type": "changed", "old_row": 2, "new_row": 2,
+        "cells": [{"column": "B", "old": "Точить", "new": "Сверлить"}],
+    }]
+
+    cached = client.get(
+        f"/api/tech/documents/{document['id']}/diff",
+        params={"from": 1, "to": 2},
+        headers={**headers, "If-None-Match": response.headers["etag"]},
+    )
+    assert cached.status_code == 304
+    missing = client.get(f"/api/tech/documents/{document['id']}/diff", params={"from": 5}, headers=headers)
+    assert missing.status_code == 404
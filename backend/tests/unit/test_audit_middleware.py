@@ -0,0 +1,49 @@
+"""Unit tests for AuditMiddleware client IP capture."""
+
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.middleware.audit_middleware import AuditMiddleware
+
+
+def _make_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(AuditMiddleware)
+
+    @app.get("/ip")
+    async def read_ip(request: Request):
+        return {"ip": getattr(request.state, "ip", None)}
+
+    @app.get("/stream")
+    async def stream():
+        async def body():
+            for chunk in (b"a" * 10, b"b" * 10):
+                yield chunk
+
+        return StreamingResponse(body(), media_type="application/pdf")
+
+    return app
+
+
+def test_ip_from_forwarded_for():
+    with TestClient(_make_app()) as client:
+        response = client.get("/ip", headers={"X-Forwarded-For": "10.0.0.1, 10.0.0.2"})
+
+    assert response.json() == {"ip": "10.0.0.1"}
+
+
+def test_ip_from_client():
+    scope = {"type": "http", "headers": [], "client": ("192.168.1.5", 50000)}
+    assert AuditMiddleware._get_client_ip(scope) == "192.168.1.5"
+
+
+def test_ip_missing_client():
+    assert AuditMiddleware._get_client_ip({"type": "http", "headers": [], "client": None}) is None
+
+
+def test_streaming_response_passes_through():
+    with TestClient(_make_app()) as client:
+        response = client.get("/stream")
+
+    assert response.content == b"a" * 10 + b"b" * 10
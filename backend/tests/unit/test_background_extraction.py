@@ -0,0 +1,115 @@
+"""Unit tests for the background extractor (real spawn pools, fake storage)."""
+
+import time
+from contextlib import nullcontext
+
+from app.utils.background_extraction import STATUS_DONE, STATUS_FAILED, STATUS_TIMEOUT, BackgroundExtractor
+
+
+def upper(text: str) -> str:
+    if text == "broken":
+        raise ValueError("cannot parse")
+    if text == "slow":
+        time.sleep(60)
+    return text.upper()
+
+
+class FakeDB:
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, statement):
+        self.statements.append(statement)
+
+    def commit(self):
+        pass
+
+
+class RecordingExtractor(BackgroundExtractor):
+    name = "test"
+    extract = staticmethod(upper)
+
+    def __init__(self, **options):
+        super().__init__(lambda: nullcontext(FakeDB()), **options)
+        self.stored = {}
+
+    def prepare(self, db, key):
+        return None if key == "skip" else (key,)
+
+    def store(self, db, key, status, result=None, error=None):
+        self.stored[key] = (status, result, error)
+
+    def pending(self, db, limit):
+        return ["backfilled"]
+
+
+def _wait_for(extractor, keys, timeout=20):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and not set(keys) <= set(extractor.stored):
+        time.sleep(0.05)
+
+
+def test_process_inline():
+    extractor = RecordingExtractor()
+
+    assert extractor.process(FakeDB(), "a") == STATUS_DONE
+    assert extractor.process(FakeDB(), "broken") == STATUS_FAILED
+    assert extractor.process(FakeDB(), "skip") is None
+    assert extractor.stored == {
+        "a": (STATUS_DONE, "A", None),
+        "broken": (STATUS_FAILED, None, "cannot parse"),
+    }
+
+
+def test_workers_extract_in_background_and_recover_from_timeouts():
+    extractor = RecordingExtractor(workers=1, timeout=5)  # includes worker process start-up
+    extractor.start()
+    try:
+        extractor.enqueue(["slow", "after"])
+        _wait_for(extractor, ["backfilled", "slow", "after"])
+    finally:
+        extractor.stop()
+
+    assert extractor.stored["backfilled"] == (STATUS_DONE, "BACKFILLED", None)
+    assert extractor.stored["slow"][0] == STATUS_TIMEOUT
+    assert extractor.stored["after"] == (STATUS_DONE, "AFTER", None)
+
+
+def test_disabled_extractor_ignores_keys():
+    extractor = RecordingExtractor(enabled=False)
+    extractor.start()
+    extractor.enqueue(["a"])
+
+    assert extractor._threads == []
+    assert extractor._queue.empty()
+
+
+def test_enqueue_skips_keys_already_waiting():
+    extractor = RecordingExtractor()
+    extractor.enqueue(["a", "b", "a"])
+    extractor.enqueue(["b"])
+
+    assert extractor._queue.qsize() == 2
+
+
+def test_visual_diff_timeout_removes_staging_dirs(tmp_path, monkeypatch):
+    from uuid import uuid4
+
+    from app.config import settings
+    from app.services.visual_diff_service import visual_diff_dir, visual_diff_renderer
+
+    monkeypatch.setattr(settings, "FILE_STORAGE_PATH", str(tmp_path))
+    key, other = (uuid4(), uuid4()), (uuid4(), uuid4())
+    staging = []
+    for pair in (key, other):
+        output = visual_diff_dir(*pair)
+        staging.append(output.parent / f".{output.name}-xxx")
+        (staging[-1] / "page-1").mkdir(parents=True)
+    db = FakeDB()
+
+    # The worker killed on timeout never removed its staging directory
+    visual_diff_renderer.store(db, key, STATUS_TIMEOUT, error="Extraction exceeded 120s")
+
+    assert not staging[0].exists()
+    assert staging[1].exists()
+    assert len(db.statements) == 1
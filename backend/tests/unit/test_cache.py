@@ -0,0 +1,215 @@
+"""Unit tests for the response cache and ETag helpers."""
+
+import fnmatch
+from datetime import datetime
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models.item import Item
+
+from app.utils.cache import (
+    InMemoryCacheBackend,
+    NullCacheBackend,
+    RedisCacheBackend,
+    ResponseCache,
+    compute_etag,
+)
+from app.utils.http_cache import collection_version, conditional_json_response, version_etag
+
+
+class FakeRedis:
+    """Minimal Redis-protocol stand-in (get/set ex/incr/delete/scan_iter); ignores expiry."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value if isinstance(value, bytes) else str(value).encode()
+
+    def incr(self, key):
+        value = int(self.data.get(key, b"0")) + 1
+        self.data[key] = str(value).encode()
+        return value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def scan_iter(self, match):
+        return [key for key in list(self.data) if fnmatch.fnmatch(key, match)]
+
+
+class Producer:
+    def __init__(self, body: bytes = b'[{"id": 1}]'):
+        self.body = body
+        self.calls = 0
+
+    def __call__(self) -> bytes:
+        self.calls += 1
+        return self.body
+
+
+def test_get_or_set_calls_producer_once():
+    cache = ResponseCache(InMemoryCacheBackend(), default_ttl=60)
+    producer = Producer()
+
+    first = cache.get_or_set("projects", "list", producer)
+    second = cache.get_or_set("projects", "list", producer)
+
+    assert producer.calls == 1
+    assert first == second
+    assert first.body == producer.body
+    assert first.etag == compute_etag(producer.body)
+
+
+def test_invalidate_drops_only_that_namespace():
+    cache = ResponseCache(InMemoryCacheBackend(), default_ttl=60)
+    projects, users = Producer(), Producer()
+    cache.get_or_set("projects", "list", projects)
+    cache.get_or_set("users", "list", users)
+
+    cache.invalidate("projects")
+    cache.get_or_set("projects", "list", projects)
+    cache.get_or_set("users", "list", users)
+
+    assert projects.calls == 2
+    assert users.calls == 1
+
+
+def test_expired_entry_is_rebuilt(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("app.utils.cache.time.monotonic", lambda: clock[0])
+    cache = ResponseCache(InMemoryCacheBackend(), default_ttl=60)
+    producer = Producer()
+
+    cache.get_or_set("sections", "id:1", producer, ttl=10)
+    clock[0] += 11
+    cache.get_or_set("sections", "id:1", producer, ttl=10)
+
+    assert producer.calls == 2
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = InMemoryCacheBackend(max_entries=2)
+    backend.set("a", b"1", 60)
+    backend.set("b", b"2", 60)
+    backend.get("a")
+    backend.set("c", b"3", 60)
+
+    assert backend.get("a") == b"1"
+    assert backend.get("b") is None
+    assert backend.get("c") == b"3"
+
+
+def test_producer_errors_are_not_cached():
+    cache = ResponseCache(InMemoryCacheBackend(), default_ttl=60)
+
+    def failing() -> bytes:
+        raise LookupError("not found")
+
+    try:
+        cache.get_or_set("sections", "id:1", failing)
+    except LookupError:
+        pass
+    producer = Producer()
+    cache.get_or_set("sections", "id:1", producer)
+
+    assert producer.calls == 1
+
+
+def test_redis_backend_shares_entries_and_invalidation():
+    client = FakeRedis()
+    worker_a = ResponseCache(RedisCacheBackend(client), default_ttl=60)
+    worker_b = ResponseCache(RedisCacheBackend(client), default_ttl=60)
+    producer = Producer()
+
+    worker_a.get_or_set("users", "list", producer)
+    worker_b.get_or_set("users", "list", producer)
+    assert producer.calls == 1
+
+    worker_a.invalidate("users")
+    worker_b.get_or_set("users", "list", producer)
+    assert producer.calls == 2
+    assert all(key.startswith("mes_edms:cache:") for key in client.data)
+
+    worker_a.clear()
+    assert client.data == {}
+
+
+def test_null_backend_always_misses():
+    cache = ResponseCache(NullCacheBackend(), default_ttl=60)
+    producer = Producer()
+
+    cache.get_or_set("projects", "list", producer)
+    cached = cache.get_or_set("projects", "list", producer)
+
+    assert producer.calls == 2
+    assert cached.etag == compute_etag(producer.body)
+
+
+def _make_app(cache: ResponseCache, producer: Producer) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/things")
+    def things(request: Request):
+        return conditional_json_response(request, cache.get_or_set("things", "list", producer))
+
+    return app
+
+
+def test_conditional_response_returns_304_for_matching_etag():
+    producer = Producer()
+    with TestClient(_make_app(ResponseCache(InMemoryCacheBackend(), 60), producer)) as client:
+        first = client.get("/things")
+        etag = first.headers["ETag"]
+        revalidated = client.get("/things", headers={"If-None-Match": etag})
+        weak = client.get("/things", headers={"If-None-Match": f'"other", W/{etag}'})
+        stale = client.get("/things", headers={"If-None-Match": '"other"'})
+
+    assert first.status_code == 200
+    assert first.json() == [{"id": 1}]
+    assert first.headers["Cache-Control"] == "private, no-cache"
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["ETag"] == etag
+    assert weak.status_code == 304
+    assert stale.status_code == 200
+    assert producer.calls == 1
+
+
+def test_etag_changes_after_invalidation():
+    cache = ResponseCache(InMemoryCacheBackend(), 60)
+    producer = Producer()
+    with TestClient(_make_app(cache, producer)) as client:
+        etag = client.get("/things").headers["ETag"]
+        producer.body = b'[{"id": 2}]'
+        cache.invalidate("things")
+        response = client.get("/things", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json() == [{"id": 2}]
+    assert response.headers["ETag"] != etag
+
+
+def test_version_etag_is_weak_and_deterministic():
+    stamp = datetime(2025, 1, 1, 12, 0)
+    etag = version_etag("items", None, 3, stamp)
+
+    assert etag.startswith('W/"')
+    assert etag == version_etag("items", None, 3, stamp)
+    assert etag != version_etag("items", None, 2, stamp)
+    assert etag != version_etag("documents", None, 3, stamp)
+
+
+def test_collection_version_compiles_to_scalar_subqueries():
+    query = select(*collection_version(Item.updated_at, Item.current_progress > 50))
+    sql = str(query.compile(dialect=postgresql.dialect()))
+
+    assert sql.count("FROM items") == 2
+    assert "count(*)" in sql
+    assert "max(items.updated_at)" in sql
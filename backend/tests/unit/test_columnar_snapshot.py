@@ -0,0 +1,138 @@
+"""Unit tests for columnar sheet snapshots and sheet queries."""
+
+import pytest
+from fastapi import HTTPException
+from openpyxl import Workbook
+
+from app.services.tech_sheet_service import parse_filters, query_sheet
+from app.utils.columnar_snapshot import ColumnarSnapshot, build_snapshot, write_snapshot
+
+ROUTE = [
+    ["№", "Операция", "Время"],
+    ["005", "Заготовительная", 1.5],
+    ["010", "Сверлить отверстие Ø12", 12],
+    ["015", "Фрезерная", None],
+    ["020", "Сверлить ЁЛКУ", 3],
+    ["025", "Контроль", "н/д"],
+]
+
+
+@pytest.fixture
+def route_sheet(tmp_path):
+    path = tmp_path / "route.colsnap"
+    write_snapshot(path, [("Маршрут", ROUTE), ("Пустой", [])])
+    snapshot = ColumnarSnapshot(path)
+    yield snapshot.sheet("Маршрут")
+    snapshot.close()
+
+
+def _numbers(result):
+    return [row["cells"][0] for row in result["rows"]]
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = tmp_path / "route.colsnap"
+    write_snapshot(path, [("Маршрут", [["a", None], ["ё", 2.5, "лишняя"]]), ("Пустой", [])])
+
+    snapshot = ColumnarSnapshot(path)
+    sheet = snapshot.sheet()
+    assert [s.name for s in snapshot.sheets] == ["Маршрут", "Пустой"]
+    assert (sheet.row_count, sheet.column_count) == (2, 3)
+    assert sheet.row(0) == ["a", "", ""]
+    assert sheet.row(1) == ["ё", "2.5", "лишняя"]
+    assert sheet.columns[1].numbers[1] == 2.5
+    assert snapshot.sheet("Пустой").row_count == 0
+    assert snapshot.sheet("Нет") is None
+    snapshot.close()
+
+
+def test_build_snapshot_from_workbook(tmp_path):
+    workbook = Workbook()
+    workbook.active.append(["Операция", "Время"])
+    workbook.active.append(["Токарная", 4])
+    xlsx = tmp_path / "route.xlsx"
+    workbook.save(xlsx)
+
+    build_snapshot(xlsx, tmp_path / "route.colsnap")
+
+    snapshot = ColumnarSnapshot(tmp_path / "route.colsnap")
+    assert snapshot.sheet().row(1) == ["Токарная", "4"]
+    snapshot.close()
+
+
+def test_find_rows_does_not_match_across_cells(route_sheet):
+    column = route_sheet.columns[0]
+    # "005" + "010" are adjacent in the blob: "50" only spans a cell boundary
+    assert column.folded.find_rows("50") == set()
+    assert column.folded.find_rows("0") == {1, 2, 3, 4, 5}
+
+
+def test_find_rows_empty_needle_matches_every_row(route_sheet):
+    assert route_sheet.columns[2].folded.find_rows("") == set(range(6))
+
+
+def test_query_sheet_search_filters_and_paging(route_sheet):
+    result = query_sheet(route_sheet, q="сверлить")
+    assert result["header"] == ["№", "Операция", "Время"]
+    assert (result["total_rows"], result["matched_rows"]) == (5, 2)
+    assert [row["row_number"] for row in result["rows"]] == [3, 5]
+
+    assert _numbers(query_sheet(route_sheet, q="елку")) == ["020"]
+    assert _numbers(query_sheet(route_sheet, filters=parse_filters(["C>=3"]))) == ["010", "020"]
+    assert _numbers(query_sheet(route_sheet, filters=parse_filters(["C=12", "B~отв"]))) == ["010"]
+    assert _numbers(query_sheet(route_sheet, filters=parse_filters(["B!=фрезерная"]))) == ["005", "010", "020", "025"]
+
+    page = query_sheet(route_sheet, offset=1, limit=2)
+    assert (page["matched_rows"], _numbers(page)) == (5, ["010", "015"])
+
+
+def test_query_sheet_sort_numbers_text_and_empty(route_sheet):
+    assert _numbers(query_sheet(route_sheet, sort="C")) == ["005", "020", "010", "025", "015"]
+    assert _numbers(query_sheet(route_sheet, sort="-C")) == ["010", "020", "005", "025", "015"]
+
+    without_header = query_sheet(route_sheet, header=False, sort="B")
+    assert without_header["header"] is None
+    assert without_header["total_rows"] == 6
+
+
+def test_query_sheet_sort_descending_keeps_numbers_before_text(tmp_path):
+    path = tmp_path / "mixed.colsnap"
+    write_snapshot(path, [("Лист", [["б"], [2], [None], ["А"], [10], ["в"]])])
+    snapshot = ColumnarSnapshot(path)
+
+    ascending = query_sheet(snapshot.sheet(), header=False, sort="A")
+    descending = query_sheet(snapshot.sheet(), header=False, sort="-A")
+
+    assert _numbers(ascending) == ["2", "10", "А", "б", "в", ""]
+    assert _numbers(descending) == ["10", "2", "в", "б", "А", ""]
+    snapshot.close()
+
+
+@pytest.mark.parametrize("raw", ["Время>1", "C>abc", "1=2", "B", "A~", "B~"])
+def test_parse_filters_rejects_invalid(raw):
+    with pytest.raises(HTTPException) as exc_info:
+        parse_filters([raw])
+    assert exc_info.value.status_code == 400
+
+
+def test_query_sheet_rejects_unknown_column(route_sheet):
+    with pytest.raises(HTTPException) as exc_info:
+        query_sheet(route_sheet, sort="Z")
+    assert exc_info.value.status_code == 400
+
+
+def test_evicted_snapshot_stays_usable(tmp_path, monkeypatch):
+    from app.config import settings
+    from app.services import tech_sheet_service
+
+    monkeypatch.setattr(settings, "TECH_FILE_STORAGE_PATH", str(tmp_path))
+    monkeypatch.setattr(tech_sheet_service, "_OPEN_SNAPSHOTS", 1)
+    monkeypatch.setattr(tech_sheet_service, "_snapshots", type(tech_sheet_service._snapshots)())
+    for sha256 in ("first", "second"):
+        write_snapshot(tech_sheet_service.snapshot_path(sha256), [("Маршрут", ROUTE)])
+
+    first = tech_sheet_service.load_snapshot(tmp_path / "unused.xlsx", "first")
+    tech_sheet_service.load_snapshot(tmp_path / "unused.xlsx", "second")
+
+    assert "first" not in tech_sheet_service._snapshots
+    assert query_sheet(first.sheet("Маршрут"), q="сверлить")["matched_rows"] == 2
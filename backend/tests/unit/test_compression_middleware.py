@@ -0,0 +1,147 @@
+"""Unit tests for negotiated response compression."""
+
+import gzip
+import json
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.middleware.compression import CompressionMiddleware, _GzipEncoder, parse_accept_encoding
+
+ROWS = [{"id": n, "part_number": f"БНС.КМД.{n:05d}", "status": "in_progress"} for n in range(200)]
+
+
+class FakeZstdEncoder:
+    """Stand-in codec: marks the stream so tests can tell which encoder ran."""
+
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def flush(self) -> bytes:
+        return b"<end>"
+
+
+def _make_app(**options) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, **options)
+
+    @app.get("/items")
+    def items():
+        return ROWS
+
+    @app.get("/small")
+    def small():
+        return {"ok": True}
+
+    @app.get("/tagged")
+    def tagged():
+        return Response(json.dumps(ROWS), media_type="application/json", headers={"ETag": '"abc"'})
+
+    @app.get("/pdf")
+    def pdf():
+        return Response(b"%PDF-1.4" + b"0" * 5000, media_type="application/pdf")
+
+    @app.get("/stream")
+    def stream():
+        def body():
+            for n in range(50):
+                yield f"row {n}\n".encode() * 20
+
+        return StreamingResponse(body(), media_type="text/csv")
+
+    @app.get("/empty")
+    def empty():
+        return Response(status_code=204)
+
+    @app.get("/text")
+    def text():
+        return PlainTextResponse("x" * 4000)
+
+    return app
+
+
+def test_parse_accept_encoding():
+    assert parse_accept_encoding("gzip, br;q=0.5, zstd;q=0, *;q=bad") == {
+        "gzip": 1.0,
+        "br": 0.5,
+        "zstd": 0.0,
+        "*": 0.0,
+    }
+
+
+def test_large_json_is_gzipped():
+    with TestClient(_make_app()) as client:
+        response = client.get("/items", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < len(json.dumps(ROWS))
+    assert response.json() == ROWS  # httpx decodes gzip transparently
+
+
+def test_no_accept_encoding_is_identity():
+    with TestClient(_make_app()) as client:
+        response = client.get("/items", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in response.headers
+    assert response.json() == ROWS
+
+
+def test_small_responses_are_not_compressed():
+    with TestClient(_make_app(minimum_size=1024)) as client:
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert response.json() == {"ok": True}
+
+
+def test_pdf_and_bodiless_responses_pass_through():
+    with TestClient(_make_app()) as client:
+        pdf = client.get("/pdf", headers={"Accept-Encoding": "gzip"})
+        empty = client.get("/empty", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in pdf.headers
+    assert "vary" not in pdf.headers
+    assert pdf.content.startswith(b"%PDF-1.4")
+    assert empty.status_code == 204
+    assert "content-encoding" not in empty.headers
+
+
+def test_strong_etag_becomes_weak_when_encoded():
+    with TestClient(_make_app()) as client:
+        encoded = client.get("/tagged", headers={"Accept-Encoding": "gzip"})
+        plain = client.get("/tagged", headers={"Accept-Encoding": "identity"})
+
+    assert encoded.headers["etag"] == 'W/"abc"'
+    assert plain.headers["etag"] == '"abc"'
+
+
+def test_streaming_response_is_compressed_without_content_length():
+    with TestClient(_make_app()) as client, client.stream(
+        "GET", "/stream", headers={"Accept-Encoding": "gzip"}
+    ) as response:
+        raw = b"".join(response.iter_raw())
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert gzip.decompress(raw) == b"".join(f"row {n}\n".encode() * 20 for n in range(50))
+
+
+def test_server_preference_order_wins():
+    encoders = {"zstd": FakeZstdEncoder, "gzip": _GzipEncoder}
+    with TestClient(_make_app(algorithms=["zstd", "gzip"], encoders=encoders)) as client:
+        preferred = client.get("/text", headers={"Accept-Encoding": "gzip, zstd"})
+        refused = client.get("/text", headers={"Accept-Encoding": "gzip, zstd;q=0"})
+
+    assert preferred.headers["content-encoding"] == "zstd"
+    assert preferred.content.endswith(b"<end>")
+    assert refused.headers["content-encoding"] == "gzip"
+
+
+def test_unavailable_algorithms_are_skipped():
+    middleware = CompressionMiddleware(_make_app(), algorithms=["br", "gzip"], encoders={"gzip": _GzipEncoder})
+
+    assert list(middleware.encoders) == ["gzip"]
+    assert middleware.choose_encoding("br") is None
+    assert middleware.choose_encoding("*") == "gzip"
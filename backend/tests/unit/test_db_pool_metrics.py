@@ -0,0 +1,79 @@
+"""Unit tests for connection pool instrumentation."""
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.utils.db_pool_metrics import (
+    InstrumentedQueuePool,
+    NO_REQUEST_ROUTE,
+    PoolMetrics,
+    instrument_engine,
+)
+from app.utils.request_context import RequestContext, bind_request_context, reset_request_context
+
+
+class _FakeRoute:
+    path = "/api/items/{item_id}"
+
+
+@pytest.fixture
+def metrics():
+    return PoolMetrics("test")
+
+
+@pytest.fixture
+def engine(metrics, tmp_path):
+    pool_class = type("TestPool", (InstrumentedQueuePool,), {"metrics": metrics})
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=pool_class,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    instrument_engine(engine, metrics)
+    yield engine
+    engine.dispose()
+
+
+def test_checkout_wait_recorded(engine, metrics):
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    snapshot = metrics.snapshot(engine.pool)
+    assert snapshot["checkouts"] == 1
+    assert snapshot["checkout_wait"]["count"] == 1
+    assert snapshot["checkout_wait"]["buckets"][-1]["count"] == 1
+    assert snapshot["current"]["checked_out"] == 0
+
+
+def test_hold_time_attributed_to_route(engine, metrics):
+    context = RequestContext({"type": "http", "method": "GET", "route": _FakeRoute()})
+    token = bind_request_context(context)
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    finally:
+        reset_request_context(token)
+
+    routes = {r["route"]: r for r in metrics.snapshot()["hold_by_route"]}
+    assert routes["GET /api/items/{item_id}"]["checkouts"] == 1
+
+
+def test_hold_outside_request_uses_placeholder_route(engine, metrics):
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    routes = [r["route"] for r in metrics.snapshot()["hold_by_route"]]
+    assert routes == [NO_REQUEST_ROUTE]
+
+
+def test_pool_timeout_counted(engine, metrics):
+    with engine.connect():
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+    snapshot = metrics.snapshot(engine.pool)
+    assert snapshot["timeouts"] == 1
+    assert snapshot["max_checked_out"] == 1
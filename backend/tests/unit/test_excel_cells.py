@@ -0,0 +1,38 @@
+"""Unit tests for Excel cell extraction."""
+
+from openpyxl import Workbook
+
+from app.utils.excel_cells import MAX_VALUE_CHARS, extract_excel_cells
+
+
+def _save_workbook(path):
+    workbook = Workbook()
+    route = workbook.active
+    route.title = "Маршрут"
+    route["C3"] = "Сверлить  отв.\nØ12"
+    route["B5"] = 12.5
+    route["A6"] = "   "
+    route["A7"] = "x" * (MAX_VALUE_CHARS + 10)
+    workbook.create_sheet("Операции")["A1"] = "Фрезерная"
+    workbook.save(path)
+
+
+def test_extract_excel_cells_positions_and_text(tmp_path):
+    path = tmp_path / "route.xlsx"
+    _save_workbook(path)
+
+    cells = extract_excel_cells(str(path), max_cells=100)
+
+    assert cells == [
+        ("Маршрут", 3, 3, "Сверлить отв.\nØ12"),
+        ("Маршрут", 5, 2, "12.5"),
+        ("Маршрут", 7, 1, "x" * MAX_VALUE_CHARS),
+        ("Операции", 1, 1, "Фрезерная"),
+    ]
+
+
+def test_extract_excel_cells_stops_at_max_cells(tmp_path):
+    path = tmp_path / "route.xlsx"
+    _save_workbook(path)
+
+    assert [cell[:3] for cell in extract_excel_cells(str(path), max_cells=2)] == [("Маршрут", 3, 3), ("Маршрут", 5, 2)]
@@ -1,7 +1,7 @@
 """Unit tests for filename parser utility."""
 
 import pytest
-from app.utils.filename_parser import parse_filename
+from app.utils.filename_parser import FilenameParser, parse_filename
 
 
 class TestFilenameParser:
@@ -160,3 +160,32 @@ class TestFilenameParser:
         assert result["part_number"] == "12.456.789.001"
         assert result["name"] == "Деталь"
 
+
+class TestFilenameParserBatch:
+    """Tests for FilenameParser.parse_many."""
+
+    def test_parse_many_keeps_order_and_collects_codes(self):
+        """Test batch parsing returns per-file results and distinct codes."""
+        filenames = [
+            "БНС.КМД.123.456.789.001 Корпус.pdf",
+            "БНС.КМД.123.456.789.002 Крышка.pdf",
+            "БНС.ТХ.24. Ротор сборка.pdf",
+            "Документ без кода.pdf",
+        ]
+        batch = FilenameParser().parse_many(filenames)
+
+        assert [r["name"] for r in batch.results] == ["Корпус", "Крышка", "Ротор сборка", "Документ без кода"]
+        assert batch.section_codes == {"БНС.КМД", "БНС.ТХ"}
+        assert batch.part_numbers == {"123.456.789.001", "123.456.789.002", "24"}
+
+    def test_parse_many_matches_parse_filename(self):
+        """Test batch results are identical to single-file parsing."""
+        filenames = ["БНС.КМД.12.456.789.001 Деталь.pdf", "random_file_name.pdf", ""]
+        batch = FilenameParser().parse_many(filenames)
+        assert batch.results == [parse_filename(name) for name in filenames]
+
+    def test_parse_many_empty(self):
+        """Test empty batch."""
+        batch = FilenameParser().parse_many([])
+        assert batch.results == []
+        assert batch.section_codes == set()
@@ -0,0 +1,76 @@
+"""Unit tests for Prometheus request metrics."""
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.middleware.metrics import PrometheusMiddleware, UNMATCHED_ROUTE
+from app.middleware.request_context import RequestContextMiddleware
+from app.utils.request_context import get_request_context
+from app.utils.metrics import render_latest
+
+
+def _make_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(PrometheusMiddleware, routes=app.routes)
+    app.add_middleware(RequestContextMiddleware)
+
+    @app.get("/metrics-test/{thing_id}")
+    def read_thing(thing_id: int):
+        get_request_context().db_statements += 3
+        return {"id": thing_id}
+
+    @app.post("/metrics-test-upload")
+    async def upload(request: Request):
+        body = await request.body()
+        return {"size": len(body)}
+
+    return app
+
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_request_counted_by_route_template():
+    before = _sample("http_requests_total", method="GET", route="/metrics-test/{thing_id}", status="200")
+    with TestClient(_make_app()) as client:
+        client.get("/metrics-test/1")
+        client.get("/metrics-test/2")
+
+    after = _sample("http_requests_total", method="GET", route="/metrics-test/{thing_id}", status="200")
+    assert after - before == 2
+    assert _sample("http_requests_in_progress", method="GET", route="/metrics-test/{thing_id}") == 0
+
+
+def test_db_statements_observed_per_request():
+    before = _sample("http_request_db_statements_sum", method="GET", route="/metrics-test/{thing_id}")
+    with TestClient(_make_app()) as client:
+        client.get("/metrics-test/1")
+
+    after = _sample("http_request_db_statements_sum", method="GET", route="/metrics-test/{thing_id}")
+    assert after - before == 3
+
+
+def test_body_bytes_counted():
+    before = _sample("http_request_body_bytes_total", method="POST", route="/metrics-test-upload")
+    with TestClient(_make_app()) as client:
+        client.post("/metrics-test-upload", content=b"x" * 1000)
+
+    after = _sample("http_request_body_bytes_total", method="POST", route="/metrics-test-upload")
+    assert after - before == 1000
+
+
+def test_unknown_path_uses_bounded_label():
+    before = _sample("http_requests_total", method="GET", route=UNMATCHED_ROUTE, status="404")
+    with TestClient(_make_app()) as client:
+        client.get("/does-not-exist/123")
+
+    after = _sample("http_requests_total", method="GET", route=UNMATCHED_ROUTE, status="404")
+    assert after - before == 1
+
+
+def test_render_latest_prometheus_text():
+    content, content_type = render_latest()
+    assert content_type.startswith("text/plain")
+    assert b"http_request_duration_seconds" in content
@@ -0,0 +1,24 @@
+"""Unit tests for PDF text extraction and snippet rendering."""
+
+from app.services.pdf_text_service import render_snippet
+from app.utils.pdf_text import clean_text, extract_pdf_text
+
+
+def test_extract_pdf_text_pages_and_limits(tmp_path, make_pdf):
+    path = tmp_path / "drawing.pdf"
+    path.write_bytes(make_pdf("General notes: weld per GOST 14771", "Sheet 2   title block"))
+
+    assert extract_pdf_text(str(path), max_pages=10, max_chars=1000) == (
+        "General notes: weld per GOST 14771\nSheet 2 title block",
+        2,
+    )
+    assert extract_pdf_text(str(path), max_pages=1, max_chars=1000) == ("General notes: weld per GOST 14771", 2)
+    assert extract_pdf_text(str(path), max_pages=10, max_chars=7) == ("General", 2)
+
+
+def test_clean_text_strips_control_characters_and_blank_lines():
+    assert clean_text("a\x00b\x02c\n\n  d \t e  \n") == "a b c\nd e"
+
+
+def test_render_snippet_escapes_html_and_marks_matches():
+    assert render_snippet("<b>Рама</b> \x02сварная\x03 & ") == "&lt;b&gt;Рама&lt;/b&gt; <mark>сварная</mark> &amp; "
@@ -0,0 +1,52 @@
+"""Unit tests for PDF page overlays (need Pillow / pypdfium2 from requirements.txt)."""
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from app.utils.pdf_visual_diff import TILE_SIZE, diff_overlay, render_visual_diff, tile_path
+
+
+def _page(*boxes, size=(200, 100)):
+    image = Image.new("L", size, 255)
+    for box in boxes:
+        image.paste(0, box)
+    return image
+
+
+def test_diff_overlay_marks_removed_and_added_ink():
+    old = _page((10, 10, 20, 20))
+    new = _page((50, 10, 60, 30))
+
+    overlay, changed = diff_overlay(old, new)
+
+    assert overlay.size == (200, 100)
+    assert changed == 100 + 200
+    assert overlay.getpixel((15, 15)) == (220, 30, 30)
+    assert overlay.getpixel((55, 25)) == (30, 90, 220)
+    assert overlay.getpixel((150, 80)) == (255, 255, 255)
+
+
+def test_diff_overlay_identical_and_missing_pages():
+    page = _page((10, 10, 20, 20))
+    assert diff_overlay(page, page.copy())[1] == 0
+
+    overlay, changed = diff_overlay(None, _page((0, 0, 5, 5), size=(300, 50)))
+    assert (overlay.size, changed) == ((300, 50), 25)
+
+
+def test_render_visual_diff_writes_tiles(tmp_path, make_pdf):
+    pytest.importorskip("pypdfium2")
+    old_pdf, new_pdf = tmp_path / "old.pdf", tmp_path / "new.pdf"
+    old_pdf.write_bytes(make_pdf("Rev A"))
+    new_pdf.write_bytes(make_pdf("Rev B", "Sheet 2"))
+    output = tmp_path / "diff"
+
+    pages = render_visual_diff(str(old_pdf), str(new_pdf), str(output), dpi=72, max_pages=10, max_memory_mb=0)
+
+    assert [(page["page"], page["status"]) for page in pages] == [(1, "changed"), (2, "added")]
+    first = pages[0]
+    assert (first["width"], first["height"]) == (612, 792)
+    assert (first["rows"], first["columns"]) == (-(-792 // TILE_SIZE), -(-612 // TILE_SIZE))
+    assert tile_path(output, 1, first["rows"] - 1, first["columns"] - 1).exists()
+    assert not list(tmp_path.glob(".diff-*"))
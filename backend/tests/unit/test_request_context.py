@@ -0,0 +1,38 @@
+"""Unit tests for request context propagation."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.request_context import RequestContextMiddleware
+from app.utils.request_context import get_request_context
+
+
+def _make_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware)
+
+    @app.get("/things/{thing_id}")
+    def sync_route(thing_id: int):
+        return {"route": get_request_context().route}
+
+    @app.get("/async-things/{thing_id}")
+    async def async_route(thing_id: int):
+        return {"route": get_request_context().route}
+
+    return app
+
+
+def test_route_template_visible_in_sync_route():
+    with TestClient(_make_app()) as client:
+        response = client.get("/things/42")
+    assert response.json() == {"route": "GET /things/{thing_id}"}
+
+
+def test_route_template_visible_in_async_route():
+    with TestClient(_make_app()) as client:
+        response = client.get("/async-things/7")
+    assert response.json() == {"route": "GET /async-things/{thing_id}"}
+
+
+def test_no_context_outside_request():
+    assert get_request_context() is None
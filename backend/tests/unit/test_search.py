@@ -0,0 +1,39 @@
+"""Unit tests for search normalization and cursors."""
+
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.services.search_service import decode_cursor, encode_cursor
+from app.utils.search import normalize_text, search_vector_sql
+
+
+def test_normalize_text_folds_case_yo_and_whitespace():
+    assert normalize_text("  Ёлка   ЗЕЛЁНАЯ\tБНС.КМД ") == "елка зеленая бнс.кмд"
+
+
+def test_search_vector_sql_normalizes_like_queries():
+    sql = search_vector_sql(("part_number", "simple", "A"), ("name", "russian", "B"))
+
+    assert sql == (
+        "setweight(to_tsvector('simple', translate(lower(coalesce(part_number, '')), 'ё', 'е')), 'A') || "
+        "setweight(to_tsvector('russian', translate(lower(coalesce(name, '')), 'ё', 'е')), 'B')"
+    )
+
+
+def test_cursor_round_trip():
+    hit_id = uuid4()
+    cursor = encode_cursor(Decimal("0.412500"), "document", hit_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (Decimal("0.412500"), "document", hit_id)
+
+
+@pytest.mark.parametrize("cursor", ["garbage", encode_cursor(Decimal("1"), "item", uuid4())[:-4]])
+def test_invalid_cursor_is_400(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor)
+
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,77 @@
+"""Unit tests for the list serialization fast path."""
+
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import List
+
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+
+from app.schemas.notification import NotificationResponse
+from app.schemas.user import UserResponse
+from app.utils.serialization import ListSerializer
+
+
+def _notification(n: int, tz=timezone.utc) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        message=f"Уведомление {n}",
+        read_at=None if n % 2 else datetime(2025, 1, 2, 8, 30, 0, 123456, tzinfo=tz),
+        created_at=datetime(2025, 1, 1, 12, 0, tzinfo=tz),
+        event_payload={"event_type": "document.uploaded", "n": n, "tags": ["а", "b"]},
+    )
+
+
+def _default_fastapi_body(rows) -> bytes:
+    """What FastAPI produced before: model_validate per row + response_model + stdlib json."""
+    app = FastAPI()
+
+    @app.get("/rows", response_model=List[NotificationResponse])
+    def rows_route():
+        return [NotificationResponse.model_validate(row) for row in rows]
+
+    with TestClient(app) as client:
+        return client.get("/rows").content
+
+
+def test_dumps_matches_default_fastapi_encoding():
+    rows = [_notification(n) for n in range(5)]
+    rows.append(_notification(5, tz=timezone(timedelta(hours=3))))
+
+    fast = ListSerializer(NotificationResponse).dumps(rows)
+
+    assert fast == _default_fastapi_body(rows)
+    assert b'"2025-01-01T12:00:00Z"' in fast
+    assert b'"2025-01-01T12:00:00+03:00"' in fast
+
+
+def test_validate_accepts_ready_models():
+    serializer = ListSerializer(NotificationResponse)
+    models = [NotificationResponse.model_validate(_notification(n)) for n in range(3)]
+
+    assert serializer.validate(models) == models
+    assert json.loads(serializer.dumps(iter(models))) == jsonable_encoder(models)
+
+
+def test_response_is_json_with_headers():
+    user = SimpleNamespace(
+        id=uuid.uuid4(),
+        full_name="Иван",
+        email="ivan@example.com",
+        role="admin",
+        is_active=True,
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+
+    response = ListSerializer(UserResponse).response([user], headers={"ETag": '"v1"'})
+
+    assert response.media_type == "application/json"
+    assert response.headers["ETag"] == '"v1"'
+    assert json.loads(response.body)[0]["email"] == "ivan@example.com"
+
+
+def test_empty_list():
+    assert ListSerializer(NotificationResponse).dumps([]) == b"[]"
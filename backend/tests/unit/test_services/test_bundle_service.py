@@ -0,0 +1,13 @@
+import pytest
+
+from app.services.bundle_service import _member_stem
+
+
+@pytest.mark.parametrize("part_number, revision_label, expected", [
+    ("БНС-001", "A", "БНС-001_A"),
+    ("КМ/01\\02", "-", "КМ_01_02_-"),
+    ("../../etc/passwd", "A", "_.._etc_passwd_A"),
+    (".hidden", "B", "hidden_B"),
+])
+def test_member_stem_stays_in_archive_root(part_number, revision_label, expected):
+    assert _member_stem(part_number, revision_label) == expected
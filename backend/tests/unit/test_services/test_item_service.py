@@ -1,11 +1,17 @@
 import pytest
 from uuid import uuid4
 
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql
+
+from app.models.document import Document
+from app.models.document_revision import DocumentRevision
+from app.models.progress_history import ProgressHistory
 from app.models.project import Project
 from app.models.project_section import ProjectSection
 from app.models.item import Item, ItemStatus
 from app.schemas.item import ItemCreate, ItemUpdate
-from app.services.item_service import create_item, get_item, update_item
+from app.services.item_service import ItemFilters, create_item, get_item, update_item, get_item_detail, items_query
 
 
 @pytest.fixture
@@ -97,3 +103,73 @@ def test_update_item_not_found(db):
     
     assert result is None
 
+
+
+@pytest.fixture
+def item_with_history(db, item, admin_user):
+    """Item with two documents (one deleted), three revisions and three progress entries."""
+    documents = [Document(item_id=item.id, title="Лист 1"), Document(item_id=item.id, title="Удален", is_deleted=True)]
+    db.add_all(documents)
+    db.flush()
+    for n, label in enumerate(("-", "A", "B")):
+        db.add(DocumentRevision(
+            document_id=documents[0].id, revision_label=label, file_storage_uuid=uuid4(),
+            original_filename=f"ITEM-001_{label}.pdf", mime_type="application/pdf", file_size_bytes=1,
+            sha256_hash="0" * 64, is_current=label == "B", author_id=admin_user.id,
+        ))
+    for old, new in ((0, 10), (10, 20), (20, 30)):
+        db.add(ProgressHistory(item_id=item.id, old_progress=old, new_progress=new, changed_by=admin_user.id))
+    db.commit()
+    db.expunge_all()
+    return item
+
+
+def _count_statements(db):
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_get_item_detail_loads_everything_in_fixed_queries(db, item_with_history):
+    """All parts load in five statements and rendering triggers no lazy loads."""
+    statements = _count_statements(db)
+
+    detail = get_item_detail(db, item_with_history.id, {"documents", "revisions", "progress_history"}, history_limit=2)
+    loaded = len(statements)
+    [document] = detail.documents
+    assert detail.item.section is None and detail.item.responsible is None
+    assert len(detail.item.documents) == 2
+    assert document.current_revision.revision_label == "B"
+    assert len(document.revisions) == 3
+    assert [h.new_progress for h in detail.progress_history] == [30, 20]
+    assert detail.progress_history[0].changed_by_user.email == "admin@test.com"
+
+    assert loaded == 5
+    assert len(statements) == loaded
+
+
+def test_get_item_detail_respects_include(db, item_with_history):
+    """Parts that were not requested are not loaded."""
+    detail = get_item_detail(db, item_with_history.id, {"documents"})
+
+    assert detail.documents[0].revisions == []
+    assert detail.progress_history is None
+
+    assert get_item_detail(db, item_with_history.id, set()).documents is None
+    assert get_item_detail(db, uuid4(), set()) is None
+
+
+def test_items_query_filters_compile_to_indexed_predicates():
+    """Search escapes LIKE wildcards; sort adds id as a tiebreaker."""
+    query = items_query(
+        project_id=uuid4(),
+        filters=ItemFilters(search="50%_A", prefix=True, progress_min=10, has_documents=False, sort="-progress"),
+    )
+    compiled = query.compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+
+    assert "items.part_number ILIKE %(part_number_1)s ESCAPE" in sql
+    assert compiled.params["part_number_1"] == "50\\%\\_A%"
+    assert "items.current_progress >= %(current_progress_1)s" in sql
+    assert "NOT (EXISTS (SELECT" in sql
+    assert sql.endswith("ORDER BY items.current_progress DESC, items.id DESC")
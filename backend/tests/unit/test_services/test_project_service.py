@@ -3,7 +3,17 @@ from uuid import uuid4
 
 from app.models.project import Project, ProjectStatus
 from app.schemas.project import ProjectCreate, ProjectUpdate
-from app.services.project_service import create_project, get_project, update_project
+from app.models.project_section import ProjectSection
+from app.models.item import Item, ItemStatus
+from app.models.document import Document
+from app.models.document_revision import DocumentRevision
+from app.services.project_service import (
+    create_project,
+    get_project,
+    update_project,
+    get_or_create_sections,
+    project_summaries,
+)
 
 
 @pytest.fixture
@@ -72,3 +82,95 @@ def test_update_project_all_fields(db, project):
     assert updated_project.description == "New Description"
     assert updated_project.status == ProjectStatus.archived
 
+
+def test_get_or_create_sections_creates_missing_and_reuses_existing(db, project):
+    """Test bulk section resolution returns one section per distinct code."""
+    existing = ProjectSection(project_id=project.id, code="БНС.КМД")
+    db.add(existing)
+    db.commit()
+    db.refresh(existing)
+
+    sections = get_or_create_sections(db, project.id, ["БНС.КМД", "БНС.ТХ", "БНС.ТХ"])
+    db.commit()
+
+    assert set(sections) == {"БНС.КМД", "БНС.ТХ"}
+    assert sections["БНС.КМД"].id == existing.id
+    assert db.query(ProjectSection).filter(ProjectSection.project_id == project.id).count() == 2
+
+
+def test_get_or_create_sections_duplicate_codes_create_one_row(db, project):
+    """Test repeated codes in one batch insert a single section."""
+    sections = get_or_create_sections(db, project.id, ["БНС.ЭМ", "БНС.ЭМ", "БНС.ЭМ"])
+    db.commit()
+
+    assert list(sections) == ["БНС.ЭМ"]
+    rows = db.query(ProjectSection).filter(ProjectSection.project_id == project.id).all()
+    assert [row.id for row in rows] == [sections["БНС.ЭМ"].id]
+
+    again = get_or_create_sections(db, project.id, ["БНС.ЭМ"])
+    assert again["БНС.ЭМ"].id == sections["БНС.ЭМ"].id
+
+
+def test_get_or_create_sections_empty(db, project):
+    """Test empty code list does not touch the database."""
+    assert get_or_create_sections(db, project.id, []) == {}
+
+
+def test_project_summaries_aggregates_per_project_and_section(db, project, admin_user):
+    """project_summaries groups items by project and by section in one query."""
+    empty_project = Project(name="Empty Project", status=ProjectStatus.active)
+    section = ProjectSection(project_id=project.id, code="БНС.КМД")
+    db.add_all([empty_project, section])
+    db.flush()
+    items = [
+        Item(project_id=project.id, section_id=section.id, part_number="SUM-1", name="A",
+             status=ItemStatus.completed, current_progress=100, docs_completion_percent=100),
+        Item(project_id=project.id, section_id=section.id, part_number="SUM-2", name="B",
+             status=ItemStatus.in_progress, current_progress=50, docs_completion_percent=40),
+        Item(project_id=project.id, part_number="SUM-3", name="C",
+             status=ItemStatus.draft, current_progress=0),
+    ]
+    db.add_all(items)
+    db.flush()
+    document = Document(item_id=items[0].id, title="Чертеж")
+    deleted = Document(item_id=items[1].id, title="Удален", is_deleted=True)
+    db.add_all([document, deleted])
+    db.flush()
+    for label in ("-", "A"):
+        db.add(DocumentRevision(
+            document_id=document.id, revision_label=label, file_storage_uuid=uuid4(),
+            original_filename=f"{label}.pdf", mime_type="application/pdf", file_size_bytes=1,
+            sha256_hash="0" * 64, is_current=label == "A", author_id=admin_user.id,
+        ))
+    db.commit()
+
+    summaries = {s["project_id"]: s for s in project_summaries(db)}
+
+    summary = summaries[project.id]
+    assert summary["items_count"] == 3
+    assert summary["status_counts"] == {"draft": 1, "in_progress": 1, "completed": 1, "cancelled": 0}
+    assert summary["completed_items"] == 1
+    assert summary["average_progress"] == 50.0
+    assert summary["average_docs_completion"] == 46.7
+    assert summary["documents_count"] == 1
+    assert summary["revisions_count"] == 2
+
+    by_code = {s["section_code"]: s for s in summary["sections"]}
+    assert set(by_code) == {"БНС.КМД", None}
+    assert by_code["БНС.КМД"]["items_count"] == 2
+    assert by_code["БНС.КМД"]["average_progress"] == 75.0
+    assert by_code[None]["items_count"] == 1
+
+    assert summaries[empty_project.id]["items_count"] == 0
+    assert summaries[empty_project.id]["average_progress"] is None
+    assert summaries[empty_project.id]["sections"] == []
+
+
+def test_project_summaries_filters_by_id(db, project):
+    """Only the requested projects are summarized."""
+    db.add(Project(name="Other", status=ProjectStatus.active))
+    db.commit()
+
+    summaries = project_summaries(db, [project.id])
+
+    assert [s["project_id"] for s in summaries] == [project.id]
@@ -0,0 +1,133 @@
+"""Unit tests for worksheet diffs."""
+
+import random
+
+import orjson
+import pytest
+from fastapi import HTTPException
+from openpyxl import Workbook
+
+from app.config import settings
+from app.services import tech_diff_service
+from app.services.tech_diff_service import diff_path, diff_snapshots, load_diff
+from app.utils.columnar_snapshot import ColumnarSnapshot, write_snapshot
+from app.utils.sheet_diff import align, diff_sheet, row_hash
+
+
+def _apply(a, b, opcodes):
+    """Rebuild `b` from the opcodes, checking they cover both sides in order."""
+    i = j = 0
+    rebuilt = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        assert (i1, j1) == (i, j)
+        if tag == "equal":
+            assert a[i1:i2] == b[j1:j2]
+        rebuilt.extend(b[j1:j2])
+        i, j = i2, j2
+    assert (i, j) == (len(a), len(b))
+    return rebuilt
+
+
+def test_align_random_edits_cover_both_sequences():
+    generator = random.Random(7)
+    for _ in range(200):
+        a = [generator.randint(0, 8) for _ in range(generator.randint(0, 40))]
+        b = list(a)
+        for _ in range(generator.randint(0, 6)):
+            position = generator.randint(0, len(b))
+            if generator.random() < 0.5 and b:
+                del b[min(position, len(b) - 1)]
+            else:
+                b.insert(position, generator.randint(0, 20))
+        assert _apply(a, b, align(a, b)) == b
+
+
+def test_row_hash_ignores_trailing_empty_cells():
+    assert row_hash(["a", "b", "", ""]) == row_hash(["a", "b"])
+    assert row_hash(["a", "", "b"]) != row_hash(["a", "b"])
+
+
+def test_diff_sheet_changed_added_removed():
+    old = [[f"{n:03d}", "Точить", str(n)] for n in range(1, 2001)]
+    new = [list(row) for row in old]
+    new[9][1] = "Сверлить"
+    del new[500]
+    new.insert(1500, ["999", "Контроль"])
+
+    diff = diff_sheet(old, new, max_changes=10)
+
+    assert (diff["rows_changed"], diff["rows_removed"], diff["rows_added"]) == (1, 1, 1)
+    assert diff["changes"] == [
+        {"type": "changed", "old_row": 10, "new_row": 10, "cells": [{"column": "B", "old": "Точить", "new": "Сверлить"}]},
+        {"type": "removed", "old_row": 501, "cells": ["501", "Точить", "501"]},
+        {"type": "added", "new_row": 1501, "cells": ["999", "Контроль"]},
+    ]
+    assert diff["truncated"] is False
+
+
+def test_diff_sheet_truncates_listed_changes():
+    diff = diff_sheet([], [[str(n)] for n in range(5)], max_changes=2)
+    assert diff["rows_added"] == 5
+    assert len(diff["changes"]) == 2
+    assert diff["truncated"] is True
+
+
+def test_diff_snapshots_sheet_status(tmp_path):
+    write_snapshot(tmp_path / "a", [("Маршрут", [["1", "a"]]), ("Старый", [["x"]])])
+    write_snapshot(tmp_path / "b", [("Маршрут", [["1", "a"]]), ("Новый", [["y"], ["z"]])])
+
+    diff = diff_snapshots(ColumnarSnapshot(tmp_path / "a"), ColumnarSnapshot(tmp_path / "b"))
+
+    assert diff["identical"] is False
+    assert [(sheet["name"], sheet["status"]) for sheet in diff["sheets"]] == [
+        ("Маршрут", "unchanged"), ("Новый", "added"), ("Старый", "removed"),
+    ]
+    assert diff["sheets"][1]["rows_added"] == 2
+
+
+def test_load_diff_is_cached_by_content_pair(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "TECH_FILE_STORAGE_PATH", str(tmp_path))
+    paths = []
+    for name, value in (("a", "Точить"), ("b", "Сверлить")):
+        workbook = Workbook()
+        workbook.active.append(["005", value])
+        paths.append(tmp_path / f"{name}.xlsx")
+        workbook.save(paths[-1])
+
+    body = load_diff(paths[0], "sha-a", paths[1], "sha-b")
+
+    assert diff_path("sha-a", "sha-b").exists()
+    [sheet] = orjson.loads(body)["sheets"]
+    assert sheet["changes"][0]["cells"] == [{"column": "B", "old": "Точить", "new": "Сверлить"}]
+
+    monkeypatch.setattr(tech_diff_service, "diff_snapshots", None)  # would fail if recomputed
+    assert load_diff(paths[0], "sha-a", paths[1], "sha-b") == body
+
+
+def test_load_diff_ignores_shared_snapshots(tmp_path, monkeypatch):
+    from app.services import tech_sheet_service
+
+    monkeypatch.setattr(settings, "TECH_FILE_STORAGE_PATH", str(tmp_path))
+    write_snapshot(tech_sheet_service.snapshot_path("sha-a"), [("Маршрут", [["005", "Точить"]])])
+    write_snapshot(tech_sheet_service.snapshot_path("sha-b"), [("Маршрут", [["005", "Сверлить"]])])
+    # A shared copy emptied by another request must not leak into the cached diff
+    emptied = ColumnarSnapshot(tech_sheet_service.snapshot_path("sha-a"))
+    emptied.sheets = []
+    monkeypatch.setitem(tech_sheet_service._snapshots, "sha-a", emptied)
+    monkeypatch.setitem(tech_sheet_service._snapshots, "sha-b", emptied)
+
+    diff = orjson.loads(load_diff(tmp_path / "a.xlsx", "sha-a", tmp_path / "b.xlsx", "sha-b"))
+
+    assert diff["identical"] is False
+    assert diff["sheets"][0]["rows_changed"] == 1
+
+
+def test_load_diff_releases_lock_on_failure(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "TECH_FILE_STORAGE_PATH", str(tmp_path))
+    (tmp_path / "broken.xlsx").write_bytes(b"not a workbook")
+
+    with pytest.raises(HTTPException):
+        load_diff(tmp_path / "broken.xlsx", "sha-x", tmp_path / "broken.xlsx", "sha-y")
+
+    assert not diff_path("sha-x", "sha-y").exists()
+    assert tech_diff_service._diff_locks == {}
@@ -0,0 +1,98 @@
+"""Unit tests for per-request SQL accounting and query budgets."""
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.middleware.query_budget import QueryBudgetMiddleware
+from app.middleware.request_context import RequestContextMiddleware
+from app.utils.request_context import RequestContext, bind_request_context, reset_request_context
+from app.utils.sql_metrics import fingerprint, instrument_statements, top_fingerprints
+
+
+def test_fingerprint_replaces_literals_and_params():
+    assert fingerprint("SELECT * FROM items WHERE id = %(id_1)s::UUID AND code = 'A-1'") == (
+        "SELECT * FROM items WHERE id = ?::UUID AND code = ?"
+    )
+    assert fingerprint("SELECT 1 FROM t WHERE x = $1 LIMIT 10") == "SELECT ? FROM t WHERE x = ? LIMIT ?"
+
+
+def test_fingerprint_collapses_in_lists_and_whitespace():
+    assert fingerprint("SELECT *\n  FROM t WHERE id IN (%s, %s,  %s)") == "SELECT * FROM t WHERE id IN (?)"
+
+
+def _make_engine():
+    engine = create_engine("sqlite://")
+    instrument_statements(engine)
+    return engine
+
+
+def test_statements_counted_timed_and_grouped():
+    engine = _make_engine()
+    context = RequestContext({"type": "http"})
+    token = bind_request_context(context)
+    try:
+        with engine.connect() as connection:
+            for value in range(3):
+                connection.execute(text(f"SELECT {value}"))
+            connection.execute(text("SELECT 'x'"))
+    finally:
+        reset_request_context(token)
+
+    assert context.db_statements == 4
+    assert context.db_time_ms > 0
+    top = top_fingerprints(context)
+    assert top[0]["sql"] == "SELECT ?"
+    assert top[0]["count"] == 4
+
+
+def test_statements_outside_request_ignored():
+    engine = _make_engine()
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        assert not connection.info.get("query_started_at")
+
+
+def _make_app(engine, expose_headers: bool) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(QueryBudgetMiddleware, statement_budget=2, time_budget_ms=10_000, expose_headers=expose_headers)
+    app.add_middleware(RequestContextMiddleware)
+
+    @app.get("/budget-test/{count}")
+    def run_queries(count: int):
+        with engine.connect() as connection:
+            for value in range(count):
+                connection.execute(text(f"SELECT {value}"))
+        return {"count": count}
+
+    return app
+
+
+def test_debug_headers_exposed():
+    with TestClient(_make_app(_make_engine(), expose_headers=True)) as client:
+        response = client.get("/budget-test/2")
+
+    assert response.headers["X-DB-Statements"] == "2"
+    assert float(response.headers["X-DB-Time-Ms"]) >= 0
+
+
+def test_debug_headers_hidden_by_default():
+    with TestClient(_make_app(_make_engine(), expose_headers=False)) as client:
+        response = client.get("/budget-test/1")
+
+    assert "X-DB-Statements" not in response.headers
+
+
+def test_budget_exceeded_logged_with_fingerprints(caplog):
+    with caplog.at_level(logging.WARNING, logger="app.middleware.query_budget"):
+        with TestClient(_make_app(_make_engine(), expose_headers=False)) as client:
+            client.get("/budget-test/1")
+            assert not caplog.records
+            client.get("/budget-test/5")
+
+    assert len(caplog.records) == 1
+    message = caplog.records[0].getMessage()
+    assert "db.request_budget_exceeded" in message
+    assert "GET /budget-test/{count}" in message
+    assert '"sql": "SELECT ?"' in message
@@ -0,0 +1,54 @@
+"""Unit tests for streamed CSV/XLSX exports."""
+
+import csv
+import io
+from datetime import datetime
+
+from openpyxl import load_workbook
+
+from app.utils.table_export import stream_csv, stream_xlsx
+
+HEADER = ("Обозначение", "Наименование", "Загружена (UTC)")
+
+
+def _rows(count):
+    return ((f"ИЗД-{n:04d}", "Рама; сварная", datetime(2025, 1, 2, 3, 4, 5)) for n in range(count))
+
+
+def test_stream_csv_batches_rows_with_bom_and_semicolons():
+    chunks = list(stream_csv(HEADER, _rows(1200)))
+
+    assert len(chunks) == 3
+    text = b"".join(chunks).decode("utf-8-sig")
+    rows = list(csv.reader(io.StringIO(text), delimiter=";"))
+    assert rows[0] == list(HEADER)
+    assert rows[1] == ["ИЗД-0000", "Рама; сварная", "2025-01-02 03:04:05"]
+    assert len(rows) == 1201
+
+
+def test_stream_xlsx_writes_header_and_typed_cells():
+    body = b"".join(stream_xlsx("Реестр", HEADER, _rows(3), chunk_size=1024))
+
+    workbook = load_workbook(io.BytesIO(body))
+    sheet = workbook["Реестр"]
+    assert sheet.freeze_panes == "A2"
+    assert sheet["A1"].font.bold
+    assert [cell.value for cell in sheet[2]] == ["ИЗД-0000", "Рама; сварная", datetime(2025, 1, 2, 3, 4, 5)]
+    assert sheet.max_row == 4
+
+
+def test_stream_csv_neutralises_formulas():
+    rows = [("=1+2", "+7", "-"), ("@SUM(A1)", "-3", "Рама")]
+
+    text = b"".join(stream_csv(HEADER, rows)).decode("utf-8-sig")
+
+    parsed = list(csv.reader(io.StringIO(text), delimiter=";"))
+    assert parsed[1:] == [["'=1+2", "'+7", "-"], ["'@SUM(A1)", "'-3", "Рама"]]
+
+
+def test_stream_xlsx_writes_formula_like_text_as_strings():
+    body = b"".join(stream_xlsx("Реестр", HEADER, [("=1+2", "=HYPERLINK(\"http://x\")", 5)]))
+
+    sheet = load_workbook(io.BytesIO(body))["Реестр"]
+    assert [cell.value for cell in sheet[2]] == ["=1+2", "=HYPERLINK(\"http://x\")", 5]
+    assert [cell.data_type for cell in sheet[2]] == ["s", "s", "n"]
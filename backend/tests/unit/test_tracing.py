@@ -0,0 +1,136 @@
+"""Unit tests for request tracing spans and exporters."""
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.request_context import RequestContextMiddleware
+from app.middleware.tracing import TracingMiddleware
+from app.utils.tracing import (
+    STATUS_ERROR,
+    FileSpanExporter,
+    InMemorySpanExporter,
+    configure_tracing,
+    parse_traceparent,
+    start_span,
+    traced,
+)
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    configure_tracing(exporter)
+    yield exporter
+    configure_tracing(None)
+
+
+@traced()
+def sync_step():
+    return "sync"
+
+
+@traced("custom.async_step")
+async def async_step():
+    with start_span("inner"):
+        return "async"
+
+
+def test_disabled_tracing_yields_none():
+    with start_span("noop") as span:
+        assert span is None
+    assert sync_step() == "sync"
+
+
+def test_nested_spans_share_trace(exporter):
+    with start_span("root", attributes={"request.id": "req-1"}) as root:
+        assert sync_step() == "sync"
+        assert asyncio.run(async_step()) == "async"
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    assert set(spans) == {"root", "test_tracing.sync_step", "custom.async_step", "inner"}
+    assert spans["test_tracing.sync_step"].parent_span_id == root.span_id
+    assert spans["inner"].parent_span_id == spans["custom.async_step"].span_id
+    assert {span.trace_id for span in spans.values()} == {root.trace_id}
+    assert all(span.attributes["request.id"] == "req-1" for span in spans.values())
+
+
+def test_exception_marks_span_error(exporter):
+    with pytest.raises(ValueError):
+        with start_span("failing"):
+            raise ValueError("boom")
+
+    span = exporter.get_finished_spans()[0]
+    assert span.status == STATUS_ERROR
+    assert span.attributes["exception.type"] == "ValueError"
+    assert span.end_ns >= span.start_ns
+
+
+def test_file_exporter_writes_json_lines(tmp_path):
+    path = tmp_path / "traces" / "spans.jsonl"
+    configure_tracing(FileSpanExporter(str(path)))
+    try:
+        with start_span("first"):
+            pass
+        with start_span("second"):
+            pass
+    finally:
+        configure_tracing(None)
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [record["name"] for record in records] == ["first", "second"]
+    assert len(records[0]["traceId"]) == 32
+    assert len(records[0]["spanId"]) == 16
+
+
+def test_parse_traceparent():
+    header = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+    assert parse_traceparent(header) == ("4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7")
+    assert parse_traceparent("garbage") is None
+    assert parse_traceparent(None) is None
+
+
+def _make_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware)
+    app.add_middleware(RequestContextMiddleware)
+
+    @app.get("/trace-test/{thing_id}")
+    def read_thing(thing_id: int):
+        return {"value": sync_step()}
+
+    return app
+
+
+def test_request_spans_carry_request_id(exporter):
+    with TestClient(_make_app()) as client:
+        response = client.get("/trace-test/1", headers={"X-Request-ID": "upload-42"})
+
+    assert response.headers["X-Request-ID"] == "upload-42"
+    spans = exporter.get_finished_spans(request_id="upload-42")
+    names = {span.name for span in spans}
+    assert names == {"GET /trace-test/{thing_id}", "test_tracing.sync_step"}
+    root = next(span for span in spans if span.name.startswith("GET"))
+    assert root.attributes["http.response.status_code"] == 200
+    assert root.attributes["http.route"] == "GET /trace-test/{thing_id}"
+
+
+def test_request_id_generated_when_missing_or_invalid():
+    with TestClient(_make_app()) as client:
+        generated = client.get("/trace-test/1").headers["X-Request-ID"]
+        replaced = client.get("/trace-test/1", headers={"X-Request-ID": "bad id\twith spaces"}).headers["X-Request-ID"]
+
+    assert len(generated) == 32
+    assert replaced != "bad id\twith spaces"
+
+
+def test_incoming_traceparent_joins_trace(exporter):
+    header = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+    with TestClient(_make_app()) as client:
+        client.get("/trace-test/1", headers={"traceparent": header})
+
+    root = next(span for span in exporter.get_finished_spans() if span.name.startswith("GET"))
+    assert root.trace_id == "4bf92f3577b34da6a3ce929d0e0e4736"
+    assert root.parent_span_id == "00f067aa0ba902b7"
@@ -0,0 +1,30 @@
+"""Unit tests for streamed ZIP archives."""
+
+import io
+import zipfile
+
+from app.utils.zip_stream import stream_zip
+
+
+def test_stream_zip_stores_members_in_bounded_chunks(tmp_path):
+    big = tmp_path / "big.pdf"
+    big.write_bytes(b"%PDF-1.4 " + bytes(range(256)) * 4000)
+    small = tmp_path / "small.pdf"
+    small.write_bytes(b"%PDF-1.4 small")
+
+    chunks = list(stream_zip([("ИЗД-001_A.pdf", big), ("ИЗД-002_-.pdf", small), ("_missing.txt", b"x\n")], chunk_size=4096))
+
+    assert max(len(chunk) for chunk in chunks) < 4096 + 1024
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+    assert archive.testzip() is None
+    assert [(info.filename, info.compress_type) for info in archive.infolist()] == [
+        ("ИЗД-001_A.pdf", zipfile.ZIP_STORED),
+        ("ИЗД-002_-.pdf", zipfile.ZIP_STORED),
+        ("_missing.txt", zipfile.ZIP_STORED),
+    ]
+    assert archive.read("ИЗД-001_A.pdf") == big.read_bytes()
+
+
+def test_stream_zip_empty_archive():
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(stream_zip([]))))
+    assert archive.namelist() == []